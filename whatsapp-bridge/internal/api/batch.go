@@ -0,0 +1,149 @@
+package api
+
+import (
+	"bytes"
+	"encoding/json"
+	"fmt"
+	"net/http"
+	"net/http/httptest"
+)
+
+// maxBatchCalls bounds how much work a single /api/batch request can trigger.
+const maxBatchCalls = 20
+
+// BatchCall is one step of a /api/batch request.
+//
+// When InputFrom points at an earlier call, the value of ArgFromField in that
+// call's response is copied into Args[IntoArg] before this call runs.
+type BatchCall struct {
+	Method       string                 `json:"method"`
+	Args         map[string]interface{} `json:"args"`
+	InputFrom    *int                   `json:"input_from,omitempty"`
+	ArgFromField string                 `json:"arg_from_field,omitempty"`
+	IntoArg      string                 `json:"into_arg,omitempty"`
+}
+
+// batchRoute maps a batch method name onto an existing handler.
+type batchRoute struct {
+	httpMethod string
+	path       string
+	handler    http.HandlerFunc
+}
+
+func (s *Server) batchRoutes() map[string]batchRoute {
+	return map[string]batchRoute{
+		"send_message":   {http.MethodPost, "/api/send", s.handleSendMessage},
+		"send_reaction":  {http.MethodPost, "/api/reaction", s.handleReaction},
+		"edit_message":   {http.MethodPost, "/api/edit", s.handleEditMessage},
+		"delete_message": {http.MethodPost, "/api/delete", s.handleDeleteMessage},
+		"mark_read":      {http.MethodPost, "/api/read", s.handleMarkRead},
+		"get_group_info": {http.MethodGet, "/api/group/", s.handleGetGroupInfo},
+	}
+}
+
+// handleBatch handles POST /api/batch for running a chain of calls in one round trip.
+//
+// Request body: array of { method, args, input_from?, arg_from_field?, into_arg? }.
+// input_from must reference an earlier call; calls run in order, and a call
+// whose dependency failed is skipped. Each call still goes through the same
+// handler (and anti-ban send limiter) as its standalone endpoint.
+//
+// Response: { success: bool, results: [ per-call response objects ] }
+func (s *Server) handleBatch(w http.ResponseWriter, r *http.Request) {
+	if r.Method != http.MethodPost {
+		SendJSONError(w, "Method not allowed", http.StatusMethodNotAllowed)
+		return
+	}
+
+	var calls []BatchCall
+	if err := json.NewDecoder(r.Body).Decode(&calls); err != nil {
+		SendJSONError(w, "Invalid request format", http.StatusBadRequest)
+		return
+	}
+	if len(calls) == 0 || len(calls) > maxBatchCalls {
+		SendJSONError(w, fmt.Sprintf("batch must contain 1-%d calls", maxBatchCalls), http.StatusBadRequest)
+		return
+	}
+	for i, call := range calls {
+		if call.InputFrom != nil && *call.InputFrom >= 0 && (*call.InputFrom >= i || call.IntoArg == "") {
+			SendJSONError(w, fmt.Sprintf("call %d: input_from must reference an earlier call and set into_arg", i), http.StatusBadRequest)
+			return
+		}
+	}
+
+	routes := s.batchRoutes()
+	results := make([]map[string]interface{}, len(calls))
+	allOK := true
+
+	for i, call := range calls {
+		results[i] = s.runBatchCall(r, routes, call, results)
+		if ok, _ := results[i]["success"].(bool); !ok {
+			allOK = false
+		}
+	}
+
+	w.Header().Set("Content-Type", "application/json")
+	_ = json.NewEncoder(w).Encode(map[string]interface{}{
+		"success": allOK,
+		"results": results,
+	})
+}
+
+// runBatchCall resolves a call's dependency and replays it through its handler.
+// The replayed request carries the batch request's context, so a client that
+// disconnects cancels the remaining calls' work too.
+func (s *Server) runBatchCall(r *http.Request, routes map[string]batchRoute, call BatchCall, results []map[string]interface{}) map[string]interface{} {
+	route, ok := routes[call.Method]
+	if !ok {
+		return map[string]interface{}{"success": false, "error": fmt.Sprintf("unsupported method %q", call.Method)}
+	}
+
+	args := make(map[string]interface{}, len(call.Args)+1)
+	for k, v := range call.Args {
+		args[k] = v
+	}
+
+	if call.InputFrom != nil && *call.InputFrom >= 0 {
+		dep := results[*call.InputFrom]
+		if ok, _ := dep["success"].(bool); !ok {
+			return map[string]interface{}{"success": false, "error": fmt.Sprintf("skipped: call %d failed", *call.InputFrom)}
+		}
+		value, found := batchField(dep, call.ArgFromField)
+		if !found {
+			return map[string]interface{}{"success": false, "error": fmt.Sprintf("call %d has no field %q", *call.InputFrom, call.ArgFromField)}
+		}
+		args[call.IntoArg] = value
+	}
+
+	path := route.path
+	var body bytes.Buffer
+	if route.httpMethod == http.MethodGet {
+		jid, _ := args["group_jid"].(string)
+		path += jid
+	} else if err := json.NewEncoder(&body).Encode(args); err != nil {
+		return map[string]interface{}{"success": false, "error": "invalid args"}
+	}
+
+	req := httptest.NewRequest(route.httpMethod, path, &body).WithContext(r.Context())
+	req.Header.Set("Content-Type", "application/json")
+	rec := httptest.NewRecorder()
+	route.handler(rec, req)
+
+	var result map[string]interface{}
+	if err := json.Unmarshal(rec.Body.Bytes(), &result); err != nil {
+		return map[string]interface{}{"success": false, "error": "invalid handler response"}
+	}
+	return result
+}
+
+// batchField looks up a field on a call result, falling back to its "data" object.
+func batchField(result map[string]interface{}, field string) (interface{}, bool) {
+	if v, ok := result[field]; ok {
+		return v, true
+	}
+	if data, ok := result["data"].(map[string]interface{}); ok {
+		v, ok := data[field]
+		return v, ok
+	}
+	return nil, false
+}
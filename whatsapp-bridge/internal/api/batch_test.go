@@ -0,0 +1,72 @@
+package api
+
+import (
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"testing"
+)
+
+// TestBatchValidation verifies malformed batches are rejected before any call runs.
+func TestBatchValidation(t *testing.T) {
+	tests := []struct {
+		name string
+		body string
+	}{
+		{name: "empty batch", body: `[]`},
+		{name: "forward dependency", body: `[{"method":"send_reaction","args":{},"input_from":1,"into_arg":"message_id"}]`},
+		{name: "dependency without into_arg", body: `[{"method":"send_message","args":{}},{"method":"send_reaction","args":{},"input_from":0}]`},
+	}
+
+	s := &Server{}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			rec := httptest.NewRecorder()
+			s.handleBatch(rec, httptest.NewRequest(http.MethodPost, "/api/batch", strings.NewReader(tt.body)))
+			if rec.Code != http.StatusBadRequest {
+				t.Errorf("status = %d, want %d", rec.Code, http.StatusBadRequest)
+			}
+		})
+	}
+}
+
+// TestBatchSkipsDependentsOfFailedCalls verifies a failed call short-circuits the calls that consume it.
+func TestBatchSkipsDependentsOfFailedCalls(t *testing.T) {
+	body := `[{"method":"unknown","args":{}},{"method":"send_reaction","args":{"emoji":"👍"},"input_from":0,"arg_from_field":"message_id","into_arg":"message_id"}]`
+
+	rec := httptest.NewRecorder()
+	(&Server{}).handleBatch(rec, httptest.NewRequest(http.MethodPost, "/api/batch", strings.NewReader(body)))
+
+	var resp struct {
+		Success bool                     `json:"success"`
+		Results []map[string]interface{} `json:"results"`
+	}
+	if err := json.Unmarshal(rec.Body.Bytes(), &resp); err != nil {
+		t.Fatalf("invalid response: %v", err)
+	}
+	if resp.Success || len(resp.Results) != 2 {
+		t.Fatalf("got success=%v with %d results, want failure with 2", resp.Success, len(resp.Results))
+	}
+	if errMsg, _ := resp.Results[1]["error"].(string); !strings.HasPrefix(errMsg, "skipped") {
+		t.Errorf("dependent call error = %q, want skipped", errMsg)
+	}
+}
+
+// TestBatchFieldFallsBackToData verifies dependency values are read from the result or its "data" object.
+func TestBatchFieldFallsBackToData(t *testing.T) {
+	result := map[string]interface{}{
+		"message_id": "top",
+		"data":       map[string]interface{}{"message_id": "nested", "jid": "123@g.us"},
+	}
+
+	if v, ok := batchField(result, "message_id"); !ok || v != "top" {
+		t.Errorf("message_id = %v, %v; want top-level value", v, ok)
+	}
+	if v, ok := batchField(result, "jid"); !ok || v != "123@g.us" {
+		t.Errorf("jid = %v, %v; want data value", v, ok)
+	}
+	if _, ok := batchField(result, "missing"); ok {
+		t.Error("missing field reported as found")
+	}
+}
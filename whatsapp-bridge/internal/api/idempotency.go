@@ -0,0 +1,122 @@
+package api
+
+import (
+	"net/http"
+	"net/http/httptest"
+	"sync"
+	"time"
+)
+
+// idempotencyTTL is how long a completed response is replayed for a repeated key.
+const idempotencyTTL = 10 * time.Minute
+
+// idempotentEntry holds the recorded response for one X-Idempotency-Key.
+// done is closed once the first request carrying the key has finished.
+type idempotentEntry struct {
+	done    chan struct{}
+	status  int
+	header  http.Header
+	body    []byte
+	expires time.Time
+}
+
+// idempotentExpiry queues a completed key for removal. Every entry gets the
+// same TTL on completion, so the queue is already ordered by expiry.
+type idempotentExpiry struct {
+	key   string
+	entry *idempotentEntry
+}
+
+// Idempotency state
+var (
+	idempotencyMu      sync.Mutex
+	idempotencyEntries = make(map[string]*idempotentEntry)
+	idempotencyExpiry  []idempotentExpiry
+)
+
+// expireIdempotencyEntries drops completed entries whose TTL has passed.
+// Only the expired head of the queue is visited. Callers must hold idempotencyMu.
+func expireIdempotencyEntries(now time.Time) {
+	n := 0
+	for n < len(idempotencyExpiry) && now.After(idempotencyExpiry[n].entry.expires) {
+		item := idempotencyExpiry[n]
+		// The key may have been dropped (5xx) and reused since it was queued
+		if idempotencyEntries[item.key] == item.entry {
+			delete(idempotencyEntries, item.key)
+		}
+		idempotencyExpiry[n] = idempotentExpiry{}
+		n++
+	}
+	idempotencyExpiry = idempotencyExpiry[n:]
+}
+
+// recordIdempotent runs next for the first request carrying key and stores its
+// response in entry. If next panics, the key is released and waiters get a 500,
+// so a retry runs again instead of blocking on done forever.
+func recordIdempotent(key string, entry *idempotentEntry, next http.HandlerFunc, r *http.Request) {
+	completed := false
+	defer func() {
+		if !completed {
+			idempotencyMu.Lock()
+			entry.status = http.StatusInternalServerError
+			delete(idempotencyEntries, key)
+			idempotencyMu.Unlock()
+		}
+		close(entry.done)
+	}()
+
+	rec := httptest.NewRecorder()
+	next(rec, r)
+
+	idempotencyMu.Lock()
+	entry.status = rec.Code
+	entry.header = rec.Header().Clone()
+	entry.body = rec.Body.Bytes()
+	entry.expires = time.Now().Add(idempotencyTTL)
+	if rec.Code >= http.StatusInternalServerError {
+		delete(idempotencyEntries, key)
+	} else {
+		idempotencyExpiry = append(idempotencyExpiry, idempotentExpiry{key: key, entry: entry})
+	}
+	idempotencyMu.Unlock()
+	completed = true
+}
+
+// IdempotencyMiddleware replays the recorded response when a POST repeats an
+// X-Idempotency-Key, so client retries of writes (send, edit, delete) never
+// execute twice. Concurrent duplicates wait for the first request to finish.
+// Server errors (5xx) are not remembered, so a retry after one runs again.
+func IdempotencyMiddleware(next http.HandlerFunc) http.HandlerFunc {
+	return func(w http.ResponseWriter, r *http.Request) {
+		key := r.Header.Get("X-Idempotency-Key")
+		if key == "" || r.Method != http.MethodPost {
+			next(w, r)
+			return
+		}
+
+		idempotencyMu.Lock()
+		expireIdempotencyEntries(time.Now())
+		entry, seen := idempotencyEntries[key]
+		if !seen {
+			entry = &idempotentEntry{done: make(chan struct{})}
+			idempotencyEntries[key] = entry
+		}
+		idempotencyMu.Unlock()
+
+		if !seen {
+			recordIdempotent(key, entry, next, r)
+		} else {
+			<-entry.done
+		}
+
+		idempotencyMu.Lock()
+		status, header, body := entry.status, entry.header, entry.body
+		idempotencyMu.Unlock()
+
+		for k, v := range header {
+			w.Header()[k] = v
+		}
+		w.WriteHeader(status)
+		_, _ = w.Write(body)
+	}
+}
@@ -0,0 +1,128 @@
+package api
+
+import (
+	"net/http"
+	"net/http/httptest"
+	"testing"
+	"time"
+)
+
+// resetIdempotencyState clears recorded keys so each test (and each -count run) starts empty.
+func resetIdempotencyState() {
+	idempotencyMu.Lock()
+	defer idempotencyMu.Unlock()
+	idempotencyEntries = make(map[string]*idempotentEntry)
+	idempotencyExpiry = nil
+}
+
+// TestIdempotencyMiddlewareReplaysRepeatedKey verifies a retried POST is answered without re-running the handler.
+func TestIdempotencyMiddlewareReplaysRepeatedKey(t *testing.T) {
+	resetIdempotencyState()
+	calls := 0
+	handler := IdempotencyMiddleware(func(w http.ResponseWriter, r *http.Request) {
+		calls++
+		w.Header().Set("Content-Type", "application/json")
+		_, _ = w.Write([]byte(`{"success":true}`))
+	})
+
+	for i := 0; i < 2; i++ {
+		req := httptest.NewRequest(http.MethodPost, "/api/send", nil)
+		req.Header.Set("X-Idempotency-Key", "test-replay-key")
+		rec := httptest.NewRecorder()
+		handler(rec, req)
+
+		if rec.Code != http.StatusOK || rec.Body.String() != `{"success":true}` {
+			t.Fatalf("attempt %d: got %d %q", i, rec.Code, rec.Body.String())
+		}
+		if got := rec.Header().Get("Content-Type"); got != "application/json" {
+			t.Errorf("attempt %d: Content-Type = %q", i, got)
+		}
+	}
+
+	if calls != 1 {
+		t.Errorf("handler ran %d times, want 1", calls)
+	}
+}
+
+// TestIdempotencyMiddlewareRetriesServerErrors verifies 5xx responses are not replayed.
+func TestIdempotencyMiddlewareRetriesServerErrors(t *testing.T) {
+	resetIdempotencyState()
+	calls := 0
+	handler := IdempotencyMiddleware(func(w http.ResponseWriter, r *http.Request) {
+		calls++
+		w.WriteHeader(http.StatusServiceUnavailable)
+	})
+
+	for i := 0; i < 2; i++ {
+		req := httptest.NewRequest(http.MethodPost, "/api/send", nil)
+		req.Header.Set("X-Idempotency-Key", "test-5xx-key")
+		handler(httptest.NewRecorder(), req)
+	}
+
+	if calls != 2 {
+		t.Errorf("handler ran %d times, want 2", calls)
+	}
+}
+
+// TestIdempotencyMiddlewareReleasesKeyOnPanic verifies a panicking handler does not leave the key blocked.
+func TestIdempotencyMiddlewareReleasesKeyOnPanic(t *testing.T) {
+	resetIdempotencyState()
+	calls := 0
+	handler := IdempotencyMiddleware(func(w http.ResponseWriter, r *http.Request) {
+		calls++
+		if calls == 1 {
+			panic("boom")
+		}
+		_, _ = w.Write([]byte(`{"success":true}`))
+	})
+
+	send := func() *httptest.ResponseRecorder {
+		req := httptest.NewRequest(http.MethodPost, "/api/send", nil)
+		req.Header.Set("X-Idempotency-Key", "test-panic-key")
+		rec := httptest.NewRecorder()
+		handler(rec, req)
+		return rec
+	}
+
+	func() {
+		defer func() { _ = recover() }()
+		send()
+	}()
+
+	done := make(chan *httptest.ResponseRecorder, 1)
+	go func() { done <- send() }()
+	select {
+	case rec := <-done:
+		if rec.Code != http.StatusOK || calls != 2 {
+			t.Fatalf("retry after panic: got %d with %d calls", rec.Code, calls)
+		}
+	case <-time.After(2 * time.Second):
+		t.Fatal("retry after panic blocked")
+	}
+}
+
+// TestExpireIdempotencyEntriesDropsOnlyExpiredHead verifies the expiry queue releases stale keys.
+func TestExpireIdempotencyEntriesDropsOnlyExpiredHead(t *testing.T) {
+	resetIdempotencyState()
+	idempotencyMu.Lock()
+	defer idempotencyMu.Unlock()
+
+	now := time.Now()
+	old := &idempotentEntry{done: make(chan struct{}), expires: now.Add(-time.Second)}
+	fresh := &idempotentEntry{done: make(chan struct{}), expires: now.Add(time.Minute)}
+	idempotencyEntries["test-old-key"] = old
+	idempotencyEntries["test-fresh-key"] = fresh
+	idempotencyExpiry = append(idempotencyExpiry,
+		idempotentExpiry{key: "test-old-key", entry: old},
+		idempotentExpiry{key: "test-fresh-key", entry: fresh},
+	)
+
+	expireIdempotencyEntries(now)
+
+	if _, ok := idempotencyEntries["test-old-key"]; ok {
+		t.Error("expired key was kept")
+	}
+	if _, ok := idempotencyEntries["test-fresh-key"]; !ok {
+		t.Error("unexpired key was dropped")
+	}
+}
@@ -1,6 +1,7 @@
 package api
 
 import (
+	"compress/gzip"
 	"crypto/subtle"
 	"net/http"
 	"os"
@@ -117,7 +118,7 @@ func CorsMiddleware(next http.HandlerFunc) http.HandlerFunc {
 		// If origin not allowed, don't set Access-Control-Allow-Origin (browser blocks)
 
 		w.Header().Set("Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS")
-		w.Header().Set("Access-Control-Allow-Headers", "Content-Type, Authorization, X-API-Key")
+		w.Header().Set("Access-Control-Allow-Headers", "Content-Type, Content-Encoding, Authorization, X-API-Key, X-Idempotency-Key")
 		w.Header().Set("Access-Control-Max-Age", "86400")
 
 		// Handle preflight requests
@@ -130,6 +131,34 @@ func CorsMiddleware(next http.HandlerFunc) http.HandlerFunc {
 	}
 }
 
+// maxDecompressedBody caps a gzip request body once inflated, so a small
+// compressed payload cannot expand without bound.
+const maxDecompressedBody = 10 << 20
+
+// GzipRequestMiddleware transparently inflates request bodies sent with
+// Content-Encoding: gzip (large mark_read, create_group and poll payloads).
+func GzipRequestMiddleware(next http.HandlerFunc) http.HandlerFunc {
+	return func(w http.ResponseWriter, r *http.Request) {
+		if !strings.EqualFold(r.Header.Get("Content-Encoding"), "gzip") {
+			next(w, r)
+			return
+		}
+
+		gz, err := gzip.NewReader(r.Body)
+		if err != nil {
+			http.Error(w, "Invalid gzip body", http.StatusBadRequest)
+			return
+		}
+		defer gz.Close()
+
+		r.Body = http.MaxBytesReader(w, gz, maxDecompressedBody)
+		r.Header.Del("Content-Encoding")
+		r.Header.Del("Content-Length")
+		r.ContentLength = -1
+		next(w, r)
+	}
+}
+
 // SecurityHeadersMiddleware adds security headers to all responses
 func SecurityHeadersMiddleware(next http.HandlerFunc) http.HandlerFunc {
 	return func(w http.ResponseWriter, r *http.Request) {
@@ -150,7 +179,7 @@ func SecurityHeadersMiddleware(next http.HandlerFunc) http.HandlerFunc {
 	}
 }
 
-// SecureMiddleware chains security headers, auth, rate limiting, and CORS middleware
+// SecureMiddleware chains security headers, auth, rate limiting, CORS, gzip decoding, and idempotency middleware
 func SecureMiddleware(next http.HandlerFunc) http.HandlerFunc {
-	return SecurityHeadersMiddleware(CorsMiddleware(RateLimitMiddleware(AuthMiddleware(next))))
+	return SecurityHeadersMiddleware(CorsMiddleware(RateLimitMiddleware(AuthMiddleware(GzipRequestMiddleware(IdempotencyMiddleware(next))))))
 }
@@ -0,0 +1,50 @@
+package api
+
+import (
+	"bytes"
+	"compress/gzip"
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"testing"
+)
+
+// TestGzipRequestMiddlewareInflatesBody verifies handlers see the decompressed JSON body.
+func TestGzipRequestMiddlewareInflatesBody(t *testing.T) {
+	want := `{"chat_jid":"123@s.whatsapp.net","message_ids":["a","b"]}`
+
+	var buf bytes.Buffer
+	gz := gzip.NewWriter(&buf)
+	_, _ = gz.Write([]byte(want))
+	_ = gz.Close()
+
+	var got string
+	handler := GzipRequestMiddleware(func(w http.ResponseWriter, r *http.Request) {
+		body, _ := io.ReadAll(r.Body)
+		got = string(body)
+	})
+
+	req := httptest.NewRequest(http.MethodPost, "/api/read", &buf)
+	req.Header.Set("Content-Encoding", "gzip")
+	handler(httptest.NewRecorder(), req)
+
+	if got != want {
+		t.Errorf("body = %q, want %q", got, want)
+	}
+}
+
+// TestGzipRequestMiddlewareRejectsInvalidGzip verifies a corrupt gzip body is a 400.
+func TestGzipRequestMiddlewareRejectsInvalidGzip(t *testing.T) {
+	handler := GzipRequestMiddleware(func(w http.ResponseWriter, r *http.Request) {
+		t.Fatal("handler should not run")
+	})
+
+	req := httptest.NewRequest(http.MethodPost, "/api/read", bytes.NewReader([]byte("not gzip")))
+	req.Header.Set("Content-Encoding", "gzip")
+	rec := httptest.NewRecorder()
+	handler(rec, req)
+
+	if rec.Code != http.StatusBadRequest {
+		t.Errorf("status = %d, want %d", rec.Code, http.StatusBadRequest)
+	}
+}
@@ -41,8 +41,15 @@ func (s *Server) Start() {
 	serverAddr := fmt.Sprintf("%s:%d", s.bindHost, s.port)
 	fmt.Printf("Starting REST API server on %s...\n", serverAddr)
 
+	// Serve HTTP/1.1 plus cleartext HTTP/2 (h2c) so clients can multiplex
+	// concurrent calls over one connection.
+	protocols := new(http.Protocols)
+	protocols.SetHTTP1(true)
+	protocols.SetUnencryptedHTTP2(true)
+	srv := &http.Server{Addr: serverAddr, Protocols: protocols}
+
 	go func() {
-		if err := http.ListenAndServe(serverAddr, nil); err != nil {
+		if err := srv.ListenAndServe(); err != nil {
 			fmt.Printf("REST API server error: %v\n", err)
 		}
 	}()
@@ -71,6 +78,7 @@ func (s *Server) registerHandlers() {
 	http.HandleFunc("/api/delete", SecureMiddleware(s.handleDeleteMessage))
 	http.HandleFunc("/api/group/", SecureMiddleware(s.handleGetGroupInfo))
 	http.HandleFunc("/api/read", SecureMiddleware(s.handleMarkRead))
+	http.HandleFunc("/api/batch", SecureMiddleware(s.handleBatch))
 
 	// Phase 2: Group Management
 	http.HandleFunc("/api/group/create", SecureMiddleware(s.handleCreateGroup))
@@ -71,3 +71,58 @@ func TestStoreChatEmptyNameDoesNotEraseExistingName(t *testing.T) {
 		t.Fatalf("name = %q, want existing name", name)
 	}
 }
+
+func TestChatDayCountsSurviveReplacedMessages(t *testing.T) {
+	t.Setenv("CHAT_DAY_COUNTS", "true")
+	store := newTestMessageStore(t)
+	day := time.Date(2026, 5, 15, 10, 0, 0, 0, time.UTC)
+	chat := "123@s.whatsapp.net"
+
+	if err := store.StoreChat(chat, "Alice", day); err != nil {
+		t.Fatalf("store chat: %v", err)
+	}
+	for _, m := range []struct {
+		id string
+		ts time.Time
+	}{
+		{"m1", day},
+		{"m2", day.Add(time.Hour)},
+		{"m1", day},                      // re-delivered: replaces, must not double count
+		{"m2", day.Add(-24 * time.Hour)}, // replaced with an earlier day: moves buckets
+	} {
+		if err := store.StoreMessage(m.id, chat, chat, "Alice", "hi", m.ts, false, "", "", "", "", nil, nil, nil, 0); err != nil {
+			t.Fatalf("store message %s: %v", m.id, err)
+		}
+	}
+
+	counts := map[string]int{}
+	rows, err := store.db.Query("SELECT day, count FROM chat_day_counts WHERE chat_jid = ?", chat)
+	if err != nil {
+		t.Fatalf("read counts: %v", err)
+	}
+	defer rows.Close()
+	for rows.Next() {
+		var d string
+		var n int
+		if err := rows.Scan(&d, &n); err != nil {
+			t.Fatalf("scan: %v", err)
+		}
+		counts[d] = n
+	}
+
+	if counts["2026-05-15"] != 1 || counts["2026-05-14"] != 1 {
+		t.Fatalf("counts = %v, want one message on each of 2026-05-14 and 2026-05-15", counts)
+	}
+}
+
+func TestChatDayCountsAreOptIn(t *testing.T) {
+	store := newTestMessageStore(t)
+
+	var n int
+	if err := store.db.QueryRow(`SELECT COUNT(*) FROM sqlite_master WHERE name LIKE 'chat_day_counts%'`).Scan(&n); err != nil {
+		t.Fatalf("read schema: %v", err)
+	}
+	if n != 0 {
+		t.Fatalf("found %d chat_day_counts objects without CHAT_DAY_COUNTS=true", n)
+	}
+}
@@ -106,9 +106,103 @@ func runMigrations(db *sql.DB) error {
 			fmt.Printf("Warning: migration error (%s column): %v\n", m.name, err)
 		}
 	}
+
+	// Earlier builds created an equivalent idx_messages_chat_ts alongside
+	// 001's idx_messages_chat_timestamp; keep only the latter.
+	if _, err := db.Exec(`DROP INDEX IF EXISTS idx_messages_chat_ts`); err != nil {
+		fmt.Printf("Warning: migration error (idx_messages_chat_ts): %v\n", err)
+	}
+
+	// The only reader of chat_day_counts is lib.database.get_chat_statistics_batch
+	// in the MCP server, which none of its entrypoints call yet, so the per-insert
+	// triggers are opt-in.
+	if os.Getenv("CHAT_DAY_COUNTS") == "true" {
+		if err := ensureChatDayCounts(db); err != nil {
+			return fmt.Errorf("chat_day_counts: %v", err)
+		}
+	} else if err := dropChatDayCounts(db); err != nil {
+		return fmt.Errorf("chat_day_counts: %v", err)
+	}
 	return nil
 }
 
+// dropChatDayCounts removes the buckets and their triggers. Once the triggers
+// are gone the table would go stale, and readers use it whenever it exists, so
+// it is dropped with them; enabling CHAT_DAY_COUNTS again backfills it.
+func dropChatDayCounts(db *sql.DB) error {
+	_, err := db.Exec(`
+		DROP TRIGGER IF EXISTS chat_day_counts_before_insert;
+		DROP TRIGGER IF EXISTS chat_day_counts_after_insert;
+		DROP TABLE IF EXISTS chat_day_counts;
+	`)
+	return err
+}
+
+// ensureChatDayCounts maintains per-chat, per-day message counts so the MCP
+// server's chat statistics read a handful of buckets instead of scanning
+// messages. The table is backfilled from messages the first time it is created;
+// after that the triggers keep it current.
+//
+// Messages are only ever written with INSERT OR REPLACE and never deleted, so
+// the BEFORE INSERT trigger takes back the bucket of the row a REPLACE is about
+// to overwrite (REPLACE's implicit delete does not fire DELETE triggers).
+func ensureChatDayCounts(db *sql.DB) error {
+	var exists int
+	if err := db.QueryRow(`SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'chat_day_counts'`).Scan(&exists); err != nil {
+		return err
+	}
+
+	tx, err := db.Begin()
+	if err != nil {
+		return err
+	}
+	defer tx.Rollback()
+
+	if _, err := tx.Exec(`
+		CREATE TABLE IF NOT EXISTS chat_day_counts (
+			chat_jid TEXT NOT NULL,
+			day TEXT NOT NULL,
+			count INTEGER NOT NULL DEFAULT 0,
+			PRIMARY KEY (chat_jid, day)
+		) WITHOUT ROWID
+	`); err != nil {
+		return err
+	}
+
+	if exists == 0 {
+		if _, err := tx.Exec(`
+			INSERT INTO chat_day_counts (chat_jid, day, count)
+			SELECT chat_jid, substr(timestamp, 1, 10), COUNT(*)
+			FROM messages
+			GROUP BY chat_jid, substr(timestamp, 1, 10)
+		`); err != nil {
+			return err
+		}
+	}
+
+	if _, err := tx.Exec(`
+		CREATE TRIGGER IF NOT EXISTS chat_day_counts_before_insert BEFORE INSERT ON messages
+		BEGIN
+			UPDATE chat_day_counts SET count = count - 1
+			WHERE (chat_jid, day) IN (
+				SELECT chat_jid, substr(timestamp, 1, 10) FROM messages
+				WHERE id = NEW.id AND chat_jid = NEW.chat_jid
+			);
+		END;
+
+		CREATE TRIGGER IF NOT EXISTS chat_day_counts_after_insert AFTER INSERT ON messages
+		BEGIN
+			INSERT INTO chat_day_counts (chat_jid, day, count)
+			VALUES (NEW.chat_jid, substr(NEW.timestamp, 1, 10), 1)
+			ON CONFLICT (chat_jid, day) DO UPDATE SET count = count + 1;
+		END;
+	`); err != nil {
+		return err
+	}
+
+	return tx.Commit()
+}
+
 // createTables creates all necessary database tables
 func createTables(db *sql.DB) error {
 	_, err := db.Exec(`
@@ -118,6 +212,10 @@ func createTables(db *sql.DB) error {
 			last_message_time TIMESTAMP
 		);
 
+		-- Backs list_chats ordered by last activity and its keyset cursors.
+		-- Same as migrations/001.
+		CREATE INDEX IF NOT EXISTS idx_chats_last_message_time ON chats(last_message_time DESC);
+
 		CREATE TABLE IF NOT EXISTS messages (
 			id TEXT,
 			chat_jid TEXT,
@@ -148,6 +246,15 @@ func createTables(db *sql.DB) error {
 			FOREIGN KEY (chat_jid) REFERENCES chats(jid)
 		);
 
+		-- Backs per-chat statistics (COUNT by chat_jid with a timestamp range)
+		-- and the latest-message-per-chat lookup in list_chats. Same name and
+		-- definition as migrations/001, so migrated databases keep one index.
+		CREATE INDEX IF NOT EXISTS idx_messages_chat_timestamp ON messages(chat_jid, timestamp DESC);
+
+		-- Backs list_messages without a chat filter, which orders and keysets on
+		-- (timestamp, id) across all chats. Same as migrations/002.
+		CREATE INDEX IF NOT EXISTS idx_messages_timestamp ON messages(timestamp DESC, id DESC);
+
 		CREATE TABLE IF NOT EXISTS contact_nicknames (
 			jid TEXT PRIMARY KEY,
 			nickname TEXT NOT NULL,
@@ -0,0 +1,24 @@
+-- Timestamp Index Migration
+-- Target: store/messages.db
+-- Date: 2026-10-15
+-- Backward compatible: YES (only adds, doesn't remove)
+
+-- ============================================================================
+-- Global timestamp index
+-- ============================================================================
+-- list_messages without a chat filter orders and filters on messages.timestamp
+-- alone (after/before and keyset cursors), which idx_messages_chat_timestamp
+-- from 001 cannot serve because chat_jid is its leading column.
+
+CREATE INDEX IF NOT EXISTS idx_messages_timestamp
+  ON messages(timestamp DESC, id DESC);
+
+-- Per-chat timestamp index (already created by 001, repeated so this file
+-- can be applied on its own)
+CREATE INDEX IF NOT EXISTS idx_messages_chat_timestamp
+  ON messages(chat_jid, timestamp DESC);
+
+-- ============================================================================
+-- Migration complete. Verify with:
+-- SELECT name FROM sqlite_master WHERE type='index' AND name = 'idx_messages_timestamp';
+-- ============================================================================
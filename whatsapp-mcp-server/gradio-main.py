@@ -1,7 +1,17 @@
+import asyncio
+import inspect
 import logging
 import os
-
-import gradio as gr
+import sys
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+from typing import Any, Literal, TypeVar, cast
+
+import orjson
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
 
 # Phase 2: Group Management
@@ -16,22 +26,24 @@ from whatsapp import demote_admin as whatsapp_demote_admin
 from whatsapp import download_media as whatsapp_download_media
 from whatsapp import edit_message as whatsapp_edit_message
 from whatsapp import follow_newsletter as whatsapp_follow_newsletter
+from whatsapp import format_contact_info as whatsapp_format_contact_info
 from whatsapp import get_blocklist as whatsapp_get_blocklist
-from whatsapp import get_chat as whatsapp_get_chat
+from whatsapp import get_chat_async as whatsapp_get_chat_async
 from whatsapp import get_contact_by_jid as whatsapp_get_contact_by_jid
 from whatsapp import get_contact_by_phone as whatsapp_get_contact_by_phone
-from whatsapp import get_contact_chats as whatsapp_get_contact_chats
+from whatsapp import get_contact_chats_page as whatsapp_get_contact_chats_page
 from whatsapp import get_contact_nickname as whatsapp_get_contact_nickname
 from whatsapp import get_direct_chat_by_contact as whatsapp_get_direct_chat_by_contact
 from whatsapp import get_group_info as whatsapp_get_group_info
 from whatsapp import get_last_interaction as whatsapp_get_last_interaction
 from whatsapp import get_message_context as whatsapp_get_message_context
 from whatsapp import get_profile_picture as whatsapp_get_profile_picture
+from whatsapp import iter_all_contacts as whatsapp_iter_all_contacts
 from whatsapp import leave_group as whatsapp_leave_group
 from whatsapp import list_all_contacts as whatsapp_list_all_contacts
-from whatsapp import list_chats as whatsapp_list_chats
+from whatsapp import list_chats_page as whatsapp_list_chats_page
 from whatsapp import list_contact_nicknames as whatsapp_list_contact_nicknames
-from whatsapp import list_messages as whatsapp_list_messages
+from whatsapp import list_messages_page as whatsapp_list_messages_page
 from whatsapp import mark_messages_read as whatsapp_mark_messages_read
 from whatsapp import promote_to_admin as whatsapp_promote_to_admin
 from whatsapp import remove_contact_nickname as whatsapp_remove_contact_nickname
@@ -53,23 +65,126 @@ from whatsapp import unfollow_newsletter as whatsapp_unfollow_newsletter
 from whatsapp import update_blocklist as whatsapp_update_blocklist
 from whatsapp import update_group as whatsapp_update_group
 
+# Resolve the debug flag once at import
+_DEBUG = os.environ.get("DEBUG") == "true"
+_LEVEL = logging.DEBUG if _DEBUG else logging.INFO
+_LEVEL_STR: Literal["DEBUG", "INFO"] = "DEBUG" if _DEBUG else "INFO"
+
 # Configure logging
 logging.basicConfig(
-    level=logging.DEBUG if os.environ.get("DEBUG") == "true" else logging.INFO,
+    level=_LEVEL,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 
 # Initialize FastMCP server
 mcp = FastMCP(
     "whatsapp",
-    log_level="DEBUG" if os.environ.get("DEBUG") == "true" else "INFO",
+    log_level=_LEVEL_STR,
+)
+
+
+# Tools run the blocking whatsapp calls (SQLite reads, bridge HTTP) on this pool so
+# concurrent SSE sessions are not serialized on the event loop thread
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("WA_POOL", str(min(32, 5 * (os.cpu_count() or 1))))),
+    thread_name_prefix="wa-tool",
 )
 
-# Define MCP tools (these will be exposed through both MCP and Gradio)
 
+async def _offload(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking whatsapp call on the tool pool and await its result."""
+    return await asyncio.get_running_loop().run_in_executor(_EXECUTOR, partial(fn, *args, **kwargs))
+
+
+def _ser(obj: Any) -> str:
+    """Serialize a tool result to a JSON string.
+
+    orjson encodes dicts, lists, dataclasses and datetimes natively; anything
+    else falls back to its attribute dict.
+    """
+    return orjson.dumps(obj, default=lambda o: o.__dict__, option=orjson.OPT_SERIALIZE_DATACLASS).decode()
+
+
+# Short-lived result caches for read-only tools, keyed by function name
+_CACHES: dict[str, TTLCache] = {}
+_LOCK = threading.Lock()
+
+# A sync or async tool function; the decorator hands back the same signature
+_ToolFn = TypeVar("_ToolFn", bound=Callable[..., Any])
+
+
+def ttl_cache(maxsize: int = 256, ttl: float = 2.0) -> Callable[[_ToolFn], _ToolFn]:
+    """Cache a read-only tool's result for a few seconds.
+
+    Repeated Gradio refreshes and MCP polls with the same arguments are served
+    from memory instead of re-querying SQLite.
+
+    Args:
+        maxsize: Maximum number of cached argument combinations
+        ttl: Seconds before a cached result expires
+    """
+
+    def deco(fn: _ToolFn) -> _ToolFn:
+        cache: TTLCache = TTLCache(maxsize, ttl)
+        _CACHES[fn.__name__] = cache
+
+        if inspect.iscoroutinefunction(fn):
 
-@mcp.tool()
-def search_contacts(query: str) -> str:
+            @wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> str:
+                key = (args, tuple(sorted(kwargs.items())))
+                with _LOCK:
+                    value = cache.get(key)
+                if value is not None:
+                    return value
+                result = await fn(*args, **kwargs)
+                with _LOCK:
+                    cache[key] = result
+                return result
+
+            return cast(_ToolFn, async_wrapper)
+
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> str:
+            key = (args, tuple(sorted(kwargs.items())))
+            with _LOCK:
+                value = cache.get(key)
+            if value is not None:
+                return value
+            result = fn(*args, **kwargs)
+            with _LOCK:
+                cache[key] = result
+            return result
+
+        return cast(_ToolFn, wrapper)
+
+    return deco
+
+
+def _invalidate(*names: str) -> None:
+    """Drop cached results for the named tools."""
+    with _LOCK:
+        for name in names:
+            _CACHES[name].clear()
+
+
+# MCP tools are collected here and only registered on the FastMCP server by the
+# process that serves it (see register_tools), so a Gradio-only parent process
+# never pays FastMCP's per-tool signature and schema introspection.
+_TOOLS: list[Callable[..., Any]] = []
+
+
+def _tool(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Mark a function as an MCP tool, to be registered by register_tools."""
+    _TOOLS.append(fn)
+    return fn
+
+
+# Define MCP tools
+
+
+@_tool
+async def search_contacts(query: str) -> str:
     """Search WhatsApp contacts by name or phone number.
 
     Parameters:
@@ -78,11 +193,11 @@ def search_contacts(query: str) -> str:
     Returns:
         JSON list of contact dicts with jid, phone_number, name, first_name, full_name, push_name, business_name, nickname
     """
-    return str(whatsapp_search_contacts(query))
+    return _ser(await _offload(whatsapp_search_contacts, query))
 
 
-@mcp.tool()
-def list_messages(
+@_tool
+async def list_messages(
     after: str = "",
     before: str = "",
     sender_phone_number: str = "",
@@ -93,6 +208,8 @@ def list_messages(
     include_context: bool = True,
     context_before: int = 1,
     context_after: int = 1,
+    cursor: str = "",
+    include_total: bool = False,
 ) -> str:
     """Get WhatsApp messages matching specified criteria with optional context.
 
@@ -103,10 +220,15 @@ def list_messages(
     - chat_jid: Chat JID to filter messages by chat (optional, leave empty if not needed)
     - query: Search term to filter messages by content (optional, leave empty if not needed)
     - limit: Maximum number of messages to return (default: 20)
-    - page: Page number for pagination (default: 0)
+    - page: Page number for offset pagination (default: 0). Deep pages get slower; prefer cursor
     - include_context: Whether to include messages before and after matches (default: true)
     - context_before: Number of messages to include before each match (default: 1)
     - context_after: Number of messages to include after each match (default: 1)
+    - cursor: next_cursor from a previous reply to fetch the following page; overrides page (optional)
+    - include_total: Also count all matching messages (slower; default: false)
+
+    Returns:
+        JSON object with items (message dicts), has_more, next_cursor (null on the last page) and optional total
     """
     # Convert empty strings to None for internal processing
     after_param = after if after else None
@@ -115,7 +237,8 @@ def list_messages(
     chat_param = chat_jid if chat_jid else None
     query_param = query if query else None
 
-    messages = whatsapp_list_messages(
+    messages = await _offload(
+        whatsapp_list_messages_page,
         after=after_param,
         before=before_param,
         sender_phone_number=sender_param,
@@ -126,81 +249,108 @@ def list_messages(
         include_context=include_context,
         context_before=context_before,
         context_after=context_after,
+        cursor=cursor or None,
+        include_total=include_total,
     )
-    return str(messages)
+    return _ser(messages)
 
 
-@mcp.tool()
-def list_chats(
-    query: str = "", limit: int = 20, page: int = 0, include_last_message: bool = True, sort_by: str = "last_active"
+@_tool
+@ttl_cache(ttl=2)
+async def list_chats(
+    query: str = "",
+    limit: int = 20,
+    page: int = 0,
+    include_last_message: bool = True,
+    sort_by: str = "last_active",
+    cursor: str = "",
+    include_total: bool = False,
 ) -> str:
     """Get WhatsApp chats matching specified criteria.
 
     Parameters:
     - query: Search term to filter chats by name or JID (optional, leave empty if not needed)
     - limit: Maximum number of chats to return (default: 20)
-    - page: Page number for pagination (default: 0)
+    - page: Page number for offset pagination (default: 0). Deep pages get slower; prefer cursor
     - include_last_message: Whether to include the last message in each chat (default: true)
     - sort_by: Field to sort results by, either "last_active" or "name" (default: "last_active")
+    - cursor: next_cursor from a previous reply to fetch the following page; overrides page (optional)
+    - include_total: Also count all matching chats (slower; default: false)
+
+    Returns:
+        JSON object with items (chat dicts), has_more, next_cursor (null on the last page) and optional total
     """
     # Convert empty string to None for internal processing
     query_param = query if query else None
 
-    chats = whatsapp_list_chats(
-        query=query_param, limit=limit, page=page, include_last_message=include_last_message, sort_by=sort_by
+    chats = await _offload(
+        whatsapp_list_chats_page,
+        query=query_param,
+        limit=limit,
+        page=page,
+        include_last_message=include_last_message,
+        sort_by=sort_by,
+        cursor=cursor or None,
+        include_total=include_total,
     )
-    return str(chats)
+    return _ser(chats)
 
 
-@mcp.tool()
-def get_chat(chat_jid: str, include_last_message: bool = True) -> str:
+@_tool
+@ttl_cache(ttl=2)
+async def get_chat(chat_jid: str, include_last_message: bool = True) -> str:
     """Get WhatsApp chat metadata by JID.
 
     Parameters:
     - chat_jid: The JID of the chat to retrieve
     - include_last_message: Whether to include the last message (default: true)
     """
-    chat = whatsapp_get_chat(chat_jid, include_last_message)
-    return str(chat)
+    chat = await whatsapp_get_chat_async(chat_jid, include_last_message)
+    return _ser(chat)
 
 
-@mcp.tool()
-def get_direct_chat_by_contact(sender_phone_number: str) -> str:
+@_tool
+async def get_direct_chat_by_contact(sender_phone_number: str) -> str:
     """Get WhatsApp chat metadata by sender phone number.
 
     Parameters:
     - sender_phone_number: The phone number to search for
     """
-    chat = whatsapp_get_direct_chat_by_contact(sender_phone_number)
-    return str(chat)
+    chat = await _offload(whatsapp_get_direct_chat_by_contact, sender_phone_number)
+    return _ser(chat)
 
 
-@mcp.tool()
-def get_contact_chats(jid: str, limit: int = 20, page: int = 0) -> str:
+@_tool
+async def get_contact_chats(jid: str, limit: int = 20, page: int = 0, cursor: str = "") -> str:
     """Get all WhatsApp chats involving the contact.
 
     Parameters:
     - jid: The contact's JID to search for
     - limit: Maximum number of chats to return (default: 20)
-    - page: Page number for pagination (default: 0)
+    - page: Page number for offset pagination (default: 0). Deep pages get slower; prefer cursor
+    - cursor: next_cursor from a previous reply to fetch the following page; overrides page (optional)
+
+    Returns:
+        JSON object with items (chat dicts), has_more and next_cursor (null on the last page)
     """
-    chats = whatsapp_get_contact_chats(jid, limit, page)
-    return str(chats)
+    chats = await _offload(whatsapp_get_contact_chats_page, jid, limit, page, cursor or None)
+    return _ser(chats)
 
 
-@mcp.tool()
-def get_last_interaction(jid: str) -> str:
+@_tool
+@ttl_cache(ttl=2)
+async def get_last_interaction(jid: str) -> str:
     """Get most recent WhatsApp message involving the contact.
 
     Parameters:
     - jid: The JID of the contact to search for
     """
-    message = whatsapp_get_last_interaction(jid)
-    return message
+    message = await _offload(whatsapp_get_last_interaction, jid)
+    return _ser(message)
 
 
-@mcp.tool()
-def get_message_context(message_id: str, before: int = 5, after: int = 5) -> str:
+@_tool
+async def get_message_context(message_id: str, before: int = 5, after: int = 5) -> str:
     """Get context around a specific WhatsApp message.
 
     Parameters:
@@ -208,65 +358,66 @@ def get_message_context(message_id: str, before: int = 5, after: int = 5) -> str
     - before: Number of messages to include before the target message (default: 5)
     - after: Number of messages to include after the target message (default: 5)
     """
-    context = whatsapp_get_message_context(message_id, before, after)
-    return str(context)
+    context = await _offload(whatsapp_get_message_context, message_id, before, after)
+    return _ser(context)
 
 
-@mcp.tool()
-def send_message(recipient: str, message: str) -> str:
+@_tool
+async def send_message(recipient: str, message: str) -> str:
     """Send a WhatsApp message to a person or group. For group chats use the JID.
 
     Parameters:
     - recipient: The recipient - either a phone number with country code but no + or other symbols, or a JID (e.g., "123456789@s.whatsapp.net" or a group JID like "123456789@g.us")
     - message: The message text to send
     """
-    result = whatsapp_send_message(recipient, message)
-    return str(result)
+    result = await _offload(whatsapp_send_message, recipient, message)
+    return _ser(result)
 
 
-@mcp.tool()
-def send_file(recipient: str, media_path: str) -> str:
+@_tool
+async def send_file(recipient: str, media_path: str) -> str:
     """Send a file such as a picture, raw audio, video or document via WhatsApp to the specified recipient. For group messages use the JID.
 
     Parameters:
     - recipient: The recipient - either a phone number with country code but no + or other symbols, or a JID (e.g., "123456789@s.whatsapp.net" or a group JID like "123456789@g.us")
     - media_path: The absolute path to the media file to send (image, video, document)
     """
-    result = whatsapp_send_file(recipient, media_path)
-    return str(result)
+    result = await _offload(whatsapp_send_file, recipient, media_path)
+    return _ser(result)
 
 
-@mcp.tool()
-def send_audio_message(recipient: str, media_path: str) -> str:
+@_tool
+async def send_audio_message(recipient: str, media_path: str) -> str:
     """Send any audio file as a WhatsApp audio message to the specified recipient. For group messages use the JID. If it errors due to ffmpeg not being installed, use send_file instead.
 
     Parameters:
     - recipient: The recipient - either a phone number with country code but no + or other symbols, or a JID (e.g., "123456789@s.whatsapp.net" or a group JID like "123456789@g.us")
     - media_path: The absolute path to the audio file to send (will be converted to Opus .ogg if it's not a .ogg file)
     """
-    result = whatsapp_audio_voice_message(recipient, media_path)
-    return str(result)
+    result = await _offload(whatsapp_audio_voice_message, recipient, media_path)
+    return _ser(result)
 
 
-@mcp.tool()
-def download_media(message_id: str, chat_jid: str) -> str:
+@_tool
+async def download_media(message_id: str, chat_jid: str) -> str:
     """Download media from a WhatsApp message and get the local file path.
 
     Parameters:
     - message_id: The ID of the message containing the media
     - chat_jid: The JID of the chat containing the message
     """
-    file_path = whatsapp_download_media(message_id, chat_jid)
+    file_path = await _offload(whatsapp_download_media, message_id, chat_jid)
 
     if file_path:
         result = {"success": True, "message": "Media downloaded successfully", "file_path": file_path}
     else:
         result = {"success": False, "message": "Failed to download media"}
-    return str(result)
+    return _ser(result)
 
 
-@mcp.tool()
-def get_contact_details(identifier: str) -> str:
+@_tool
+@ttl_cache(ttl=2)
+async def get_contact_details(identifier: str) -> str:
     """Get detailed contact information.
 
     Parameters:
@@ -275,14 +426,15 @@ def get_contact_details(identifier: str) -> str:
     Returns:
         Contact dict with jid, phone_number, name, first_name, full_name, push_name, business_name, nickname
     """
-    contact = whatsapp_get_contact_by_jid(identifier)
+    contact = await _offload(whatsapp_get_contact_by_jid, identifier)
     if not contact:
-        contact = whatsapp_get_contact_by_phone(identifier)
-    return str(contact)
+        contact = await _offload(whatsapp_get_contact_by_phone, identifier)
+    return _ser(contact)
 
 
-@mcp.tool()
-def list_all_contacts(limit: int = 100) -> str:
+@_tool
+@ttl_cache(ttl=2)
+async def list_all_contacts(limit: int = 100) -> str:
     """Get all contacts with their detailed information.
 
     Parameters:
@@ -291,104 +443,71 @@ def list_all_contacts(limit: int = 100) -> str:
     Returns:
         JSON list of contact dicts
     """
-    return str(whatsapp_list_all_contacts(limit))
 
+    # Encode each contact as it is read from the cursor so neither the Contact list nor
+    # a second full copy of the payload is built before joining
+    def encode() -> str:
+        contacts = whatsapp_iter_all_contacts(limit)
+        rows = (orjson.dumps(c, option=orjson.OPT_SERIALIZE_DATACLASS).decode() for c in contacts)
+        return "[" + ",".join(rows) + "]"
+
+    return await _offload(encode)
 
-@mcp.tool()
-def set_contact_nickname(jid: str, nickname: str) -> str:
+
+@_tool
+async def set_contact_nickname(jid: str, nickname: str) -> str:
     """Set a custom nickname for a contact.
 
     Parameters:
     - jid: WhatsApp JID of the contact
     - nickname: Custom nickname to set for the contact
     """
-    return str(whatsapp_set_contact_nickname(jid, nickname))
+    result = await _offload(whatsapp_set_contact_nickname, jid, nickname)
+    _invalidate("get_contact_nickname", "list_contact_nicknames", "get_contact_details")
+    return _ser(result)
 
 
-@mcp.tool()
-def get_contact_nickname(jid: str) -> str:
+@_tool
+@ttl_cache(ttl=2)
+async def get_contact_nickname(jid: str) -> str:
     """Get a contact's custom nickname.
 
     Parameters:
     - jid: WhatsApp JID of the contact
     """
-    nickname = whatsapp_get_contact_nickname(jid)
+    nickname = await _offload(whatsapp_get_contact_nickname, jid)
     result = {"jid": jid, "nickname": nickname}
-    return str(result)
+    return _ser(result)
 
 
-@mcp.tool()
-def remove_contact_nickname(jid: str) -> str:
+@_tool
+async def remove_contact_nickname(jid: str) -> str:
     """Remove a contact's custom nickname.
 
     Parameters:
     - jid: WhatsApp JID of the contact
     """
-    return str(whatsapp_remove_contact_nickname(jid))
+    result = await _offload(whatsapp_remove_contact_nickname, jid)
+    _invalidate("get_contact_nickname", "list_contact_nicknames", "get_contact_details")
+    return _ser(result)
 
 
-@mcp.tool()
-def list_contact_nicknames() -> str:
+@_tool
+@ttl_cache(ttl=2)
+async def list_contact_nicknames() -> str:
     """List all custom contact nicknames with timestamps.
 
     Parameters:
     None required
     """
-    return str(whatsapp_list_contact_nicknames())
+    return _ser(await _offload(whatsapp_list_contact_nicknames))
 
 
 # Phase 1 Features: Reactions, Edit, Delete, Group Info, Mark Read
 
 
-@mcp.tool()
-def send_reaction(chat_jid: str, message_id: str, emoji: str) -> str:
-    """Send an emoji reaction to a WhatsApp message.
-
-    Parameters:
-    - chat_jid: The JID of the chat containing the message
-    - message_id: The ID of the message to react to
-    - emoji: The emoji to react with (empty string to remove reaction)
-    """
-    return str(whatsapp_send_reaction(chat_jid, message_id, emoji))
-
-
-@mcp.tool()
-def edit_message(chat_jid: str, message_id: str, new_content: str) -> str:
-    """Edit a previously sent WhatsApp message.
-
-    Parameters:
-    - chat_jid: The JID of the chat containing the message
-    - message_id: The ID of the message to edit
-    - new_content: The new message content
-    """
-    return str(whatsapp_edit_message(chat_jid, message_id, new_content))
-
-
-@mcp.tool()
-def delete_message(chat_jid: str, message_id: str, sender_jid: str = "") -> str:
-    """Delete/revoke a WhatsApp message.
-
-    Parameters:
-    - chat_jid: The JID of the chat containing the message
-    - message_id: The ID of the message to delete
-    - sender_jid: Optional sender JID for admin revoking others' messages in groups
-    """
-    sender = sender_jid if sender_jid else None
-    return str(whatsapp_delete_message(chat_jid, message_id, sender))
-
-
-@mcp.tool()
-def get_group_info(group_jid: str) -> str:
-    """Get information about a WhatsApp group.
-
-    Parameters:
-    - group_jid: The JID of the group (e.g., "123456789@g.us")
-    """
-    return str(whatsapp_get_group_info(group_jid))
-
-
-@mcp.tool()
-def mark_read(chat_jid: str, message_ids: str, sender_jid: str = "") -> str:
+@_tool
+async def mark_read(chat_jid: str, message_ids: str, sender_jid: str = "") -> str:
     """Mark WhatsApp messages as read (sends blue ticks).
 
     Parameters:
@@ -398,14 +517,14 @@ def mark_read(chat_jid: str, message_ids: str, sender_jid: str = "") -> str:
     """
     ids = [mid.strip() for mid in message_ids.split(",") if mid.strip()]
     sender = sender_jid if sender_jid else None
-    return str(whatsapp_mark_messages_read(chat_jid, ids, sender))
+    return _ser(await _offload(whatsapp_mark_messages_read, chat_jid, ids, sender))
 
 
 # Phase 2: Group Management
 
 
-@mcp.tool()
-def create_group(name: str, participants: str) -> str:
+@_tool
+async def create_group(name: str, participants: str) -> str:
     """Create a new WhatsApp group.
 
     Parameters:
@@ -413,11 +532,11 @@ def create_group(name: str, participants: str) -> str:
     - participants: Comma-separated list of participant JIDs (e.g., "123@s.whatsapp.net,456@s.whatsapp.net")
     """
     participant_list = [p.strip() for p in participants.split(",") if p.strip()]
-    return str(whatsapp_create_group(name, participant_list))
+    return _ser(await _offload(whatsapp_create_group, name, participant_list))
 
 
-@mcp.tool()
-def add_group_members(group_jid: str, participants: str) -> str:
+@_tool
+async def add_group_members(group_jid: str, participants: str) -> str:
     """Add members to a WhatsApp group.
 
     Parameters:
@@ -425,11 +544,11 @@ def add_group_members(group_jid: str, participants: str) -> str:
     - participants: Comma-separated list of participant JIDs to add
     """
     participant_list = [p.strip() for p in participants.split(",") if p.strip()]
-    return str(whatsapp_add_group_members(group_jid, participant_list))
+    return _ser(await _offload(whatsapp_add_group_members, group_jid, participant_list))
 
 
-@mcp.tool()
-def remove_group_members(group_jid: str, participants: str) -> str:
+@_tool
+async def remove_group_members(group_jid: str, participants: str) -> str:
     """Remove members from a WhatsApp group.
 
     Parameters:
@@ -437,60 +556,14 @@ def remove_group_members(group_jid: str, participants: str) -> str:
     - participants: Comma-separated list of participant JIDs to remove
     """
     participant_list = [p.strip() for p in participants.split(",") if p.strip()]
-    return str(whatsapp_remove_group_members(group_jid, participant_list))
-
-
-@mcp.tool()
-def promote_to_admin(group_jid: str, participant: str) -> str:
-    """Promote a group member to admin.
-
-    Parameters:
-    - group_jid: The JID of the group (e.g., "123456789@g.us")
-    - participant: The JID of the participant to promote
-    """
-    return str(whatsapp_promote_to_admin(group_jid, participant))
-
-
-@mcp.tool()
-def demote_admin(group_jid: str, participant: str) -> str:
-    """Demote a group admin to regular member.
-
-    Parameters:
-    - group_jid: The JID of the group (e.g., "123456789@g.us")
-    - participant: The JID of the admin to demote
-    """
-    return str(whatsapp_demote_admin(group_jid, participant))
-
-
-@mcp.tool()
-def leave_group(group_jid: str) -> str:
-    """Leave a WhatsApp group.
-
-    Parameters:
-    - group_jid: The JID of the group to leave (e.g., "123456789@g.us")
-    """
-    return str(whatsapp_leave_group(group_jid))
-
-
-@mcp.tool()
-def update_group(group_jid: str, name: str = "", topic: str = "") -> str:
-    """Update group name and/or topic (description).
-
-    Parameters:
-    - group_jid: The JID of the group (e.g., "123456789@g.us")
-    - name: New group name (optional, leave empty to not change)
-    - topic: New group topic/description (optional, leave empty to not change)
-    """
-    name_param = name if name else None
-    topic_param = topic if topic else None
-    return str(whatsapp_update_group(group_jid, name_param, topic_param))
+    return _ser(await _offload(whatsapp_remove_group_members, group_jid, participant_list))
 
 
 # Phase 3: Polls
 
 
-@mcp.tool()
-def create_poll(chat_jid: str, question: str, options: str, multi_select: bool = False) -> str:
+@_tool
+async def create_poll(chat_jid: str, question: str, options: str, multi_select: bool = False) -> str:
     """Create and send a poll to a WhatsApp chat.
 
     Parameters:
@@ -500,14 +573,14 @@ def create_poll(chat_jid: str, question: str, options: str, multi_select: bool =
     - multi_select: If True, allows multiple selections (default: False)
     """
     option_list = [opt.strip() for opt in options.split(",") if opt.strip()]
-    return str(whatsapp_create_poll(chat_jid, question, option_list, multi_select))
+    return _ser(await _offload(whatsapp_create_poll, chat_jid, question, option_list, multi_select))
 
 
 # Phase 4: History Sync
 
 
-@mcp.tool()
-def request_history(
+@_tool
+async def request_history(
     chat_jid: str, oldest_msg_id: str, oldest_msg_timestamp: int, oldest_msg_from_me: bool = False, count: int = 50
 ) -> str:
     """Request older messages for a chat (on-demand history sync).
@@ -523,152 +596,304 @@ def request_history(
     - oldest_msg_from_me: Whether the oldest message was sent by you (default: False)
     - count: Number of messages to request (max 50, default: 50)
     """
-    return str(whatsapp_request_chat_history(chat_jid, oldest_msg_id, oldest_msg_timestamp, oldest_msg_from_me, count))
+    result = await _offload(
+        whatsapp_request_chat_history, chat_jid, oldest_msg_id, oldest_msg_timestamp, oldest_msg_from_me, count
+    )
+    return _ser(result)
 
 
 # Phase 5: Advanced Features
 
 
-@mcp.tool()
-def set_presence(presence: str) -> str:
-    """Set your own presence status (available/unavailable).
+@_tool
+async def block_user(jid: str) -> str:
+    """Block a WhatsApp user.
 
     Parameters:
-    - presence: Either "available" or "unavailable"
+    - jid: The JID of the user to block (e.g., "123456789@s.whatsapp.net")
     """
-    return str(whatsapp_set_presence(presence))
+    return _ser(await _offload(whatsapp_update_blocklist, jid, "block"))
 
 
-@mcp.tool()
-def subscribe_presence(jid: str) -> str:
-    """Subscribe to presence updates for a contact.
+@_tool
+async def unblock_user(jid: str) -> str:
+    """Unblock a WhatsApp user.
 
     Parameters:
-    - jid: The JID of the contact to subscribe to (e.g., "123456789@s.whatsapp.net")
+    - jid: The JID of the user to unblock (e.g., "123456789@s.whatsapp.net")
     """
-    return str(whatsapp_subscribe_presence(jid))
-
-
-@mcp.tool()
-def get_profile_picture(jid: str, preview: bool = False) -> str:
-    """Get the profile picture URL for a user or group.
-
-    Parameters:
-    - jid: The JID of the user or group
-    - preview: If True, get thumbnail instead of full resolution (default: False)
+    return _ser(await _offload(whatsapp_update_blocklist, jid, "unblock"))
+
+
+# Thin passthrough tools, generated from a table so the empty-string handling and
+# serialization live in one place. Each entry is the whatsapp function and the tool
+# description; the tool name and parameters come from the function itself.
+_PASSTHROUGH_TOOLS: list[tuple[Callable[..., Any], str]] = [
+    # Phase 1: Reactions, Edit, Delete, Group Info
+    (
+        whatsapp_send_reaction,
+        """Send an emoji reaction to a WhatsApp message.
+
+        Parameters:
+        - chat_jid: The JID of the chat containing the message
+        - message_id: The ID of the message to react to
+        - emoji: The emoji to react with (empty string to remove reaction)
+        """,
+    ),
+    (
+        whatsapp_edit_message,
+        """Edit a previously sent WhatsApp message.
+
+        Parameters:
+        - chat_jid: The JID of the chat containing the message
+        - message_id: The ID of the message to edit
+        - new_content: The new message content
+        """,
+    ),
+    (
+        whatsapp_delete_message,
+        """Delete/revoke a WhatsApp message.
+
+        Parameters:
+        - chat_jid: The JID of the chat containing the message
+        - message_id: The ID of the message to delete
+        - sender_jid: Optional sender JID for admin revoking others' messages in groups
+        """,
+    ),
+    (
+        whatsapp_get_group_info,
+        """Get information about a WhatsApp group.
+
+        Parameters:
+        - group_jid: The JID of the group (e.g., "123456789@g.us")
+        """,
+    ),
+    # Phase 2: Group Management
+    (
+        whatsapp_promote_to_admin,
+        """Promote a group member to admin.
+
+        Parameters:
+        - group_jid: The JID of the group (e.g., "123456789@g.us")
+        - participant: The JID of the participant to promote
+        """,
+    ),
+    (
+        whatsapp_demote_admin,
+        """Demote a group admin to regular member.
+
+        Parameters:
+        - group_jid: The JID of the group (e.g., "123456789@g.us")
+        - participant: The JID of the admin to demote
+        """,
+    ),
+    (
+        whatsapp_leave_group,
+        """Leave a WhatsApp group.
+
+        Parameters:
+        - group_jid: The JID of the group to leave (e.g., "123456789@g.us")
+        """,
+    ),
+    (
+        whatsapp_update_group,
+        """Update group name and/or topic (description).
+
+        Parameters:
+        - group_jid: The JID of the group (e.g., "123456789@g.us")
+        - name: New group name (optional, leave empty to not change)
+        - topic: New group topic/description (optional, leave empty to not change)
+        """,
+    ),
+    # Phase 5: Advanced Features
+    (
+        whatsapp_set_presence,
+        """Set your own presence status (available/unavailable).
+
+        Parameters:
+        - presence: Either "available" or "unavailable"
+        """,
+    ),
+    (
+        whatsapp_subscribe_presence,
+        """Subscribe to presence updates for a contact.
+
+        Parameters:
+        - jid: The JID of the contact to subscribe to (e.g., "123456789@s.whatsapp.net")
+        """,
+    ),
+    (
+        whatsapp_get_profile_picture,
+        """Get the profile picture URL for a user or group.
+
+        Parameters:
+        - jid: The JID of the user or group
+        - preview: If True, get thumbnail instead of full resolution (default: False)
+        """,
+    ),
+    (
+        whatsapp_get_blocklist,
+        """Get the list of blocked users.
+
+        Parameters:
+        None required
+        """,
+    ),
+    (
+        whatsapp_follow_newsletter,
+        """Follow (join) a WhatsApp newsletter/channel.
+
+        Parameters:
+        - jid: The JID of the newsletter to follow
+        """,
+    ),
+    (
+        whatsapp_unfollow_newsletter,
+        """Unfollow a WhatsApp newsletter/channel.
+
+        Parameters:
+        - jid: The JID of the newsletter to unfollow
+        """,
+    ),
+    (
+        whatsapp_create_newsletter,
+        """Create a new WhatsApp newsletter/channel.
+
+        Parameters:
+        - name: The name for the newsletter
+        - description: Optional description for the newsletter
+        """,
+    ),
+]
+
+
+def _make_tool(fn: Callable[..., Any], description: str) -> Callable[..., Awaitable[str]]:
+    """Wrap a whatsapp function as an async tool returning serialized JSON.
+
+    Optional ``str | None`` parameters are exposed as ``str = ""`` (MCP clients
+    send empty strings for "not set") and converted back to None before the call.
     """
-    return str(whatsapp_get_profile_picture(jid, preview))
+    sig = inspect.signature(fn)
+    optional = {
+        name for name, param in sig.parameters.items() if param.default is None and param.annotation == (str | None)
+    }
+    params = [
+        param.replace(annotation=str, default="") if name in optional else param
+        for name, param in sig.parameters.items()
+    ]
 
+    @wraps(fn)
+    async def tool(*args: Any, **kwargs: Any) -> str:
+        bound = sig.bind(*args, **kwargs)
+        for name in optional & bound.arguments.keys():
+            bound.arguments[name] = bound.arguments[name] or None
+        return _ser(await _offload(fn, *bound.args, **bound.kwargs))
 
-@mcp.tool()
-def get_blocklist() -> str:
-    """Get the list of blocked users.
+    tool.__doc__ = description
+    tool.__signature__ = sig.replace(parameters=params, return_annotation=str)  # type: ignore[attr-defined]
+    return tool
 
-    Parameters:
-    None required
-    """
-    return str(whatsapp_get_blocklist())
 
+def register_tools(server: FastMCP) -> None:
+    """Register every MCP tool on ``server``. Call once, from the process serving MCP."""
+    for fn in _TOOLS:
+        server.tool()(fn)
+    for fn, description in _PASSTHROUGH_TOOLS:
+        server.tool()(_make_tool(fn, description))
 
-@mcp.tool()
-def block_user(jid: str) -> str:
-    """Block a WhatsApp user.
 
-    Parameters:
-    - jid: The JID of the user to block (e.g., "123456789@s.whatsapp.net")
-    """
-    return str(whatsapp_update_blocklist(jid, "block"))
+# Gradio UI functions. Gradio runs in-process, so these call the whatsapp module
+# directly instead of going through the MCP tools and re-parsing their JSON.
 
 
-@mcp.tool()
-def unblock_user(jid: str) -> str:
-    """Unblock a WhatsApp user.
+def debounce(ms: int) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Reuse a handler's last result when it is re-triggered with the same inputs within ``ms``.
 
-    Parameters:
-    - jid: The JID of the user to unblock (e.g., "123456789@s.whatsapp.net")
+    Collapses rapid repeated clicks into one query. Different inputs always run.
     """
-    return str(whatsapp_update_blocklist(jid, "unblock"))
-
 
-@mcp.tool()
-def follow_newsletter(jid: str) -> str:
-    """Follow (join) a WhatsApp newsletter/channel.
+    def deco(fn: Callable[..., Any]) -> Callable[..., Any]:
+        last: dict[str, Any] = {"at": 0.0, "args": None, "result": None}
+        lock = threading.Lock()
 
-    Parameters:
-    - jid: The JID of the newsletter to follow
-    """
-    return str(whatsapp_follow_newsletter(jid))
+        @wraps(fn)
+        def wrapper(*args: Any) -> Any:
+            now = time.monotonic()
+            with lock:
+                if args == last["args"] and (now - last["at"]) * 1000 < ms:
+                    return last["result"]
+            result = fn(*args)
+            with lock:
+                last.update(at=now, args=args, result=result)
+            return result
 
+        return wrapper
 
-@mcp.tool()
-def unfollow_newsletter(jid: str) -> str:
-    """Unfollow a WhatsApp newsletter/channel.
+    return deco
 
-    Parameters:
-    - jid: The JID of the newsletter to unfollow
-    """
-    return str(whatsapp_unfollow_newsletter(jid))
 
-
-@mcp.tool()
-def create_newsletter(name: str, description: str = "") -> str:
-    """Create a new WhatsApp newsletter/channel.
-
-    Parameters:
-    - name: The name for the newsletter
-    - description: Optional description for the newsletter
-    """
-    return str(whatsapp_create_newsletter(name, description))
-
-
-# Gradio UI functions (these wrap the MCP tools for use with the Gradio UI)
+def _format_status(result):
+    """Render a whatsapp.py result dict as a one-line status for the UI."""
+    detail = result.get("error") or result.get("message") or "OK"
+    return f"Status: {result.get('success')}, Message: {detail}"
 
 
+@debounce(300)
 def gradio_search_contacts(query):
-    contacts = search_contacts(query)
+    import gradio as gr
+
+    contacts = whatsapp_search_contacts(query)
     if contacts:
-        return gr.update(value=str(contacts), visible=True)
+        return gr.update(value=_ser(contacts), visible=True)
     else:
         return gr.update(value="No contacts found", visible=True)
 
 
-def gradio_list_chats(query, limit, include_last_message, sort_by):
-    chats = list_chats(
+@debounce(300)
+def gradio_list_chats(query, limit: float, include_last_message, sort_by):
+    import gradio as gr
+
+    # Sliders emit floats; cast once here and pass ints through from the boundary on
+    chats = whatsapp_list_chats_page(
         query=query if query else None,
         limit=int(limit),
         page=0,
         include_last_message=include_last_message,
         sort_by=sort_by,
-    )
+    )["items"]
     if chats:
-        return gr.update(value=str(chats), visible=True)
+        return gr.update(value=_ser(chats), visible=True)
     else:
         return gr.update(value="No chats found", visible=True)
 
 
-def gradio_list_messages(chat_jid, query, limit):
-    messages = list_messages(
-        chat_jid=chat_jid if chat_jid else None, query=query if query else None, limit=int(limit), page=0
-    )
+@debounce(300)
+def gradio_list_messages(chat_jid, query, limit: float):
+    import gradio as gr
+
+    messages = whatsapp_list_messages_page(
+        chat_jid=chat_jid if chat_jid else None,
+        query=query if query else None,
+        limit=int(limit),
+        page=0,
+        include_context=True,
+    )["items"]
     if messages:
-        return gr.update(value=str(messages), visible=True)
+        return gr.update(value=_ser(messages), visible=True)
     else:
         return gr.update(value="No messages found", visible=True)
 
 
 def gradio_send_message(recipient, message):
-    result = send_message(recipient, message)
-    return f"Status: {result['success']}, Message: {result['message']}"
+    return _format_status(whatsapp_send_message(recipient, message))
 
 
 def gradio_send_file(recipient, file):
-    result = send_file(recipient, file.name)
-    return f"Status: {result['success']}, Message: {result['message']}"
+    return _format_status(whatsapp_send_file(recipient, file.name))
 
 
 def gradio_send_audio(recipient, file):
-    result = send_audio_message(recipient, file.name)
-    return f"Status: {result['success']}, Message: {result['message']}"
+    return _format_status(whatsapp_audio_voice_message(recipient, file.name))
 
 
 # Gradio wrapper functions for contact management
@@ -679,44 +904,46 @@ def gradio_get_contact_details(jid, phone_number):
     if not jid and not phone_number:
         return "Error: Either JID or phone number must be provided"
 
-    result = get_contact_details(jid=jid if jid else None, phone_number=phone_number if phone_number else None)
+    contact = whatsapp_get_contact_by_jid(jid) if jid else None
+    if not contact and phone_number:
+        contact = whatsapp_get_contact_by_phone(phone_number)
 
-    if "error" in result:
-        return result["error"]
-    else:
-        return result["formatted_info"]
+    if not contact:
+        return f"Contact not found: {jid or phone_number}"
+    return whatsapp_format_contact_info(contact)
 
 
-def gradio_list_all_contacts(limit):
+@debounce(300)
+def gradio_list_all_contacts(limit: float):
     """Gradio wrapper for list_all_contacts"""
-    contacts = list_all_contacts(limit=int(limit))
+    contacts = whatsapp_list_all_contacts(int(limit))
 
-    if contacts:
-        formatted_contacts = []
-        for contact in contacts:
-            name_to_display = (
-                contact.get("name", "") if contact.get("name", "") != "*" else contact.get("push_name", "Unknown")
-            )
-            formatted_contacts.append(
-                f"📱 {name_to_display} ({contact.get('phone_number', 'N/A')})\n"
-                f"   JID: {contact.get('jid', 'N/A')}\n"
-                f"   Full Name: {contact.get('full_name') or 'N/A'}\n"
-                f"   Push Name: {contact.get('push_name') or 'N/A'}\n"
-                f"   Nickname: {contact.get('nickname') or 'N/A'}\n"
-                f"   Business: {contact.get('business_name') or 'N/A'}\n"
-            )
-        return "\n".join(formatted_contacts)
-    else:
+    if not contacts:
         return "No contacts found"
 
+    def format_contact(contact):
+        name = contact.name if contact.name != "*" else (contact.push_name or "Unknown")
+        return (
+            f"📱 {name} ({contact.phone_number})\n"
+            f"   JID: {contact.jid}\n"
+            f"   Full Name: {contact.full_name or 'N/A'}\n"
+            f"   Push Name: {contact.push_name or 'N/A'}\n"
+            f"   Nickname: {contact.nickname or 'N/A'}\n"
+            f"   Business: {contact.business_name or 'N/A'}\n"
+        )
+
+    # One join over a generator instead of building an intermediate list
+    return "\n".join(format_contact(contact) for contact in contacts)
+
 
 def gradio_set_contact_nickname(jid, nickname):
     """Gradio wrapper for set_contact_nickname"""
     if not jid or not nickname:
         return "Error: Both JID and nickname must be provided"
 
-    result = set_contact_nickname(jid, nickname)
-    return f"Status: {result['success']}, Message: {result['message']}"
+    result = whatsapp_set_contact_nickname(jid, nickname)
+    _invalidate("get_contact_nickname", "list_contact_nicknames", "get_contact_details")
+    return _format_status(result)
 
 
 def gradio_get_contact_nickname(jid):
@@ -724,8 +951,7 @@ def gradio_get_contact_nickname(jid):
     if not jid:
         return "Error: JID must be provided"
 
-    result = get_contact_nickname(jid)
-    nickname = result.get("nickname")
+    nickname = whatsapp_get_contact_nickname(jid)
 
     if nickname:
         return f"Nickname for {jid}: {nickname}"
@@ -738,25 +964,27 @@ def gradio_remove_contact_nickname(jid):
     if not jid:
         return "Error: JID must be provided"
 
-    result = remove_contact_nickname(jid)
-    return f"Status: {result['success']}, Message: {result['message']}"
+    result = whatsapp_remove_contact_nickname(jid)
+    _invalidate("get_contact_nickname", "list_contact_nicknames", "get_contact_details")
+    return _format_status(result)
 
 
 def gradio_list_contact_nicknames():
     """Gradio wrapper for list_contact_nicknames"""
-    nicknames = list_contact_nicknames()
+    # Gradio runs in-process, so read the rows directly rather than via the JSON tool
+    nicknames = whatsapp_list_contact_nicknames()
 
     if nicknames:
-        formatted_nicknames = []
-        for item in nicknames:
-            formatted_nicknames.append(f"📝 {item['nickname']} -> {item['jid']}")
-        return "\n".join(formatted_nicknames)
+        return "\n".join(f"📝 {item['nickname']} -> {item['jid']}" for item in nicknames)
     else:
         return "No custom nicknames found"
 
 
 # Create Gradio UI
 def create_gradio_ui():
+    # Imported lazily so GRADIO=false deployments never load gradio and its dependencies
+    import gradio as gr
+
     with gr.Blocks(title="WhatsApp MCP Interface") as app:
         gr.Markdown("# WhatsApp MCP Interface")
         gr.Markdown(
@@ -900,43 +1128,69 @@ def create_gradio_ui():
 
 
 # Main function
+def _run_mcp_sse(host: str, port: int) -> None:
+    """Process entry point serving the MCP SSE transport on its own port."""
+    register_tools(mcp)
+    mcp.settings.host = host
+    mcp.settings.port = port
+    mcp.run(transport="sse")
+
+
 if __name__ == "__main__":
-    # Get configuration from environment variables or use defaults
-    host = os.environ.get("HOST", "0.0.0.0")
-    port = int(os.environ.get("PORT", "8081"))  # Use a different port to avoid conflicts with the Inspector
-    gradio_port = int(os.environ.get("GRADIO_PORT", "8082"))
+    # Get configuration from environment variables or use defaults (read once)
+    env = os.environ
+    host = env.get("HOST", "0.0.0.0")
+    port = int(env.get("PORT", "8081"))  # Use a different port to avoid conflicts with the Inspector
+    gradio_port = int(env.get("GRADIO_PORT", "8082"))
     # Check if Gradio should be enabled (default: True for backward compatibility)
-    enable_gradio = os.environ.get("GRADIO", "true").lower() in ("true", "1", "yes", "on")
+    enable_gradio = env.get("GRADIO", "true").lower() in ("true", "1", "yes", "on")
+    # Optionally run MCP in its own process (own GIL, crash isolation) instead of colocating it with Gradio
+    separate_mcp = env.get("MCP_SEPARATE_PROCESS", "false").lower() in ("true", "1", "yes", "on")
 
-    if enable_gradio:
-        # Start MCP server in a separate thread
-        import threading
+    # Use uvloop for the event loop when available (not on Windows)
+    try:
+        import uvloop
 
-        def start_mcp_server():
-            logging.info(f"Starting WhatsApp MCP server with SSE transport on {host}:{port}")
-            try:
-                # Initialize and run the server with SSE transport
-                mcp.run(transport="sse")
-            except Exception as e:
-                logging.error(f"Error starting MCP server: {e}")
-                import traceback
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
 
-                traceback.print_exc()
+    if enable_gradio and separate_mcp:
+        import multiprocessing as mp
 
-        # Start MCP server in a thread
-        mcp_thread = threading.Thread(target=start_mcp_server)
-        mcp_thread.daemon = True
-        mcp_thread.start()
+        # spawn, not fork: the child must open its own SQLite connections
+        mcp_proc = mp.get_context("spawn").Process(target=_run_mcp_sse, args=(host, port), daemon=True)
+        mcp_proc.start()
+        logging.info(f"Started WhatsApp MCP server with SSE transport on {host}:{port} (pid {mcp_proc.pid})")
 
-        # Start Gradio UI
         logging.info(f"Starting Gradio UI on port {gradio_port}")
-        app = create_gradio_ui()
-        app.launch(server_name=host, server_port=gradio_port, share=False, mcp_server=True)
+        try:
+            create_gradio_ui().launch(server_name=host, server_port=gradio_port, share=False, mcp_server=True)
+        finally:
+            mcp_proc.terminate()
+            mcp_proc.join()
+    elif enable_gradio:
+        # Serve the MCP SSE endpoints and the Gradio UI from one ASGI app and one event loop
+        import gradio as gr
+        import uvicorn
+        from fastapi import FastAPI
+
+        register_tools(mcp)
+        root_app = FastAPI()
+        # Mount /mcp before the Gradio catch-all so it wins route matching
+        root_app.mount("/mcp", mcp.sse_app("/mcp"))
+        root_app = gr.mount_gradio_app(root_app, create_gradio_ui(), path="/", mcp_server=True)
+
+        logging.info(f"Starting Gradio UI on port {gradio_port} with MCP SSE transport at /mcp/sse")
+        # Pin the C event loop and HTTP parser where available (uvloop is not built for Windows)
+        loop = "asyncio" if sys.platform == "win32" else "uvloop"
+        uvicorn.run(root_app, host=host, port=gradio_port, loop=loop, http="httptools")
     else:
         # Run MCP server only (no Gradio UI)
         logging.info(f"Starting WhatsApp MCP server (API only) with streamable-http transport on {host}:{port}")
         logging.info("Gradio UI disabled via GRADIO environment variable")
         try:
+            register_tools(mcp)
             mcp.settings.host = host
             mcp.settings.port = port
             # Initialize and run the server with streamable-http transport
@@ -3,9 +3,11 @@
 This module provides the core functionality for the WhatsApp MCP server,
 organized into submodules:
 
-- models: Data classes (Message, Chat, Contact, MessageContext)
+- models: Data classes (Message, Chat, Contact, MessageContext, MessageBatch)
 - database: Database operations (list_messages, list_chats, search_contacts, etc.)
 - bridge: Bridge API calls (send_message, send_reaction, edit_message, etc.)
+- bridge_async: Async variants of the core bridge calls for concurrent fan-out
+- enrich: Batch computation of derived message fields (counts, URLs, mentions)
 - utils: Logging, configuration, helper functions
 """
 
@@ -18,6 +20,7 @@ from .bridge import (
     delete_message,
     edit_message,
     get_group_info,
+    invalidate_group,
     mark_read,
     send_file,
     send_message,
@@ -35,7 +38,7 @@ from .database import (
     search_contacts,
     set_contact_nickname,
 )
-from .models import Chat, Contact, Message, MessageContext
+from .models import Chat, Contact, ContactInfo, Message, MessageBatch, MessageContext, VelocityStats
 
 # Utilities
 from .utils import (
@@ -43,6 +46,7 @@ from .utils import (
     MESSAGES_DB_PATH,
     WHATSAPP_API_BASE_URL,
     WHATSAPP_DB_PATH,
+    dumps,
     get_sender_name,
     logger,
     setup_logging,
@@ -54,6 +58,9 @@ __all__ = [
     "Chat",
     "Contact",
     "MessageContext",
+    "MessageBatch",
+    "ContactInfo",
+    "VelocityStats",
     # Database
     "DatabaseError",
     "list_messages",
@@ -72,6 +79,7 @@ __all__ = [
     "delete_message",
     "mark_read",
     "get_group_info",
+    "invalidate_group",
     "create_group",
     "create_poll",
     # Utils
@@ -82,4 +90,5 @@ __all__ = [
     "BRIDGE_HOST",
     "WHATSAPP_API_BASE_URL",
     "get_sender_name",
+    "dumps",
 ]
@@ -17,12 +17,53 @@ try:
 except ImportError:
     pass
 
+import atexit
+import gzip
 import os
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .utils import WHATSAPP_API_BASE_URL, logger
+from .utils import WHATSAPP_API_BASE_URL, dumps, logger
+
+try:
+    import ijson
+
+    _IJSON_ERRORS: tuple[type[Exception], ...] = (ijson.JSONError,)
+except ImportError:
+    ijson = None  # Streaming falls back to response.json()
+    _IJSON_ERRORS = ()
+
+
+# Endpoint URLs, built once at import
+_URL_SEND = f"{WHATSAPP_API_BASE_URL}/send"
+_URL_REACTION = f"{WHATSAPP_API_BASE_URL}/reaction"
+_URL_EDIT = f"{WHATSAPP_API_BASE_URL}/edit"
+_URL_DELETE = f"{WHATSAPP_API_BASE_URL}/delete"
+_URL_READ = f"{WHATSAPP_API_BASE_URL}/read"
+_URL_GROUP = f"{WHATSAPP_API_BASE_URL}/group/"
+_URL_GROUP_CREATE = f"{WHATSAPP_API_BASE_URL}/group/create"
+_URL_POLL_CREATE = f"{WHATSAPP_API_BASE_URL}/poll/create"
+_URL_TYPING = f"{WHATSAPP_API_BASE_URL}/typing"
+_URL_SET_ABOUT = f"{WHATSAPP_API_BASE_URL}/set-about"
+_URL_DISAPPEARING = f"{WHATSAPP_API_BASE_URL}/disappearing"
+_URL_PRIVACY = f"{WHATSAPP_API_BASE_URL}/privacy"
+_URL_PIN = f"{WHATSAPP_API_BASE_URL}/pin"
+_URL_MUTE = f"{WHATSAPP_API_BASE_URL}/mute"
+_URL_ARCHIVE = f"{WHATSAPP_API_BASE_URL}/archive"
+_URL_BATCH = f"{WHATSAPP_API_BASE_URL}/batch"
+
+# Request bodies larger than this are gzipped (long mark_read ID lists, group
+# participant lists, poll options); smaller ones are not worth the CPU.
+_GZIP_MIN_BYTES = 1024
 
 
 class BridgeError(Exception):
@@ -31,16 +72,146 @@ class BridgeError(Exception):
     pass
 
 
-def _get_headers() -> dict[str, str]:
-    """Get request headers including API key if configured."""
-    headers = {"Content-Type": "application/json"}
+class _IdempotentAdapter(HTTPAdapter):
+    """HTTPAdapter that stamps each POST with an X-Idempotency-Key.
+
+    urllib3 retries below the adapter resend the same prepared request, so every
+    attempt of one logical call carries the same key and the bridge can replay
+    its first response instead of executing a write twice.
+    """
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        if request.method == "POST":
+            request.headers.setdefault("X-Idempotency-Key", uuid.uuid4().hex)
+        return super().send(request, *args, **kwargs)
+
+
+def _create_session() -> requests.Session:
+    """Create the pooled keep-alive session shared by all bridge calls.
+
+    Transient failures (connection errors, 502/503/504) are retried in-band with
+    exponential backoff on the pooled connection. POSTs are included because
+    each carries an idempotency key the bridge dedupes on.
+    """
+    session = requests.Session()
+    adapter = _IdempotentAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            read=2,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _create_session()
+atexit.register(_SESSION.close)
+
+
+# Group metadata changes rarely; cache successful /group/{jid} responses so
+# enriching many chats that share a group costs one round trip.
+_GROUP_CACHE_ENABLED = os.getenv("BRIDGE_GROUP_CACHE", "1") == "1"
+_GROUP_CACHE: TTLCache = TTLCache(maxsize=512, ttl=300)
+_GROUP_CACHE_LOCK = threading.RLock()
+
+
+def _cached_group(group_jid: str) -> dict[str, Any] | None:
+    """Return the cached bridge response for a group, if any."""
+    if not _GROUP_CACHE_ENABLED:
+        return None
+    with _GROUP_CACHE_LOCK:
+        return _GROUP_CACHE.get(group_jid)
+
+
+def _store_group(group_jid: str, result: dict[str, Any]) -> None:
+    """Cache a successful bridge response for a group."""
+    if _GROUP_CACHE_ENABLED and result.get("success", False):
+        with _GROUP_CACHE_LOCK:
+            _GROUP_CACHE[group_jid] = result
+
+
+def invalidate_group(group_jid: str | None = None) -> None:
+    """Drop cached metadata for a group, or for every group if no JID is given.
+
+    Call this after anything that changes a group (name, topic, participants, admins).
+    """
+    with _GROUP_CACHE_LOCK:
+        if group_jid is None:
+            _GROUP_CACHE.clear()
+        else:
+            _GROUP_CACHE.pop(group_jid, None)
+
+
+def _build_headers() -> dict[str, str]:
+    """Build the bridge request headers from the environment."""
+    headers = {"Content-Type": "application/json", "Accept-Encoding": "gzip"}
     api_key = os.getenv("API_KEY") or os.getenv("WHATSAPP_API_KEY")
-    logger.info(f"[BRIDGE-HEADERS] API_KEY loaded: {bool(api_key)}")
     if api_key:
         headers["X-API-Key"] = api_key
     return headers
 
 
+_HEADERS = _build_headers()
+_SESSION.headers.update(_HEADERS)
+logger.info(f"[BRIDGE-HEADERS] API_KEY loaded: {'X-API-Key' in _HEADERS}")
+
+
+def refresh_headers() -> dict[str, str]:
+    """Re-read the API key from the environment, e.g. after key rotation.
+
+    Returns:
+        The new header dict, also applied to the shared session.
+    """
+    global _HEADERS
+    _HEADERS = _build_headers()
+    _SESSION.headers.pop("X-API-Key", None)
+    _SESSION.headers.update(_HEADERS)
+    return _HEADERS
+
+
+def _get_headers() -> dict[str, str]:
+    """Get the cached bridge headers for callers not using the shared session."""
+    return _HEADERS
+
+
+def _request(method: str, url: str, *, payload: Any = None, timeout: float = 30, op: str) -> dict[str, Any]:
+    """Call the bridge over the shared session and decode its JSON response.
+
+    Args:
+        method: HTTP method.
+        url: Endpoint URL.
+        payload: JSON body, if any. Bodies over _GZIP_MIN_BYTES are sent gzipped.
+        timeout: Request timeout in seconds.
+        op: What the call does, for error messages (e.g. "send message").
+
+    Raises:
+        BridgeError: If the request fails or the bridge returns an error status.
+    """
+    body = None
+    headers = None
+    if payload is not None:
+        body = dumps(payload).encode()
+        if len(body) > _GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            headers = {"Content-Encoding": "gzip"}
+    try:
+        response = _SESSION.request(method, url, data=body, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+    except requests.RequestException as e:
+        logger.error("Bridge API error (%s): %s", op, e)
+        raise BridgeError(f"Failed to {op}: {e}") from e
+
+
 def send_message(recipient: str, message: str) -> dict[str, Any]:
     """Send a text message via the bridge API.
 
@@ -54,18 +225,7 @@ def send_message(recipient: str, message: str) -> dict[str, Any]:
     Raises:
         BridgeError: If API call fails.
     """
-    try:
-        response = requests.post(
-            f"{WHATSAPP_API_BASE_URL}/send",
-            json={"recipient": recipient, "message": message},
-            headers=_get_headers(),
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error("Bridge API error in send_message: %s", e)
-        raise BridgeError(f"Failed to send message: {e}") from e
+    return _request("POST", _URL_SEND, payload={"recipient": recipient, "message": message}, op="send message")
 
 
 def send_file(recipient: str, media_path: str) -> dict[str, Any]:
@@ -81,18 +241,13 @@ def send_file(recipient: str, media_path: str) -> dict[str, Any]:
     Raises:
         BridgeError: If API call fails.
     """
-    try:
-        response = requests.post(
-            f"{WHATSAPP_API_BASE_URL}/send",
-            json={"recipient": recipient, "message": "", "media_path": media_path},
-            headers=_get_headers(),
-            timeout=60,
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error("Bridge API error in send_file: %s", e)
-        raise BridgeError(f"Failed to send file: {e}") from e
+    return _request(
+        "POST",
+        _URL_SEND,
+        payload={"recipient": recipient, "message": "", "media_path": media_path},
+        timeout=60,
+        op="send file",
+    )
 
 
 def send_reaction(chat_jid: str, message_id: str, emoji: str) -> dict[str, Any]:
@@ -109,18 +264,12 @@ def send_reaction(chat_jid: str, message_id: str, emoji: str) -> dict[str, Any]:
     Raises:
         BridgeError: If API call fails.
     """
-    try:
-        response = requests.post(
-            f"{WHATSAPP_API_BASE_URL}/reaction",
-            json={"chat_jid": chat_jid, "message_id": message_id, "emoji": emoji},
-            headers=_get_headers(),
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error("Bridge API error in send_reaction: %s", e)
-        raise BridgeError(f"Failed to send reaction: {e}") from e
+    return _request(
+        "POST",
+        _URL_REACTION,
+        payload={"chat_jid": chat_jid, "message_id": message_id, "emoji": emoji},
+        op="send reaction",
+    )
 
 
 def edit_message(chat_jid: str, message_id: str, new_content: str) -> dict[str, Any]:
@@ -137,18 +286,12 @@ def edit_message(chat_jid: str, message_id: str, new_content: str) -> dict[str,
     Raises:
         BridgeError: If API call fails.
     """
-    try:
-        response = requests.post(
-            f"{WHATSAPP_API_BASE_URL}/edit",
-            json={"chat_jid": chat_jid, "message_id": message_id, "new_content": new_content},
-            headers=_get_headers(),
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error("Bridge API error in edit_message: %s", e)
-        raise BridgeError(f"Failed to edit message: {e}") from e
+    return _request(
+        "POST",
+        _URL_EDIT,
+        payload={"chat_jid": chat_jid, "message_id": message_id, "new_content": new_content},
+        op="edit message",
+    )
 
 
 def delete_message(chat_jid: str, message_id: str, sender_jid: str | None = None) -> dict[str, Any]:
@@ -165,17 +308,10 @@ def delete_message(chat_jid: str, message_id: str, sender_jid: str | None = None
     Raises:
         BridgeError: If API call fails.
     """
-    try:
-        payload: dict[str, Any] = {"chat_jid": chat_jid, "message_id": message_id}
-        if sender_jid:
-            payload["sender_jid"] = sender_jid
-
-        response = requests.post(f"{WHATSAPP_API_BASE_URL}/delete", json=payload, headers=_get_headers(), timeout=30)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error("Bridge API error in delete_message: %s", e)
-        raise BridgeError(f"Failed to delete message: {e}") from e
+    payload: dict[str, Any] = {"chat_jid": chat_jid, "message_id": message_id}
+    if sender_jid:
+        payload["sender_jid"] = sender_jid
+    return _request("POST", _URL_DELETE, payload=payload, op="delete message")
 
 
 def mark_read(chat_jid: str, message_ids: list[str], sender_jid: str | None = None) -> dict[str, Any]:
@@ -192,22 +328,17 @@ def mark_read(chat_jid: str, message_ids: list[str], sender_jid: str | None = No
     Raises:
         BridgeError: If API call fails.
     """
-    try:
-        payload: dict[str, Any] = {"chat_jid": chat_jid, "message_ids": message_ids}
-        if sender_jid:
-            payload["sender_jid"] = sender_jid
-
-        response = requests.post(f"{WHATSAPP_API_BASE_URL}/read", json=payload, headers=_get_headers(), timeout=30)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error("Bridge API error in mark_read: %s", e)
-        raise BridgeError(f"Failed to mark as read: {e}") from e
+    payload: dict[str, Any] = {"chat_jid": chat_jid, "message_ids": message_ids}
+    if sender_jid:
+        payload["sender_jid"] = sender_jid
+    return _request("POST", _URL_READ, payload=payload, op="mark as read")
 
 
 def get_group_info(group_jid: str) -> dict[str, Any]:
     """Get information about a group.
 
+    Successful responses are cached for five minutes; see invalidate_group.
+
     Args:
         group_jid: Group JID.
 
@@ -217,13 +348,45 @@ def get_group_info(group_jid: str) -> dict[str, Any]:
     Raises:
         BridgeError: If API call fails.
     """
+    cached = _cached_group(group_jid)
+    if cached is not None:
+        return cached
+    result = _request("GET", _URL_GROUP + group_jid, op="get group info")
+    _store_group(group_jid, result)
+    return result
+
+
+def get_group_info_stream(group_jid: str) -> Iterator[dict[str, Any]]:
+    """Yield a group's participants without materializing the whole response.
+
+    Uses ijson to decode ``data.participants`` incrementally from the socket when
+    it is installed; otherwise falls back to a full ``response.json()``. Bypasses
+    the group-info cache.
+
+    Args:
+        group_jid: Group JID.
+
+    Yields:
+        Participant dicts (jid, is_admin, is_owner).
+
+    Raises:
+        BridgeError: If API call fails or the body is not valid JSON (raised
+            on first iteration, or mid-stream for a truncated body).
+    """
     try:
-        response = requests.get(f"{WHATSAPP_API_BASE_URL}/group/{group_jid}", headers=_get_headers(), timeout=30)
-        response.raise_for_status()
-        return response.json()
+        with _SESSION.get(_URL_GROUP + group_jid, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            if ijson is None:
+                yield from response.json().get("data", {}).get("participants", [])
+                return
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, "data.participants.item")
     except requests.RequestException as e:
-        logger.error("Bridge API error in get_group_info: %s", e)
+        logger.error("Bridge API error in get_group_info_stream: %s", e)
         raise BridgeError(f"Failed to get group info: {e}") from e
+    except _IJSON_ERRORS as e:
+        logger.error("Invalid group info JSON in get_group_info_stream: %s", e)
+        raise BridgeError(f"Invalid group info response: {e}") from e
 
 
 def create_group(name: str, participants: list[str]) -> dict[str, Any]:
@@ -239,18 +402,7 @@ def create_group(name: str, participants: list[str]) -> dict[str, Any]:
     Raises:
         BridgeError: If API call fails.
     """
-    try:
-        response = requests.post(
-            f"{WHATSAPP_API_BASE_URL}/group/create",
-            json={"name": name, "participants": participants},
-            headers=_get_headers(),
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error("Bridge API error in create_group: %s", e)
-        raise BridgeError(f"Failed to create group: {e}") from e
+    return _request("POST", _URL_GROUP_CREATE, payload={"name": name, "participants": participants}, op="create group")
 
 
 def create_poll(chat_jid: str, question: str, options: list[str], multi_select: bool = False) -> dict[str, Any]:
@@ -268,18 +420,12 @@ def create_poll(chat_jid: str, question: str, options: list[str], multi_select:
     Raises:
         BridgeError: If API call fails.
     """
-    try:
-        response = requests.post(
-            f"{WHATSAPP_API_BASE_URL}/poll/create",
-            json={"chat_jid": chat_jid, "question": question, "options": options, "multi_select": multi_select},
-            headers=_get_headers(),
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error("Bridge API error in create_poll: %s", e)
-        raise BridgeError(f"Failed to create poll: {e}") from e
+    return _request(
+        "POST",
+        _URL_POLL_CREATE,
+        payload={"chat_jid": chat_jid, "question": question, "options": options, "multi_select": multi_select},
+        op="create poll",
+    )
 
 
 def send_typing(chat_jid: str, state: str = "typing") -> dict[str, Any]:
@@ -295,18 +441,7 @@ def send_typing(chat_jid: str, state: str = "typing") -> dict[str, Any]:
     Raises:
         BridgeError: If API call fails.
     """
-    try:
-        response = requests.post(
-            f"{WHATSAPP_API_BASE_URL}/typing",
-            json={"chat_jid": chat_jid, "state": state},
-            headers=_get_headers(),
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error("Bridge API error in send_typing: %s", e)
-        raise BridgeError(f"Failed to send typing indicator: {e}") from e
+    return _request("POST", _URL_TYPING, payload={"chat_jid": chat_jid, "state": state}, op="send typing indicator")
 
 
 def set_about_text(text: str) -> dict[str, Any]:
@@ -321,15 +456,7 @@ def set_about_text(text: str) -> dict[str, Any]:
     Raises:
         BridgeError: If API call fails.
     """
-    try:
-        response = requests.post(
-            f"{WHATSAPP_API_BASE_URL}/set-about", json={"text": text}, headers=_get_headers(), timeout=30
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error("Bridge API error in set_about_text: %s", e)
-        raise BridgeError(f"Failed to set about text: {e}") from e
+    return _request("POST", _URL_SET_ABOUT, payload={"text": text}, op="set about text")
 
 
 def set_disappearing_timer(chat_jid: str, duration: str) -> dict[str, Any]:
@@ -345,18 +472,12 @@ def set_disappearing_timer(chat_jid: str, duration: str) -> dict[str, Any]:
     Raises:
         BridgeError: If API call fails.
     """
-    try:
-        response = requests.post(
-            f"{WHATSAPP_API_BASE_URL}/disappearing",
-            json={"chat_jid": chat_jid, "duration": duration},
-            headers=_get_headers(),
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error("Bridge API error in set_disappearing_timer: %s", e)
-        raise BridgeError(f"Failed to set disappearing timer: {e}") from e
+    return _request(
+        "POST",
+        _URL_DISAPPEARING,
+        payload={"chat_jid": chat_jid, "duration": duration},
+        op="set disappearing timer",
+    )
 
 
 def get_privacy_settings() -> dict[str, Any]:
@@ -375,13 +496,7 @@ def get_privacy_settings() -> dict[str, Any]:
     Raises:
         BridgeError: If API call fails.
     """
-    try:
-        response = requests.get(f"{WHATSAPP_API_BASE_URL}/privacy", headers=_get_headers(), timeout=30)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error("Bridge API error in get_privacy_settings: %s", e)
-        raise BridgeError(f"Failed to fetch privacy settings: {e}") from e
+    return _request("GET", _URL_PRIVACY, op="fetch privacy settings")
 
 
 def pin_chat(chat_jid: str, pin: bool = True) -> dict[str, Any]:
@@ -397,15 +512,7 @@ def pin_chat(chat_jid: str, pin: bool = True) -> dict[str, Any]:
     Raises:
         BridgeError: If API call fails.
     """
-    try:
-        response = requests.post(
-            f"{WHATSAPP_API_BASE_URL}/pin", json={"chat_jid": chat_jid, "pin": pin}, headers=_get_headers(), timeout=30
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error("Bridge API error in pin_chat: %s", e)
-        raise BridgeError(f"Failed to pin chat: {e}") from e
+    return _request("POST", _URL_PIN, payload={"chat_jid": chat_jid, "pin": pin}, op="pin chat")
 
 
 def mute_chat(chat_jid: str, mute: bool = True, duration: str = "forever") -> dict[str, Any]:
@@ -422,18 +529,12 @@ def mute_chat(chat_jid: str, mute: bool = True, duration: str = "forever") -> di
     Raises:
         BridgeError: If API call fails.
     """
-    try:
-        response = requests.post(
-            f"{WHATSAPP_API_BASE_URL}/mute",
-            json={"chat_jid": chat_jid, "mute": mute, "duration": duration},
-            headers=_get_headers(),
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error("Bridge API error in mute_chat: %s", e)
-        raise BridgeError(f"Failed to mute chat: {e}") from e
+    return _request(
+        "POST",
+        _URL_MUTE,
+        payload={"chat_jid": chat_jid, "mute": mute, "duration": duration},
+        op="mute chat",
+    )
 
 
 def archive_chat(chat_jid: str, archive: bool = True) -> dict[str, Any]:
@@ -449,15 +550,132 @@ def archive_chat(chat_jid: str, archive: bool = True) -> dict[str, Any]:
     Raises:
         BridgeError: If API call fails.
     """
-    try:
-        response = requests.post(
-            f"{WHATSAPP_API_BASE_URL}/archive",
-            json={"chat_jid": chat_jid, "archive": archive},
-            headers=_get_headers(),
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error("Bridge API error in archive_chat: %s", e)
-        raise BridgeError(f"Failed to archive chat: {e}") from e
+    return _request("POST", _URL_ARCHIVE, payload={"chat_jid": chat_jid, "archive": archive}, op="archive chat")
+
+
+def batch(calls: list[dict[str, Any]]) -> dict[str, Any]:
+    """Run a chain of bridge calls in a single round trip.
+
+    Each call is {"method", "args"} plus, for dependent steps, "input_from"
+    (index of an earlier call), "arg_from_field" and "into_arg": the bridge
+    copies that field of the earlier result into this call's args. Calls run
+    in order and dependents of a failed call are skipped.
+
+    Args:
+        calls: Batch steps (send_message, send_reaction, edit_message,
+            delete_message, mark_read, get_group_info).
+
+    Returns:
+        Response with success and one result per call.
+
+    Raises:
+        BridgeError: If API call fails.
+    """
+    return _request("POST", _URL_BATCH, payload=calls, timeout=60, op="run batch")
+
+
+def batch_chain(send_message_args: dict[str, Any], send_reaction_args: dict[str, Any]) -> dict[str, Any]:
+    """Send a message and react to it in one round trip.
+
+    Args:
+        send_message_args: {"recipient", "message"} for the send.
+        send_reaction_args: {"emoji"} and optionally "chat_jid" (defaults to the recipient).
+
+    Returns:
+        Batch response; results[0] is the send, results[1] the reaction.
+
+    Raises:
+        BridgeError: If API call fails.
+    """
+    reaction_args = {"chat_jid": send_message_args["recipient"], **send_reaction_args}
+    return batch(
+        [
+            {"method": "send_message", "args": send_message_args},
+            {
+                "method": "send_reaction",
+                "args": reaction_args,
+                "input_from": 0,
+                "arg_from_field": "message_id",
+                "into_arg": "message_id",
+            },
+        ]
+    )
+
+
+def _run_batch(
+    fn: Callable[..., dict[str, Any]],
+    calls: list[tuple[Any, ...]],
+    max_concurrency: int = 8,
+    rate_per_sec: float = 50.0,
+) -> list[dict[str, Any] | BridgeError]:
+    """Run bridge calls concurrently over the shared session.
+
+    Submissions are paced to ``rate_per_sec`` so a large batch does not trip
+    the bridge's anti-ban rate limiter. Results keep the input order; a failed
+    call yields its BridgeError instead of aborting the batch.
+    """
+    interval = 1.0 / rate_per_sec if rate_per_sec > 0 else 0.0
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        futures = []
+        for args in calls:
+            futures.append(pool.submit(fn, *args))
+            if interval:
+                time.sleep(interval)
+
+        results: list[dict[str, Any] | BridgeError] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except BridgeError as e:
+                results.append(e)
+        return results
+
+
+def send_many(
+    pairs: list[tuple[str, str]], max_concurrency: int = 8, rate_per_sec: float = 50.0
+) -> list[dict[str, Any] | BridgeError]:
+    """Send several text messages concurrently.
+
+    Args:
+        pairs: (recipient, message) tuples.
+        max_concurrency: Maximum requests in flight.
+        rate_per_sec: Maximum sends started per second.
+
+    Returns:
+        One entry per pair, in order: the bridge response or the BridgeError for that send.
+    """
+    return _run_batch(send_message, pairs, max_concurrency, rate_per_sec)
+
+
+def mark_read_batch(
+    items: list[dict[str, Any]], max_concurrency: int = 8, rate_per_sec: float = 50.0
+) -> list[dict[str, Any] | BridgeError]:
+    """Mark messages as read in several chats concurrently.
+
+    Args:
+        items: Dicts with chat_jid, message_ids and optional sender_jid.
+        max_concurrency: Maximum requests in flight.
+        rate_per_sec: Maximum requests started per second.
+
+    Returns:
+        One entry per item, in order: the bridge response or the BridgeError for that chat.
+    """
+    calls = [(item["chat_jid"], item["message_ids"], item.get("sender_jid")) for item in items]
+    return _run_batch(mark_read, calls, max_concurrency, rate_per_sec)
+
+
+def react_batch(
+    items: list[dict[str, Any]], max_concurrency: int = 8, rate_per_sec: float = 50.0
+) -> list[dict[str, Any] | BridgeError]:
+    """Send several reactions concurrently.
+
+    Args:
+        items: Dicts with chat_jid, message_id and emoji.
+        max_concurrency: Maximum requests in flight.
+        rate_per_sec: Maximum requests started per second.
+
+    Returns:
+        One entry per item, in order: the bridge response or the BridgeError for that reaction.
+    """
+    calls = [(item["chat_jid"], item["message_id"], item["emoji"]) for item in items]
+    return _run_batch(send_reaction, calls, max_concurrency, rate_per_sec)
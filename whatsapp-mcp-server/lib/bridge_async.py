@@ -0,0 +1,256 @@
+"""Async bridge API client for WhatsApp Go bridge.
+
+Mirrors the core calls in ``lib.bridge`` on a shared ``httpx.AsyncClient`` so
+independent requests can be in flight at once (e.g. via ``send_many``). The
+sync API in ``lib.bridge`` stays the default for tools.
+
+Set ``BRIDGE_HTTP2=1`` (requires the ``h2`` package) to talk cleartext HTTP/2
+to the bridge, multiplexing concurrent calls over a single connection.
+"""
+
+import asyncio
+import os
+from typing import Any
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+from .bridge import BridgeError, _get_headers
+from .utils import WHATSAPP_API_BASE_URL, logger
+
+_HTTP2 = os.getenv("BRIDGE_HTTP2", "0") == "1" and _HTTP2_AVAILABLE
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared async client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        # The bridge is plain HTTP, so HTTP/2 means h2c with prior knowledge
+        _client = httpx.AsyncClient(
+            base_url=WHATSAPP_API_BASE_URL,
+            http1=not _HTTP2,
+            http2=_HTTP2,
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60),
+            timeout=30,
+        )
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared async client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def _request(
+    method: str, path: str, action: str, payload: dict[str, Any] | None = None, timeout: float = 30
+) -> dict[str, Any]:
+    """Issue one bridge request and return the decoded JSON body.
+
+    Raises:
+        BridgeError: If the request fails, the bridge returns an error status, or
+            the body is not valid JSON.
+    """
+    try:
+        response = await get_client().request(method, path, json=payload, headers=_get_headers(), timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+    except (httpx.HTTPError, ValueError) as e:
+        logger.error("Bridge API error in %s: %s", action, e)
+        raise BridgeError(f"Failed to {action.replace('_', ' ')}: {e}") from e
+
+
+async def send_message(recipient: str, message: str) -> dict[str, Any]:
+    """Send a text message via the bridge API.
+
+    Args:
+        recipient: WhatsApp JID or phone number.
+        message: Message text to send.
+
+    Returns:
+        Response with success, message_id, timestamp.
+
+    Raises:
+        BridgeError: If API call fails.
+    """
+    return await _request("POST", "/send", "send_message", {"recipient": recipient, "message": message})
+
+
+async def send_file(recipient: str, media_path: str) -> dict[str, Any]:
+    """Send a file/media via the bridge API.
+
+    Args:
+        recipient: WhatsApp JID or phone number.
+        media_path: Path to media file.
+
+    Returns:
+        Response with success, message_id, timestamp.
+
+    Raises:
+        BridgeError: If API call fails.
+    """
+    payload = {"recipient": recipient, "message": "", "media_path": media_path}
+    return await _request("POST", "/send", "send_file", payload, timeout=60)
+
+
+async def send_reaction(chat_jid: str, message_id: str, emoji: str) -> dict[str, Any]:
+    """Send a reaction to a message.
+
+    Args:
+        chat_jid: Chat JID containing the message.
+        message_id: ID of message to react to.
+        emoji: Emoji to react with (empty to remove).
+
+    Returns:
+        Response with success status.
+
+    Raises:
+        BridgeError: If API call fails.
+    """
+    payload = {"chat_jid": chat_jid, "message_id": message_id, "emoji": emoji}
+    return await _request("POST", "/reaction", "send_reaction", payload)
+
+
+async def edit_message(chat_jid: str, message_id: str, new_content: str) -> dict[str, Any]:
+    """Edit a previously sent message.
+
+    Args:
+        chat_jid: Chat JID containing the message.
+        message_id: ID of message to edit.
+        new_content: New message content.
+
+    Returns:
+        Response with success status.
+
+    Raises:
+        BridgeError: If API call fails.
+    """
+    payload = {"chat_jid": chat_jid, "message_id": message_id, "new_content": new_content}
+    return await _request("POST", "/edit", "edit_message", payload)
+
+
+async def delete_message(chat_jid: str, message_id: str, sender_jid: str | None = None) -> dict[str, Any]:
+    """Delete/revoke a message.
+
+    Args:
+        chat_jid: Chat JID containing the message.
+        message_id: ID of message to delete.
+        sender_jid: Sender JID (for admin revoking others' messages).
+
+    Returns:
+        Response with success status.
+
+    Raises:
+        BridgeError: If API call fails.
+    """
+    payload: dict[str, Any] = {"chat_jid": chat_jid, "message_id": message_id}
+    if sender_jid:
+        payload["sender_jid"] = sender_jid
+    return await _request("POST", "/delete", "delete_message", payload)
+
+
+async def mark_read(chat_jid: str, message_ids: list[str], sender_jid: str | None = None) -> dict[str, Any]:
+    """Mark messages as read.
+
+    Args:
+        chat_jid: Chat JID containing the messages.
+        message_ids: List of message IDs to mark as read.
+        sender_jid: Sender JID (required for group chats).
+
+    Returns:
+        Response with success status.
+
+    Raises:
+        BridgeError: If API call fails.
+    """
+    payload: dict[str, Any] = {"chat_jid": chat_jid, "message_ids": message_ids}
+    if sender_jid:
+        payload["sender_jid"] = sender_jid
+    return await _request("POST", "/read", "mark_read", payload)
+
+
+async def get_group_info(group_jid: str) -> dict[str, Any]:
+    """Get information about a group.
+
+    Args:
+        group_jid: Group JID.
+
+    Returns:
+        Group metadata including participants.
+
+    Raises:
+        BridgeError: If API call fails.
+    """
+    return await _request("GET", f"/group/{group_jid}", "get_group_info")
+
+
+async def create_group(name: str, participants: list[str]) -> dict[str, Any]:
+    """Create a new WhatsApp group.
+
+    Args:
+        name: Group name.
+        participants: List of participant JIDs.
+
+    Returns:
+        Response with group info.
+
+    Raises:
+        BridgeError: If API call fails.
+    """
+    return await _request("POST", "/group/create", "create_group", {"name": name, "participants": participants})
+
+
+async def create_poll(chat_jid: str, question: str, options: list[str], multi_select: bool = False) -> dict[str, Any]:
+    """Create and send a poll.
+
+    Args:
+        chat_jid: Chat to send poll to.
+        question: Poll question.
+        options: List of poll options.
+        multi_select: Allow multiple selections.
+
+    Returns:
+        Response with message_id.
+
+    Raises:
+        BridgeError: If API call fails.
+    """
+    payload = {"chat_jid": chat_jid, "question": question, "options": options, "multi_select": multi_select}
+    return await _request("POST", "/poll/create", "create_poll", payload)
+
+
+async def send_many(pairs: list[tuple[str, str]]) -> list[dict[str, Any] | BaseException]:
+    """Send several text messages concurrently.
+
+    Args:
+        pairs: (recipient, message) tuples.
+
+    Returns:
+        One entry per pair, in order: the bridge response, or the exception
+        raised for that message (a BridgeError for bridge failures).
+    """
+    return await asyncio.gather(*(send_message(r, m) for r, m in pairs), return_exceptions=True)
+
+
+async def get_group_info_many(group_jids: list[str]) -> list[dict[str, Any] | BaseException]:
+    """Fetch metadata for several groups concurrently.
+
+    Args:
+        group_jids: Group JIDs to look up.
+
+    Returns:
+        One entry per JID, in order: the group metadata, or the exception
+        raised for that group (a BridgeError for bridge failures).
+    """
+    return await asyncio.gather(*(get_group_info(jid) for jid in group_jids), return_exceptions=True)
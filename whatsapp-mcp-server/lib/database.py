@@ -2,11 +2,22 @@
 
 import re
 import sqlite3
+import threading
+from collections.abc import Callable
+from copy import deepcopy
 from datetime import datetime, timedelta
-from typing import Any
+from functools import lru_cache, wraps
+from typing import Any, Literal
 
-from .models import Chat, Contact, Message, MessageContext
-from .utils import MESSAGES_DB_PATH, WHATSAPP_DB_PATH, get_sender_name, logger
+from .enrich import enrich_batch
+from .models import Chat, Contact, ContactInfo, Message, MessageBatch, MessageContext, ReactionSummary, VelocityStats
+from .utils import MESSAGES_DB_PATH, WHATSAPP_DB_PATH, apply_sqlite_pragmas, get_sender_name, logger, normalize_jid
+
+# Compiled once at import; enrich_batch keeps its own combined URL/mention pattern
+_URL_RE = re.compile(r"https?://[^\s]+")
+
+# Rows per IN (...) query; keeps well under SQLite's host-parameter limit (999 on older builds)
+_IN_CHUNK_SIZE = 500
 
 
 class DatabaseError(Exception):
@@ -15,6 +26,87 @@ class DatabaseError(Exception):
     pass
 
 
+# Connections are cached per thread and per path, so repeated calls skip the
+# open/schema-read cost. Keying on the path keeps monkeypatched test DBs apart.
+_local = threading.local()
+_open_conns: list[sqlite3.Connection] = []
+_open_conns_lock = threading.Lock()
+_conn_generation = 0
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    """Return this thread's cached connection to ``path``, opening it on first use."""
+    if getattr(_local, "generation", None) != _conn_generation:
+        _local.conns = {}
+        _local.generation = _conn_generation
+    conn = _local.conns.get(path)
+    if conn is None:
+        # check_same_thread=False only so _reset_conns can close it from another thread.
+        # The connection lives on, so a larger statement cache keeps hot queries compiled.
+        conn = sqlite3.connect(path, check_same_thread=False, cached_statements=256)
+        apply_sqlite_pragmas(conn)
+        _local.conns[path] = conn
+        with _open_conns_lock:
+            _open_conns.append(conn)
+    return conn
+
+
+def _reset_conns() -> None:
+    """Close every cached connection; threads reopen on their next call."""
+    global _conn_generation
+    with _open_conns_lock:
+        _conn_generation += 1
+        for conn in _open_conns:
+            conn.close()
+        _open_conns.clear()
+    with _QUERY_CACHE_LOCK:
+        _QUERY_CACHE.clear()
+    _nickname_jids_normalized.clear()
+
+
+# Results of list_messages keyed on (function, arguments, connection, data
+# version). PRAGMA data_version changes whenever another connection (the bridge,
+# whatsapp.py) commits to messages.db, so a hit never serves rows older than the
+# DB; writes through our own connection clear the cache instead. list_chats is
+# not cached: its silent/recent/today/velocity fields depend on the clock.
+_QUERY_CACHE: dict[tuple[Any, ...], Any] = {}
+_QUERY_CACHE_LOCK = threading.Lock()
+_QUERY_CACHE_SIZE = 256
+
+
+def _versioned_cache(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Memoize a messages.db read until the database changes.
+
+    Callers always get their own copy, so mutating a result cannot leak into
+    later hits.
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            conn = _connect(MESSAGES_DB_PATH)
+            version = conn.execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error:
+            return func(*args, **kwargs)
+
+        # data_version is only comparable on the same connection
+        key = (func.__name__, args, tuple(sorted(kwargs.items())), id(conn), _conn_generation, version)
+        with _QUERY_CACHE_LOCK:
+            cached = _QUERY_CACHE.get(key)
+        if cached is not None:
+            return deepcopy(cached)
+
+        result = func(*args, **kwargs)
+        with _QUERY_CACHE_LOCK:
+            if len(_QUERY_CACHE) >= _QUERY_CACHE_SIZE:
+                # dicts keep insertion order: drop the oldest entry
+                del _QUERY_CACHE[next(iter(_QUERY_CACHE))]
+            _QUERY_CACHE[key] = deepcopy(result)
+        return result
+
+    return wrapper
+
+
 def get_message_character_count(content: str) -> int:
     """Get character count in message content.
 
@@ -38,9 +130,15 @@ def get_message_word_count(content: str) -> int:
     """
     if not content:
         return 0
-    # Split on whitespace, filter empty strings
-    words = [w for w in content.split() if w]
-    return len(words)
+    return _word_count(content)
+
+
+@lru_cache(maxsize=8192)
+def _word_count(content: str) -> int:
+    # Memoized: forwards and repeated captions produce identical content.
+    # str.split() runs in C and beats counting finditer(r"\S+") matches
+    # several times over, even though it builds the list.
+    return len(content.split())
 
 
 def extract_urls(content: str) -> list[str]:
@@ -52,14 +150,19 @@ def extract_urls(content: str) -> list[str]:
     Returns:
         List of URLs found.
     """
-    if not content:
+    # Most messages carry no link: a substring test is far cheaper than the regex
+    if not content or "://" not in content:
         return []
-    # Simple URL pattern matching
-    url_pattern = r"https?://[^\s]+"
-    return re.findall(url_pattern, content)
+    # Fresh list per call so callers cannot mutate the cached result
+    return list(_find_urls(content))
+
 
+@lru_cache(maxsize=8192)
+def _find_urls(content: str) -> tuple[str, ...]:
+    return tuple(_URL_RE.findall(content))
 
-def get_contact_info(jid: str) -> dict[str, Any] | None:
+
+def get_contact_info(jid: str) -> ContactInfo | None:
     """Get contact information by JID.
 
     Args:
@@ -72,7 +175,7 @@ def get_contact_info(jid: str) -> dict[str, Any] | None:
         return None
 
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
+        conn = _connect(MESSAGES_DB_PATH)
         cursor = conn.cursor()
 
         # Try to get nickname first
@@ -87,9 +190,7 @@ def get_contact_info(jid: str) -> dict[str, Any] | None:
             if parts:
                 phone_num = parts[0]
 
-        conn.close()
-
-        contact_info = {"jid": jid}
+        contact_info: ContactInfo = {"jid": jid}
         if phone_num:
             contact_info["phone_number"] = phone_num
         if nickname:
@@ -102,7 +203,7 @@ def get_contact_info(jid: str) -> dict[str, Any] | None:
         return None
 
 
-def get_reaction_summary(message_id: str, chat_jid: str) -> dict[str, int]:
+def get_reaction_summary(message_id: str, chat_jid: str) -> ReactionSummary:
     """Get reaction summary for a message.
 
     Args:
@@ -189,6 +290,88 @@ def get_media_stats(chat_jid: str, conn: sqlite3.Connection) -> tuple[dict[str,
         return ({}, [])
 
 
+def get_most_active_member_batch(chat_jids: list[str], conn: sqlite3.Connection) -> dict[str, tuple[str | None, int]]:
+    """Get the most active member of many chats with one windowed query per chunk.
+
+    Args:
+        chat_jids: Chat JIDs.
+        conn: Database connection.
+
+    Returns:
+        Mapping of chat JID to (member_name, message_count); (None, 0) when unknown.
+    """
+    members: dict[str, tuple[str | None, int]] = dict.fromkeys(chat_jids, (None, 0))
+    try:
+        cursor = conn.cursor()
+        for start in range(0, len(chat_jids), _IN_CHUNK_SIZE):
+            chunk = chat_jids[start : start + _IN_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"""SELECT chat_jid, sender_name, count FROM (
+                       SELECT chat_jid, sender_name, COUNT(*) AS count,
+                              ROW_NUMBER() OVER (PARTITION BY chat_jid ORDER BY COUNT(*) DESC) AS rn
+                       FROM messages
+                       WHERE chat_jid IN ({placeholders}) AND sender_name != '' AND sender_name IS NOT NULL
+                       GROUP BY chat_jid, sender
+                   ) WHERE rn = 1""",
+                chunk,
+            )
+            for chat_jid, name, count in cursor.fetchall():
+                members[chat_jid] = (name, count)
+    except sqlite3.Error as e:
+        logger.error("Database error in get_most_active_member_batch: %s", e)
+    return members
+
+
+def get_media_stats_batch(
+    chat_jids: list[str], conn: sqlite3.Connection
+) -> dict[str, tuple[dict[str, int], list[str]]]:
+    """Get media statistics for many chats with two queries per chunk.
+
+    Args:
+        chat_jids: Chat JIDs.
+        conn: Database connection.
+
+    Returns:
+        Mapping of chat JID to (media_count_by_type, recent_media_list), as
+        returned by get_media_stats.
+    """
+    stats: dict[str, tuple[dict[str, int], list[str]]] = {jid: ({}, []) for jid in chat_jids}
+    try:
+        cursor = conn.cursor()
+        for start in range(0, len(chat_jids), _IN_CHUNK_SIZE):
+            chunk = chat_jids[start : start + _IN_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"""SELECT chat_jid, media_type, COUNT(*)
+                    FROM messages
+                    WHERE chat_jid IN ({placeholders}) AND media_type != '' AND media_type IS NOT NULL
+                    GROUP BY chat_jid, media_type""",
+                chunk,
+            )
+            for chat_jid, media_type, count in cursor.fetchall():
+                stats[chat_jid][0][media_type] = count
+
+            # Five newest media filenames per chat
+            cursor.execute(
+                f"""SELECT chat_jid, filename FROM (
+                       SELECT chat_jid, filename,
+                              ROW_NUMBER() OVER (PARTITION BY chat_jid ORDER BY timestamp DESC) AS rn
+                       FROM messages
+                       WHERE chat_jid IN ({placeholders}) AND media_type != '' AND media_type IS NOT NULL
+                         AND filename != '' AND filename IS NOT NULL
+                   ) WHERE rn <= 5
+                   ORDER BY chat_jid, rn""",
+                chunk,
+            )
+            for chat_jid, filename in cursor.fetchall():
+                stats[chat_jid][1].append(filename)
+    except sqlite3.Error as e:
+        logger.error("Database error in get_media_stats_batch: %s", e)
+        return {jid: ({}, []) for jid in chat_jids}
+    return stats
+
+
 def get_chat_statistics(chat_jid: str, conn: sqlite3.Connection) -> tuple[int, int, int]:
     """Get message statistics for a chat.
 
@@ -223,6 +406,61 @@ def get_chat_statistics(chat_jid: str, conn: sqlite3.Connection) -> tuple[int, i
     return total, today, week
 
 
+def get_chat_statistics_batch(chat_jids: list[str], conn: sqlite3.Connection) -> dict[str, tuple[int, int, int]]:
+    """Get message statistics for many chats with one aggregate query per chunk.
+
+    Reads the bridge's per-day ``chat_day_counts`` buckets when the table exists
+    (a few rows per chat), otherwise aggregates ``messages`` directly. With
+    buckets, "last 7 days" is today plus the six calendar days before it. Bucket
+    days are the date part of the bridge's timestamps (the bridge's time zone)
+    while the bounds use this host's local date, so the two should share a zone.
+
+    Args:
+        chat_jids: Chat JIDs.
+        conn: Database connection.
+
+    Returns:
+        Mapping of chat JID to (total_messages, messages_today, messages_last_7_days).
+        Chats without messages map to zeros.
+    """
+    cursor = conn.cursor()
+    now = datetime.now()
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'chat_day_counts'")
+    if cursor.fetchone():
+        sql = """
+            SELECT chat_jid, SUM(count),
+                   SUM(CASE WHEN day >= ? THEN count ELSE 0 END),
+                   SUM(CASE WHEN day >= ? THEN count ELSE 0 END)
+            FROM chat_day_counts
+            WHERE chat_jid IN ({placeholders})
+            GROUP BY chat_jid
+        """
+        bounds = (now.date().isoformat(), (now - timedelta(days=6)).date().isoformat())
+    else:
+        sql = """
+            SELECT chat_jid, COUNT(*),
+                   SUM(CASE WHEN timestamp >= ? THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN timestamp >= ? THEN 1 ELSE 0 END)
+            FROM messages
+            WHERE chat_jid IN ({placeholders})
+            GROUP BY chat_jid
+        """
+        bounds = (
+            now.replace(hour=0, minute=0, second=0, microsecond=0).isoformat(),
+            (now - timedelta(days=7)).isoformat(),
+        )
+
+    stats = dict.fromkeys(chat_jids, (0, 0, 0))
+    for start in range(0, len(chat_jids), _IN_CHUNK_SIZE):
+        chunk = chat_jids[start : start + _IN_CHUNK_SIZE]
+        cursor.execute(sql.format(placeholders=",".join("?" * len(chunk))), (*bounds, *chunk))
+        for chat_jid, total, today, week in cursor.fetchall():
+            stats[chat_jid] = (total, today, week)
+
+    return stats
+
+
+@_versioned_cache
 def list_messages(
     after: str | None = None,
     before: str | None = None,
@@ -234,7 +472,8 @@ def list_messages(
     include_context: bool = False,
     context_before: int = 1,
     context_after: int = 1,
-) -> list[dict[str, Any]]:
+    as_batch: bool = False,
+) -> list[dict[str, Any]] | MessageBatch:
     """Get messages matching the specified criteria.
 
     Args:
@@ -248,16 +487,17 @@ def list_messages(
         include_context: Include surrounding messages.
         context_before: Messages to include before each match.
         context_after: Messages to include after each match.
+        as_batch: Return the matches as a columnar MessageBatch for aggregate
+            analytics instead of dictionaries (context is not expanded).
 
     Returns:
-        List of message dictionaries.
+        List of message dictionaries, or a MessageBatch when ``as_batch`` is set.
 
     Raises:
         DatabaseError: If database query fails.
     """
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
-        cursor = conn.cursor()
+        conn = _connect(MESSAGES_DB_PATH)
 
         query_parts = [
             "SELECT messages.timestamp, messages.sender, chats.name, "
@@ -267,7 +507,9 @@ def list_messages(
             "messages.quoted_sender_name, messages.reply_to_message_id, "
             "messages.edit_count, messages.is_edited, messages.is_forwarded, "
             "messages.forwarded_from, messages.is_system_message, "
-            "messages.system_message_type FROM messages"
+            "messages.system_message_type, "
+            "LENGTH(COALESCE(messages.content, '')) AS character_count, "
+            "(chats.jid LIKE '%@g.us') AS is_group FROM messages"
         ]
         query_parts.append("JOIN chats ON messages.chat_jid = chats.jid")
         where_clauses = []
@@ -309,43 +551,49 @@ def list_messages(
         query_parts.append("LIMIT ? OFFSET ?")
         params.extend([limit, offset])
 
-        cursor.execute(" ".join(query_parts), tuple(params))
-        messages = cursor.fetchall()
+        messages = conn.execute(" ".join(query_parts), params).fetchall()
+
+        # character_count and is_group come from the SELECT; word counts, URLs
+        # and mentions need Python's whitespace/regex semantics, so they are
+        # derived for the whole page in one pass
+        _, word_counts, url_lists, mention_lists = enrich_batch([msg[3] for msg in messages])
 
         result = []
-        for msg in messages:
-            # Unpack message tuple - indices match the SELECT statement
-            timestamp_str = msg[0]
-            sender = msg[1]
-            chat_name = msg[2]
-            content = msg[3]
-            is_from_me = msg[4]
-            chat_jid = msg[5]
-            msg_id = msg[6]
-            media_type = msg[7]
-            filename = msg[8]
-            file_length = msg[9]
-            sender_name = msg[10]
-            quoted_message_id = msg[11]
-            quoted_sender_name = msg[12]
-            reply_to_message_id = msg[13]
-            edit_count = msg[14]
-            is_edited = msg[15]
-            is_forwarded = msg[16]
-            forwarded_from = msg[17]
-            is_system_message = msg[18]
-            system_message_type = msg[19]
+        for (
+            (
+                timestamp_str,
+                sender,
+                chat_name,
+                content,
+                is_from_me,
+                chat_jid,
+                msg_id,
+                media_type,
+                filename,
+                file_length,
+                sender_name,
+                quoted_message_id,
+                quoted_sender_name,
+                reply_to_message_id,
+                edit_count,
+                is_edited,
+                is_forwarded,
+                forwarded_from,
+                is_system_message,
+                system_message_type,
+                character_count,
+                is_group,
+            ),
+            word_count,
+            url_list,
+            mention_list,
+        ) in zip(messages, word_counts, url_lists, mention_lists):
+            # Row tuples unpack straight into locals; order matches the SELECT
 
             # Use stored sender_name if available, otherwise fallback to lookup
             if not sender_name:
                 sender_name = get_sender_name(sender)
 
-            # Compute metadata fields
-            char_count = get_message_character_count(content)
-            word_count = get_message_word_count(content)
-            urls = extract_urls(content)
-            is_group = chat_jid.endswith("@g.us")
-
             # Get sender contact info
             sender_contact_info = get_contact_info(sender) if sender else None
 
@@ -364,10 +612,11 @@ def list_messages(
                 filename=filename,
                 file_length=file_length,
                 sender_name=sender_name,
-                character_count=char_count,
+                character_count=character_count,
                 word_count=word_count,
-                url_list=urls,
-                is_group=is_group,
+                url_list=url_list,
+                mentions=mention_list,
+                is_group=bool(is_group),
                 sender_contact_info=sender_contact_info,
                 reaction_summary=reaction_summary,
                 quoted_message_id=quoted_message_id,
@@ -383,6 +632,9 @@ def list_messages(
             )
             result.append(message)
 
+        if as_batch:
+            return MessageBatch.from_messages(result)
+
         if include_context and result:
             messages_with_context = []
             seen_ids: set[str] = set()
@@ -406,9 +658,6 @@ def list_messages(
     except sqlite3.Error as e:
         logger.error("Database error in list_messages: %s", e)
         raise DatabaseError(f"Failed to list messages: {e}") from e
-    finally:
-        if "conn" in locals():
-            conn.close()
 
 
 def get_message_context(message_id: str, before: int = 5, after: int = 5) -> MessageContext:
@@ -427,7 +676,7 @@ def get_message_context(message_id: str, before: int = 5, after: int = 5) -> Mes
         ValueError: If message not found.
     """
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
+        conn = _connect(MESSAGES_DB_PATH)
         cursor = conn.cursor()
 
         cursor.execute(
@@ -454,6 +703,7 @@ def get_message_context(message_id: str, before: int = 5, after: int = 5) -> Mes
         char_count = get_message_character_count(msg_data[3])
         word_count = get_message_word_count(msg_data[3])
         urls = extract_urls(msg_data[3])
+        # Context rows come from the same chat, so this also applies to them
         is_group = msg_data[5].endswith("@g.us")
 
         target_message = Message(
@@ -489,13 +739,12 @@ def get_message_context(message_id: str, before: int = 5, after: int = 5) -> Mes
             (msg_data[7], msg_data[0], before),
         )
 
+        before_rows = cursor.fetchall()
+        char_counts, word_counts, url_lists, _ = enrich_batch([msg[3] for msg in before_rows])
+
         before_messages = []
-        for msg in cursor.fetchall():
+        for i, msg in enumerate(before_rows):
             sender_name = msg[10] if msg[10] else get_sender_name(msg[1])
-            char_count = get_message_character_count(msg[3])
-            word_count = get_message_word_count(msg[3])
-            urls = extract_urls(msg[3])
-            is_group = msg[5].endswith("@g.us")
 
             before_messages.append(
                 Message(
@@ -510,9 +759,9 @@ def get_message_context(message_id: str, before: int = 5, after: int = 5) -> Mes
                     filename=msg[8],
                     file_length=msg[9],
                     sender_name=sender_name,
-                    character_count=char_count,
-                    word_count=word_count,
-                    url_list=urls,
+                    character_count=char_counts[i],
+                    word_count=word_counts[i],
+                    url_list=url_lists[i],
                     is_group=is_group,
                 )
             )
@@ -532,13 +781,12 @@ def get_message_context(message_id: str, before: int = 5, after: int = 5) -> Mes
             (msg_data[7], msg_data[0], after),
         )
 
+        after_rows = cursor.fetchall()
+        char_counts, word_counts, url_lists, _ = enrich_batch([msg[3] for msg in after_rows])
+
         after_messages = []
-        for msg in cursor.fetchall():
+        for i, msg in enumerate(after_rows):
             sender_name = msg[10] if msg[10] else get_sender_name(msg[1])
-            char_count = get_message_character_count(msg[3])
-            word_count = get_message_word_count(msg[3])
-            urls = extract_urls(msg[3])
-            is_group = msg[5].endswith("@g.us")
 
             after_messages.append(
                 Message(
@@ -553,9 +801,9 @@ def get_message_context(message_id: str, before: int = 5, after: int = 5) -> Mes
                     filename=msg[8],
                     file_length=msg[9],
                     sender_name=sender_name,
-                    character_count=char_count,
-                    word_count=word_count,
-                    url_list=urls,
+                    character_count=char_counts[i],
+                    word_count=word_counts[i],
+                    url_list=url_lists[i],
                     is_group=is_group,
                 )
             )
@@ -565,9 +813,6 @@ def get_message_context(message_id: str, before: int = 5, after: int = 5) -> Mes
     except sqlite3.Error as e:
         logger.error("Database error in get_message_context: %s", e)
         raise DatabaseError(f"Failed to get message context: {e}") from e
-    finally:
-        if "conn" in locals():
-            conn.close()
 
 
 def list_chats(
@@ -590,7 +835,7 @@ def list_chats(
         List of chat dictionaries.
     """
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
+        conn = _connect(MESSAGES_DB_PATH)
         cursor = conn.cursor()
 
         query_sql = """
@@ -625,6 +870,13 @@ def list_chats(
 
         cursor.execute(query_sql, tuple(params))
         chats = cursor.fetchall()
+        chat_jids = [chat[0] for chat in chats]
+        chat_stats = get_chat_statistics_batch(chat_jids, conn)
+        active_members = get_most_active_member_batch(chat_jids, conn)
+        media_stats = get_media_stats_batch(chat_jids, conn)
+        # One clock read per page; aware timestamps subtract fine across zones
+        now_naive = datetime.now()
+        now_aware = now_naive.astimezone()
 
         result = []
         for chat in chats:
@@ -639,17 +891,17 @@ def list_chats(
                 last_sender_name = chat[7] if chat[7] else get_sender_name(chat[5])
 
             # Get chat statistics
-            total_msgs, msgs_today, msgs_week = get_chat_statistics(chat[0], conn)
+            total_msgs, msgs_today, msgs_week = chat_stats[chat[0]]
 
             # Determine chat type and is_group
             is_group_chat = chat[0].endswith("@g.us")
             chat_type = "group" if is_group_chat else "individual"
 
             # Get most active member (Tier 2)
-            most_active_name, most_active_count = get_most_active_member(chat[0], conn)
+            most_active_name, most_active_count = active_members[chat[0]]
 
             # Get media stats (Tier 2)
-            media_count_by_type, recent_media = get_media_stats(chat[0], conn)
+            media_count_by_type, recent_media = media_stats[chat[0]]
 
             # Get last sender contact info (Tier 1)
             last_sender_contact_info = None
@@ -657,25 +909,25 @@ def list_chats(
                 last_sender_contact_info = get_contact_info(chat[5])
 
             # Calculate message velocity (Tier 2)
-            message_velocity = {}
+            message_velocity: VelocityStats | None = None
             if msgs_week > 0:
-                message_velocity["messages_per_day"] = round(msgs_week / 7, 2)
                 # Determine trend direction
                 avg_per_day = msgs_week / 7
+                trend: Literal["increasing", "decreasing", "stable"]
                 if msgs_today > avg_per_day * 1.2:
-                    message_velocity["trend_direction"] = "increasing"
+                    trend = "increasing"
                 elif msgs_today < avg_per_day * 0.8:
-                    message_velocity["trend_direction"] = "decreasing"
+                    trend = "decreasing"
                 else:
-                    message_velocity["trend_direction"] = "stable"
+                    trend = "stable"
+                message_velocity = VelocityStats(messages_per_day=round(avg_per_day, 2), trend_direction=trend)
 
             # Calculate time metrics (Tier 2)
             last_msg_time = datetime.fromisoformat(chat[2]) if chat[2] else None
             silent_duration = None
             is_recently_active = False
             if last_msg_time:
-                now = datetime.now(last_msg_time.tzinfo) if last_msg_time.tzinfo else datetime.now()
-                delta = now - last_msg_time
+                delta = (now_aware if last_msg_time.tzinfo else now_naive) - last_msg_time
                 silent_duration = int(delta.total_seconds())
                 is_recently_active = delta.total_seconds() < 24 * 3600
 
@@ -709,9 +961,6 @@ def list_chats(
     except sqlite3.Error as e:
         logger.error("Database error in list_chats: %s", e)
         raise DatabaseError(f"Failed to list chats: {e}") from e
-    finally:
-        if "conn" in locals():
-            conn.close()
 
 
 def get_contact_by_jid(jid: str) -> Contact | None:
@@ -724,7 +973,7 @@ def get_contact_by_jid(jid: str) -> Contact | None:
         Contact object if found, None otherwise.
     """
     try:
-        conn = sqlite3.connect(WHATSAPP_DB_PATH)
+        conn = _connect(WHATSAPP_DB_PATH)
         cursor = conn.cursor()
 
         cursor.execute(
@@ -760,9 +1009,35 @@ def get_contact_by_jid(jid: str) -> Contact | None:
     except sqlite3.Error as e:
         logger.error("Database error in get_contact_by_jid: %s", e)
         return None
-    finally:
-        if "conn" in locals():
-            conn.close()
+
+
+# Databases whose contact_nicknames rows have been rewritten to canonical JIDs
+_nickname_jids_normalized: set[str] = set()
+
+
+def _normalize_nickname_jids(conn: sqlite3.Connection, path: str) -> None:
+    """Rewrite nicknames stored under a non-canonical JID, once per database.
+
+    Nicknames used to be keyed on whatever form the caller passed ("+6012...",
+    a bare number, an upper-case server). Each such row is moved to its
+    normalize_jid() form; where a canonical row already exists it was written
+    later, so it wins and the old row is dropped.
+    """
+    if path in _nickname_jids_normalized:
+        return
+    stale = [
+        (canonical, jid)
+        for (jid,) in conn.execute("SELECT jid FROM contact_nicknames").fetchall()
+        if (canonical := normalize_jid(jid)) != jid
+    ]
+    if stale:
+        with conn:
+            conn.executemany("UPDATE OR IGNORE contact_nicknames SET jid = ? WHERE jid = ?", stale)
+            conn.executemany("DELETE FROM contact_nicknames WHERE jid = ?", [(jid,) for _, jid in stale])
+        with _QUERY_CACHE_LOCK:
+            _QUERY_CACHE.clear()
+        logger.info("Normalized %d contact nickname JID(s)", len(stale))
+    _nickname_jids_normalized.add(path)
 
 
 def get_contact_nickname(jid: str) -> str | None:
@@ -774,8 +1049,10 @@ def get_contact_nickname(jid: str) -> str | None:
     Returns:
         Nickname if set, None otherwise.
     """
+    jid = normalize_jid(jid)
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
+        conn = _connect(MESSAGES_DB_PATH)
+        _normalize_nickname_jids(conn, MESSAGES_DB_PATH)
         cursor = conn.cursor()
 
         cursor.execute(
@@ -790,9 +1067,6 @@ def get_contact_nickname(jid: str) -> str | None:
 
     except sqlite3.Error:
         return None
-    finally:
-        if "conn" in locals():
-            conn.close()
 
 
 def set_contact_nickname(jid: str, nickname: str) -> dict[str, Any]:
@@ -805,8 +1079,10 @@ def set_contact_nickname(jid: str, nickname: str) -> dict[str, Any]:
     Returns:
         Result dictionary with success status.
     """
+    jid = normalize_jid(jid)
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
+        conn = _connect(MESSAGES_DB_PATH)
+        _normalize_nickname_jids(conn, MESSAGES_DB_PATH)
         cursor = conn.cursor()
 
         cursor.execute(
@@ -818,21 +1094,57 @@ def set_contact_nickname(jid: str, nickname: str) -> dict[str, Any]:
         )
 
         conn.commit()
+        with _QUERY_CACHE_LOCK:
+            _QUERY_CACHE.clear()
 
         return {"success": True, "jid": jid, "nickname": nickname, "updated_at": datetime.now().isoformat()}
 
     except sqlite3.Error as e:
+        if "conn" in locals():
+            conn.rollback()
         logger.error("Database error in set_contact_nickname: %s", e)
         raise DatabaseError(f"Failed to set nickname: {e}") from e
-    finally:
-        if "conn" in locals():
-            conn.close()
+
+
+# Module constant so every call passes the identical string and reuses the
+# cached connection's compiled statement; ?1 binds the one pattern to all four tests.
+_SEARCH_CONTACTS_SQL = """
+    SELECT their_jid, first_name, full_name, push_name, business_name
+    FROM whatsmeow_contacts
+    WHERE LOWER(first_name) LIKE LOWER(?1)
+       OR LOWER(full_name) LIKE LOWER(?1)
+       OR LOWER(push_name) LIKE LOWER(?1)
+       OR their_jid LIKE ?1
+    LIMIT 50
+"""
+
+
+def _fetch_nicknames(cursor: sqlite3.Cursor, jids: list[str]) -> dict[str, str]:
+    """Look up nicknames for many JIDs with IN-clause queries.
+
+    JIDs are sent in chunks of ``_IN_CHUNK_SIZE`` so the placeholder count stays
+    under SQLite's host-parameter limit.
+
+    Args:
+        cursor: Cursor on the messages database.
+        jids: JIDs to look up.
+
+    Returns:
+        Mapping of JID to nickname for the JIDs that have one.
+    """
+    nicknames: dict[str, str] = {}
+    for start in range(0, len(jids), _IN_CHUNK_SIZE):
+        chunk = jids[start : start + _IN_CHUNK_SIZE]
+        placeholders = ",".join("?" * len(chunk))
+        cursor.execute(f"SELECT jid, nickname FROM contact_nicknames WHERE jid IN ({placeholders})", chunk)
+        nicknames.update(cursor.fetchall())
+    return nicknames
 
 
 def search_contacts(query: str) -> list[dict[str, Any]]:
     """Search contacts by name or phone number.
 
-    Optimized to avoid N+1 queries by JOINing contact_nicknames table.
+    Optimized to avoid N+1 queries by fetching nicknames with one IN query.
 
     Args:
         query: Search term.
@@ -841,48 +1153,21 @@ def search_contacts(query: str) -> list[dict[str, Any]]:
         List of matching contact dictionaries.
     """
     try:
-        whatsapp_conn = sqlite3.connect(WHATSAPP_DB_PATH)
+        whatsapp_conn = _connect(WHATSAPP_DB_PATH)
         whatsapp_cursor = whatsapp_conn.cursor()
 
         # Query WhatsApp contacts
-        whatsapp_cursor.execute(
-            """
-            SELECT their_jid, first_name, full_name, push_name, business_name
-            FROM whatsmeow_contacts
-            WHERE LOWER(first_name) LIKE LOWER(?)
-               OR LOWER(full_name) LIKE LOWER(?)
-               OR LOWER(push_name) LIKE LOWER(?)
-               OR their_jid LIKE ?
-            LIMIT 50
-        """,
-            (f"%{query}%", f"%{query}%", f"%{query}%", f"%{query}%"),
-        )
+        whatsapp_cursor.execute(_SEARCH_CONTACTS_SQL, (f"%{query}%",))
 
         contacts = whatsapp_cursor.fetchall()
-        whatsapp_conn.close()
 
         # Now fetch nicknames with a single query (JOIN, not N+1)
         if not contacts:
             return []
 
-        jids = [row[0] for row in contacts]
-
-        # Use messages DB for nicknames (single query with IN clause)
-        messages_conn = sqlite3.connect(MESSAGES_DB_PATH)
-        messages_cursor = messages_conn.cursor()
-
-        # Use parameter placeholders to avoid SQL injection
-        placeholders = ",".join("?" * len(jids))
-        messages_cursor.execute(
-            f"""
-            SELECT jid, nickname FROM contact_nicknames
-            WHERE jid IN ({placeholders})
-        """,
-            jids,
-        )
-
-        nickname_map = {row[0]: row[1] for row in messages_cursor.fetchall()}
-        messages_conn.close()
+        # Use messages DB for nicknames (IN-clause lookup, not one query per contact)
+        messages_conn = _connect(MESSAGES_DB_PATH)
+        nickname_map = _fetch_nicknames(messages_conn.cursor(), [row[0] for row in contacts])
 
         # Build results
         results = []
@@ -908,8 +1193,3 @@ def search_contacts(query: str) -> list[dict[str, Any]]:
     except sqlite3.Error as e:
         logger.error("Database error in search_contacts: %s", e)
         raise DatabaseError(f"Failed to search contacts: {e}") from e
-    finally:
-        if "whatsapp_conn" in locals():
-            whatsapp_conn.close()
-        if "messages_conn" in locals():
-            messages_conn.close()
@@ -0,0 +1,49 @@
+"""Batch enrichment of derived message fields (character/word counts, URLs, mentions)."""
+
+import re
+from bisect import bisect_right
+
+# One combined pattern so a whole batch is scanned in a single pass. The NUL
+# separator used to join contents is excluded so matches never span messages.
+_TOKEN_PATTERN = re.compile(r"(?P<url>https?://[^\s\x00]+)|(?P<mention>(?<!\w)@\w+)")
+_SEPARATOR = "\x00"
+
+
+def enrich_batch(contents: list[str | None]) -> tuple[list[int], list[int], list[list[str]], list[list[str]]]:
+    """Compute derived fields for many message bodies at once.
+
+    Contents are joined into one buffer and scanned with a single regex pass;
+    each match is mapped back to its message via the start offsets.
+
+    Args:
+        contents: Message bodies (None/empty allowed).
+
+    Returns:
+        Tuple of (character_counts, word_counts, url_lists, mention_lists),
+        each aligned with ``contents``.
+    """
+    texts = [c or "" for c in contents]
+    char_counts = [len(t) for t in texts]
+    word_counts = [len(t.split()) for t in texts]
+    urls: list[list[str]] = [[] for _ in texts]
+    mentions: list[list[str]] = [[] for _ in texts]
+
+    offsets: list[int] = []
+    position = 0
+    for length in char_counts:
+        offsets.append(position)
+        position += length + 1
+
+    buffer = _SEPARATOR.join(texts)
+    # Skip the regex pass entirely for pages with no link or mention candidates
+    if "://" not in buffer and "@" not in buffer:
+        return char_counts, word_counts, urls, mentions
+
+    for match in _TOKEN_PATTERN.finditer(buffer):
+        index = bisect_right(offsets, match.start()) - 1
+        if match.lastgroup == "url":
+            urls[index].append(match.group())
+        else:
+            mentions[index].append(match.group())
+
+    return char_counts, word_counts, urls, mentions
@@ -1,11 +1,35 @@
 """Data models for WhatsApp MCP server."""
 
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal, NotRequired, TypedDict
 
 
-@dataclass
+class ContactInfo(TypedDict):
+    """Contact summary attached to messages and chats (see database.get_contact_info)."""
+
+    jid: str
+    phone_number: NotRequired[str]
+    name: NotRequired[str]
+    nickname: NotRequired[str]
+
+
+class VelocityStats(TypedDict):
+    """Seven-day message velocity for a chat."""
+
+    messages_per_day: float
+    trend_direction: Literal["increasing", "decreasing", "stable"]
+
+
+# Emoji -> reaction count
+ReactionSummary = Mapping[str, int]
+
+
+@dataclass(slots=True)
 class Message:
     """Represents a WhatsApp message."""
 
@@ -21,16 +45,16 @@ class Message:
     filename: str | None = None
     file_length: int | None = None
     # Phase 1 metadata fields
-    sender_contact_info: dict[str, Any] | None = None
+    sender_contact_info: ContactInfo | None = None
     character_count: int | None = None
     word_count: int | None = None
-    url_list: list[str] = field(default_factory=list)
-    mentions: list[str] = field(default_factory=list)
+    url_list: Sequence[str] = ()
+    mentions: Sequence[str] = ()
     reply_to_message_id: str | None = None
     quoted_message_id: str | None = None
     quoted_sender_name: str | None = None
     quoted_text_preview: str | None = None
-    reaction_summary: dict[str, Any] = field(default_factory=dict)
+    reaction_summary: ReactionSummary | None = None
     edit_count: int | None = None
     is_edited: bool = False
     is_forwarded: bool = False
@@ -49,14 +73,16 @@ class Message:
         result = {
             "id": self.id,
             "chat_jid": self.chat_jid,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
+            "timestamp": self.timestamp,
             "sender": self.sender,
             "content": self.content,
             "is_from_me": self.is_from_me,
             "is_group": self.is_group,
         }
 
-        # Add optional fields only if they have values
+        # Add optional fields only if they have values. Datetimes are passed
+        # through as-is and encoded once at the response boundary (see
+        # lib.utils.dumps); media details go out with media_type, even unset.
         if self.chat_name:
             result["chat_name"] = self.chat_name
         if self.sender_name:
@@ -85,7 +111,7 @@ class Message:
             result["quoted_text_preview"] = self.quoted_text_preview
         if self.reaction_summary:
             result["reaction_summary"] = self.reaction_summary
-        if self.edit_count is not None and self.edit_count > 0:
+        if self.edit_count:
             result["edit_count"] = self.edit_count
         if self.is_edited:
             result["is_edited"] = self.is_edited
@@ -111,7 +137,7 @@ class Message:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Chat:
     """Represents a WhatsApp chat/conversation."""
 
@@ -127,28 +153,29 @@ class Chat:
     total_message_count: int | None = None
     message_count_today: int | None = None
     message_count_last_7_days: int | None = None
-    message_velocity_last_7_days: dict[str, Any] = field(default_factory=dict)
+    message_velocity_last_7_days: VelocityStats | None = None
     participant_count: int | None = None
-    participant_names: list[str] = field(default_factory=list)
-    participant_list: list[dict[str, Any]] = field(default_factory=list)
+    participant_names: Sequence[str] = ()
+    participant_list: Sequence[dict[str, Any]] = ()
     most_active_member_name: str | None = None
     most_active_member_message_count: int | None = None
-    admin_list: list[dict[str, Any]] = field(default_factory=list)
+    admin_list: Sequence[dict[str, Any]] = ()
     chat_type: str | None = None
     silent_duration_seconds: int | None = None
     is_recently_active: bool = False
-    media_count_by_type: dict[str, int] = field(default_factory=dict)
-    recent_media: list[dict[str, Any]] = field(default_factory=list)
+    media_count_by_type: Mapping[str, int] | None = None
+    recent_media: Sequence[str] = ()  # Filenames, newest first
     has_media: bool = False
     is_disappearing_messages: bool = False
     disappearing_ttl: int | None = None
-    last_sender_contact_info: dict[str, Any] | None = None
+    last_sender_contact_info: ContactInfo | None = None
     timezone: str | None = None
 
-    @property
-    def is_group(self) -> bool:
-        """Determine if chat is a group based on JID pattern."""
-        return self.jid.endswith("@g.us")
+    is_group: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Derive is_group from the JID once, instead of on every access."""
+        self.is_group = self.jid.endswith("@g.us")
 
     def to_dict(self) -> dict[str, Any]:
         """Convert Chat to dictionary for structured output, omitting empty/null fields."""
@@ -158,9 +185,9 @@ class Chat:
             "is_group": self.is_group,
         }
 
-        # Add timestamp fields
+        # Add optional fields only if they have values
         if self.last_message_time:
-            result["last_message_time"] = self.last_message_time.isoformat()
+            result["last_message_time"] = self.last_message_time
         if self.last_message:
             result["last_message"] = self.last_message
         if self.last_message_id:
@@ -171,8 +198,6 @@ class Chat:
             result["last_sender_name"] = self.last_sender_name
         if self.last_is_from_me is not None:
             result["last_is_from_me"] = self.last_is_from_me
-
-        # Add Phase 1 metadata fields
         if self.total_message_count is not None:
             result["total_message_count"] = self.total_message_count
         if self.message_count_today is not None:
@@ -217,7 +242,7 @@ class Chat:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Contact:
     """Represents a WhatsApp contact."""
 
@@ -233,13 +258,13 @@ class Contact:
     relationship_type: str | None = None
     is_favorite: bool = False
     contact_created_date: datetime | None = None
-    shared_group_list: list[str] = field(default_factory=list)
+    shared_group_list: Sequence[str] = ()
     shared_group_count: int | None = None
     total_message_count: int | None = None
     message_count_today: int | None = None
     message_count_last_7_days: int | None = None
     message_count_last_30_days: int | None = None
-    activity_trend: dict[str, Any] = field(default_factory=dict)
+    activity_trend: Mapping[str, Any] | None = None
     typical_response_time_seconds: int | None = None
     typical_reply_rate: float | None = None
     is_responsive: bool = False
@@ -261,7 +286,7 @@ class Contact:
             "name": self.name,
         }
 
-        # Add optional fields if present
+        # Add optional fields only if they have values
         if self.first_name:
             result["first_name"] = self.first_name
         if self.full_name:
@@ -272,14 +297,12 @@ class Contact:
             result["business_name"] = self.business_name
         if self.nickname:
             result["nickname"] = self.nickname
-
-        # Add Phase 1 metadata fields
         if self.relationship_type:
             result["relationship_type"] = self.relationship_type
         if self.is_favorite:
             result["is_favorite"] = self.is_favorite
         if self.contact_created_date:
-            result["contact_created_date"] = self.contact_created_date.isoformat()
+            result["contact_created_date"] = self.contact_created_date
         if self.shared_group_list:
             result["shared_group_list"] = self.shared_group_list
         if self.shared_group_count is not None:
@@ -303,7 +326,7 @@ class Contact:
         if self.days_since_last_message is not None:
             result["days_since_last_message"] = self.days_since_last_message
         if self.last_seen_timestamp:
-            result["last_seen_timestamp"] = self.last_seen_timestamp.isoformat()
+            result["last_seen_timestamp"] = self.last_seen_timestamp
         if self.timezone:
             result["timezone"] = self.timezone
         if self.organization:
@@ -313,7 +336,7 @@ class Contact:
         if self.latest_message_preview:
             result["latest_message_preview"] = self.latest_message_preview
         if self.latest_message_timestamp:
-            result["latest_message_timestamp"] = self.latest_message_timestamp.isoformat()
+            result["latest_message_timestamp"] = self.latest_message_timestamp
         if self.has_active_chat:
             result["has_active_chat"] = self.has_active_chat
         if self.recent_chat_jid:
@@ -322,7 +345,7 @@ class Contact:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageContext:
     """Represents a message with surrounding context."""
 
@@ -337,3 +360,74 @@ class MessageContext:
             "before": [m.to_dict() for m in self.before],
             "after": [m.to_dict() for m in self.after],
         }
+
+
+@dataclass(slots=True)
+class MessageBatch:
+    """Columnar (struct-of-arrays) view over a list of messages for aggregate analytics.
+
+    Columns are ordered by timestamp ascending. Numeric and flag columns are
+    fixed-width ``array`` buffers, so window counts and reply-gap scans walk
+    compact typed storage instead of attribute lookups on each Message.
+    """
+
+    timestamps: array  # epoch seconds, float64
+    senders: list[str]
+    is_from_me: array  # 0/1, int8
+    character_counts: array  # int64, 0 when not computed
+    word_counts: array  # int64, 0 when not computed
+    messages: list[Message]
+
+    @classmethod
+    def from_messages(cls, messages: list[Message]) -> "MessageBatch":
+        """Build a batch from Message objects (any order)."""
+        ordered = sorted(messages, key=lambda m: m.timestamp)
+        return cls(
+            timestamps=array("d", (m.timestamp.timestamp() for m in ordered)),
+            senders=[m.sender for m in ordered],
+            is_from_me=array("b", (1 if m.is_from_me else 0 for m in ordered)),
+            character_counts=array("q", (m.character_count or 0 for m in ordered)),
+            word_counts=array("q", (m.word_count or 0 for m in ordered)),
+            messages=ordered,
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def count_since(self, since: datetime) -> int:
+        """Count messages at or after a point in time (binary search on the sorted timestamps)."""
+        return len(self.timestamps) - bisect_left(self.timestamps, since.timestamp())
+
+    def mean_word_count(self) -> float:
+        """Average words per message, or 0.0 if empty."""
+        return sum(self.word_counts) / len(self.word_counts) if self.word_counts else 0.0
+
+    def sender_counts(self) -> Counter[str]:
+        """Count messages per sender."""
+        return Counter(self.senders)
+
+    def most_active_sender(self) -> tuple[str | None, int]:
+        """Return (sender, message_count) for the busiest sender, or (None, 0) if empty."""
+        top = self.sender_counts().most_common(1)
+        return top[0] if top else (None, 0)
+
+    def response_times(self) -> list[int]:
+        """Seconds from each incoming message to the next outgoing reply.
+
+        Only the first incoming message of a run is measured, so a burst of
+        inbound messages answered by one reply yields a single gap.
+        """
+        gaps: list[int] = []
+        pending: float | None = None
+        for ts, mine in zip(self.timestamps, self.is_from_me):
+            if mine:
+                if pending is not None:
+                    gaps.append(int(ts - pending))
+                    pending = None
+            elif pending is None:
+                pending = ts
+        return gaps
+
+    def to_objects(self) -> list[Message]:
+        """Return the underlying messages, in timestamp order, for serialization."""
+        return self.messages
@@ -1,8 +1,18 @@
 """Utility functions and logging setup for WhatsApp MCP server."""
 
+import json
 import logging
 import os
+import sqlite3
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 # Load .env file from project root - check multiple locations
 try:
@@ -61,6 +71,24 @@ else:
 MESSAGES_DB_PATH = os.path.join(_store_path, "messages.db")
 WHATSAPP_DB_PATH = os.path.join(_store_path, "whatsapp.db")
 
+# Read-side tuning for the long-lived per-thread connections that lib.database
+# and whatsapp.py keep. The bridge owns the writer and already opens
+# messages.db in WAL mode, so journal_mode is left to it. The page cache is
+# per connection, and there is one per thread and path, so it stays modest.
+SQLITE_PRAGMAS = (
+    "PRAGMA mmap_size=268435456",  # 256 MB memory-mapped reads
+    "PRAGMA cache_size=-16384",  # 16 MB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA synchronous=NORMAL",
+)
+
+
+def apply_sqlite_pragmas(conn: sqlite3.Connection) -> None:
+    """Apply SQLITE_PRAGMAS to a freshly opened connection."""
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+
+
 # Fail loudly on import if the bridge DB is missing — sqlite3.connect() silently
 # creates an empty file at a wrong path, which causes every query to return empty
 # results with no error. Set WA_SKIP_DB_CHECK=1 to bypass (tests, lint).
@@ -97,3 +125,43 @@ def get_sender_name(sender_jid: str) -> str:
         if contact:
             return contact.name or contact.push_name or contact.phone_number
     return sender_jid.split("@")[0]
+
+
+@lru_cache(maxsize=4096)
+def normalize_jid(identifier: str) -> str:
+    """Normalize a JID or bare phone number to its canonical JID form.
+
+    Surrounding whitespace and a leading "+" are dropped, the server part is
+    lowercased, and a bare phone number gets the "@s.whatsapp.net" suffix.
+    Memoized because the same few thousand JIDs are looked up repeatedly.
+    """
+    value = identifier.strip()
+    if "@" in value:
+        user, _, server = value.partition("@")
+        return f"{user}@{server.lower()}"
+    phone = value.lstrip("+")
+    return f"{phone}@s.whatsapp.net" if phone.isdigit() else value
+
+
+def _json_default(obj: Any) -> str:
+    """Encode values stdlib json cannot handle (datetimes as ISO 8601)."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize a response payload to a JSON string.
+
+    Model to_dict() output carries raw datetimes; they are encoded here as ISO
+    8601 in a single pass, with orjson when available and stdlib json otherwise.
+
+    Args:
+        obj: Dict/list payload, possibly containing datetimes.
+
+    Returns:
+        JSON text.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return json.dumps(obj, default=_json_default)
@@ -1,65 +1,89 @@
 """WhatsApp MCP Server - stdio transport for Claude Code CLI"""
 
 import json
+import logging
 import os
+import re
+import threading
+import time
+from collections.abc import Callable
+from functools import cache, partial, wraps
 from pathlib import Path
+from types import ModuleType
 from typing import Any, Literal
 
-import requests as _requests
-
-from lib.utils import WHATSAPP_API_BASE_URL as _BRIDGE_URL
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.utilities.types import Image
 from mcp.types import ToolAnnotations
 
-# Phase 2: Group Management
-from whatsapp import add_group_members as whatsapp_add_group_members
-from whatsapp import create_group as whatsapp_create_group
-from whatsapp import create_newsletter as whatsapp_create_newsletter
-
-# Phase 3: Polls
-from whatsapp import create_poll as whatsapp_create_poll
-from whatsapp import delete_message as whatsapp_delete_message
-from whatsapp import demote_admin as whatsapp_demote_admin
-from whatsapp import download_media as whatsapp_download_media
-from whatsapp import edit_message as whatsapp_edit_message
-from whatsapp import follow_newsletter as whatsapp_follow_newsletter
-from whatsapp import get_blocklist as whatsapp_get_blocklist
-from whatsapp import get_chat as whatsapp_get_chat
-from whatsapp import get_contact_by_jid as whatsapp_get_contact_by_jid
-from whatsapp import get_contact_by_phone as whatsapp_get_contact_by_phone
-from whatsapp import get_contact_chats as whatsapp_get_contact_chats
-from whatsapp import get_contact_nickname as whatsapp_get_contact_nickname
-from whatsapp import get_direct_chat_by_contact as whatsapp_get_direct_chat_by_contact
-from whatsapp import get_group_info as whatsapp_get_group_info
-from whatsapp import get_last_interaction as whatsapp_get_last_interaction
-from whatsapp import get_message_context as whatsapp_get_message_context
-from whatsapp import get_profile_picture as whatsapp_get_profile_picture
-from whatsapp import leave_group as whatsapp_leave_group
-from whatsapp import list_all_contacts as whatsapp_list_all_contacts
-from whatsapp import list_chats as whatsapp_list_chats
-from whatsapp import list_contact_nicknames as whatsapp_list_contact_nicknames
-from whatsapp import list_messages as whatsapp_list_messages
-from whatsapp import mark_messages_read as whatsapp_mark_messages_read
-from whatsapp import promote_to_admin as whatsapp_promote_to_admin
-from whatsapp import remove_contact_nickname as whatsapp_remove_contact_nickname
-from whatsapp import remove_group_members as whatsapp_remove_group_members
 
-# Phase 4: History Sync
-from whatsapp import request_chat_history as whatsapp_request_chat_history
-from whatsapp import search_contacts as whatsapp_search_contacts
-from whatsapp import send_audio_message as whatsapp_audio_voice_message
-from whatsapp import send_file as whatsapp_send_file
-from whatsapp import send_message as whatsapp_send_message
-from whatsapp import send_reaction as whatsapp_send_reaction  # Phase 1 features
-from whatsapp import set_contact_nickname as whatsapp_set_contact_nickname
-
-# Phase 5: Advanced Features
-from whatsapp import set_presence as whatsapp_set_presence
-from whatsapp import subscribe_presence as whatsapp_subscribe_presence
-from whatsapp import unfollow_newsletter as whatsapp_unfollow_newsletter
-from whatsapp import update_blocklist as whatsapp_update_blocklist
-from whatsapp import update_group as whatsapp_update_group
+# whatsapp.py (and lib, with requests and the bridge session) is imported on the first
+# tool call rather than at startup, so the stdio handshake is not held up by it.
+# Same logger lib.utils configures, fetched by name so main.py stays import-light.
+logger = logging.getLogger("whatsapp-mcp")
+
+
+@cache
+def _wa() -> ModuleType:
+    """Import the whatsapp module once, on first use."""
+    import whatsapp
+
+    return whatsapp
+
+
+def _lazy(name: str) -> Callable[..., Any]:
+    """Stand-in for ``whatsapp.<name>`` that defers importing whatsapp until it is called."""
+
+    def call(*args: Any, **kwargs: Any) -> Any:
+        return getattr(_wa(), name)(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = f"whatsapp_{name}"
+    return call
+
+
+whatsapp_add_group_members = _lazy("add_group_members")
+whatsapp_audio_voice_message = _lazy("send_audio_message")
+whatsapp_create_group = _lazy("create_group")
+whatsapp_create_newsletter = _lazy("create_newsletter")
+whatsapp_create_poll = _lazy("create_poll")
+whatsapp_delete_message = _lazy("delete_message")
+whatsapp_demote_admin = _lazy("demote_admin")
+whatsapp_download_media = _lazy("download_media")
+whatsapp_edit_message = _lazy("edit_message")
+whatsapp_follow_newsletter = _lazy("follow_newsletter")
+whatsapp_get_blocklist = _lazy("get_blocklist")
+whatsapp_get_chat = _lazy("get_chat")
+whatsapp_get_contact_by_jid = _lazy("get_contact_by_jid")
+whatsapp_get_contact_by_phone = _lazy("get_contact_by_phone")
+whatsapp_get_contact_chats = _lazy("get_contact_chats")
+whatsapp_get_contact_nickname = _lazy("get_contact_nickname")
+whatsapp_get_direct_chat_by_contact = _lazy("get_direct_chat_by_contact")
+whatsapp_get_group_info = _lazy("get_group_info")
+whatsapp_get_last_interaction = _lazy("get_last_interaction")
+whatsapp_get_message_context = _lazy("get_message_context")
+whatsapp_get_profile_picture = _lazy("get_profile_picture")
+whatsapp_iter_all_contacts = _lazy("iter_all_contacts")
+whatsapp_leave_group = _lazy("leave_group")
+whatsapp_list_chats = _lazy("list_chats")
+whatsapp_list_contact_nicknames = _lazy("list_contact_nicknames")
+whatsapp_list_messages = _lazy("list_messages")
+whatsapp_mark_messages_read = _lazy("mark_messages_read")
+whatsapp_promote_to_admin = _lazy("promote_to_admin")
+whatsapp_remove_contact_nickname = _lazy("remove_contact_nickname")
+whatsapp_remove_group_members = _lazy("remove_group_members")
+whatsapp_request_chat_history = _lazy("request_chat_history")
+whatsapp_search_contacts = _lazy("search_contacts")
+whatsapp_send_file = _lazy("send_file")
+whatsapp_send_message = _lazy("send_message")
+whatsapp_send_reaction = _lazy("send_reaction")
+whatsapp_set_contact_nickname = _lazy("set_contact_nickname")
+whatsapp_set_presence = _lazy("set_presence")
+whatsapp_subscribe_presence = _lazy("subscribe_presence")
+whatsapp_unfollow_newsletter = _lazy("unfollow_newsletter")
+whatsapp_update_blocklist = _lazy("update_blocklist")
+whatsapp_update_group = _lazy("update_group")
 
 _INLINE_IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 
@@ -139,6 +163,49 @@ def tool(
     return decorator
 
 
+# Exact-match cache for read-only tools: agents re-list chats and contacts many times
+# within a turn. Entries expire after 15s so bridge-side updates (incoming messages)
+# still show up, and tools that change chats, messages or nicknames clear it.
+_READ_CACHE: TTLCache = TTLCache(maxsize=512, ttl=15)
+_READ_CACHE_LOCK = threading.Lock()
+
+
+def _read_cached(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Serve repeat calls of a read-only tool with identical arguments from _READ_CACHE."""
+    return cached(_READ_CACHE, key=partial(hashkey, func.__name__), lock=_READ_CACHE_LOCK)(func)
+
+
+def _invalidates_reads(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Clear _READ_CACHE after a tool that changes local or WhatsApp state."""
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with _READ_CACHE_LOCK:
+                _READ_CACHE.clear()
+
+    return wrapper
+
+
+# Phone number (digits only, with country code) or user/group/LID/newsletter JID
+_JID_RE = re.compile(r"^(?:\d{5,15}|\d{5,20}(?:-\d+)?@(?:s\.whatsapp\.net|g\.us|lid|newsletter))$")
+
+
+def _invalid_jids(**values: str | None) -> dict[str, Any] | None:
+    """Return an error result for the first non-empty value that is not a phone number or JID."""
+    for name, value in values.items():
+        if value and not _JID_RE.match(value):
+            return {"success": False, "error": f"Invalid {name} format: {value!r}"}
+    return None
+
+
+def _tool_error(error: str, use_tool: str) -> dict[str, Any]:
+    """Build the error result for a bad argument, pointing the model back at the tool to retry."""
+    return {"success": False, "error": error, "use_tool": use_tool}
+
+
 def _invalid_action(action: str, allowed: tuple[str, ...], replacement: str | None = None) -> dict[str, Any]:
     result: dict[str, Any] = {
         "success": False,
@@ -213,6 +280,7 @@ def list_messages(
 
 
 @tool("core", "List Chats", read_only=True, idempotent=True, open_world=False)
+@_read_cached
 def list_chats(
     query: str | None = None,
     limit: int = 20,
@@ -241,6 +309,7 @@ def list_chats(
 
 
 @tool("core", "Get Chat", read_only=True, idempotent=True, open_world=False)
+@_read_cached
 def get_chat(chat_jid: str, include_last_message: bool = True) -> dict[str, Any]:
     """Get WhatsApp chat metadata by JID.
 
@@ -271,6 +340,7 @@ def get_message_context(message_id: str, before: int = 5, after: int = 5) -> dic
 
 
 @tool("send", "Send Message", read_only=False)
+@_invalidates_reads
 def send_message(recipient: str, message: str, mentioned_jids: list[str] | None = None) -> dict[str, Any]:
     """Send a WhatsApp message to a person or group. For group chats use the JID.
 
@@ -283,10 +353,13 @@ def send_message(recipient: str, message: str, mentioned_jids: list[str] | None
     Returns:
         A dictionary containing success status and a status message
     """
+    if error := _invalid_jids(recipient=recipient):
+        return error
     return whatsapp_send_message(recipient, message, mentioned_jids)
 
 
 @tool("media", "Send File", read_only=False)
+@_invalidates_reads
 def send_file(recipient: str, media_path: str) -> dict[str, Any]:
     """Send a file such as a picture, raw audio, video or document via WhatsApp to the specified recipient. For group messages use the JID.
 
@@ -298,10 +371,13 @@ def send_file(recipient: str, media_path: str) -> dict[str, Any]:
     Returns:
         A dictionary containing success status and a status message
     """
+    if error := _invalid_jids(recipient=recipient):
+        return error
     return whatsapp_send_file(recipient, media_path)
 
 
 @tool("media", "Send Audio Message", read_only=False)
+@_invalidates_reads
 def send_audio_message(recipient: str, media_path: str) -> dict[str, Any]:
     """Send any audio file as a WhatsApp audio message to the specified recipient. For group messages use the JID. If it errors due to ffmpeg not being installed, use send_file instead.
 
@@ -313,6 +389,8 @@ def send_audio_message(recipient: str, media_path: str) -> dict[str, Any]:
     Returns:
         A dictionary containing success status and a status message
     """
+    if error := _invalid_jids(recipient=recipient):
+        return error
     return whatsapp_audio_voice_message(recipient, media_path)
 
 
@@ -354,6 +432,7 @@ def download_media(message_id: str, chat_jid: str) -> Any:
 
 
 @tool("core", "List All Contacts", read_only=True, idempotent=True, open_world=False)
+@_read_cached
 def list_all_contacts(limit: int = 100) -> list[dict[str, Any]]:
     """List all WhatsApp contacts with their information.
 
@@ -363,7 +442,8 @@ def list_all_contacts(limit: int = 100) -> list[dict[str, Any]]:
     Returns:
         List of contact dicts with jid, phone_number, name, first_name, full_name, push_name, business_name, nickname
     """
-    return whatsapp_list_all_contacts(limit)
+    # Convert each row as the cursor yields it rather than building a Contact list first
+    return [contact.to_dict() for contact in whatsapp_iter_all_contacts(limit)]
 
 
 @tool(
@@ -385,12 +465,10 @@ def get_contact_context(
     page: int = 0,
 ) -> dict[str, Any]:
     """Get contact details and optional chat/message context in one composable call."""
-    contact = whatsapp_get_contact_by_jid(identifier)
-    if not contact:
-        contact = whatsapp_get_contact_by_phone(identifier)
+    contact = whatsapp_get_contact_by_jid(identifier) or whatsapp_get_contact_by_phone(identifier)
 
-    jid = contact.get("jid") if contact else identifier
-    result: dict[str, Any] = {"contact": contact}
+    jid = contact.jid if contact else identifier
+    result: dict[str, Any] = {"contact": contact.to_dict() if contact else None}
 
     if include_chats:
         result["chats"] = whatsapp_get_contact_chats(jid, limit, page)
@@ -428,6 +506,7 @@ def get_direct_chat_by_contact(phone_number: str) -> dict[str, Any] | None:
         "Use action='set', 'get', 'remove', or 'list'. This changes only local nickname metadata."
     ),
 )
+@_invalidates_reads
 def manage_nickname(action: NicknameAction, jid: str | None = None, nickname: str | None = None) -> dict[str, Any]:
     """Manage custom contact nicknames with one action-based tool."""
     allowed = ("set", "get", "remove", "list")
@@ -437,10 +516,10 @@ def manage_nickname(action: NicknameAction, jid: str | None = None, nickname: st
     if action == "list":
         return {"success": True, "nicknames": whatsapp_list_contact_nicknames()}
     if not jid:
-        return {"success": False, "error": "jid is required for set/get/remove", "use_tool": "manage_nickname"}
+        return _tool_error("jid is required for set/get/remove", "manage_nickname")
     if action == "set":
         if nickname is None:
-            return {"success": False, "error": "nickname is required for action='set'", "use_tool": "manage_nickname"}
+            return _tool_error("nickname is required for action='set'", "manage_nickname")
         return whatsapp_set_contact_nickname(jid, nickname)
     if action == "get":
         return {"success": True, "jid": jid, "nickname": whatsapp_get_contact_nickname(jid)}
@@ -451,6 +530,7 @@ def manage_nickname(action: NicknameAction, jid: str | None = None, nickname: st
 
 
 @tool("send", "Send Reaction", read_only=False)
+@_invalidates_reads
 def send_reaction(chat_jid: str, message_id: str, emoji: str) -> dict[str, Any]:
     """Send an emoji reaction to a WhatsApp message.
 
@@ -462,10 +542,13 @@ def send_reaction(chat_jid: str, message_id: str, emoji: str) -> dict[str, Any]:
     Returns:
         A dictionary containing success status, chat_jid, message_id, emoji, and action
     """
+    if error := _invalid_jids(chat_jid=chat_jid):
+        return error
     return whatsapp_send_reaction(chat_jid, message_id, emoji)
 
 
 @tool("message_admin", "Edit Message", read_only=False)
+@_invalidates_reads
 def edit_message(chat_jid: str, message_id: str, new_content: str) -> dict[str, Any]:
     """Edit a previously sent WhatsApp message.
 
@@ -477,10 +560,13 @@ def edit_message(chat_jid: str, message_id: str, new_content: str) -> dict[str,
     Returns:
         A dictionary containing success status, chat_jid, message_id, and new_content
     """
+    if error := _invalid_jids(chat_jid=chat_jid):
+        return error
     return whatsapp_edit_message(chat_jid, message_id, new_content)
 
 
 @tool("message_admin", "Delete Message", read_only=False, destructive=True)
+@_invalidates_reads
 def delete_message(chat_jid: str, message_id: str, sender_jid: str | None = None) -> dict[str, Any]:
     """Delete/revoke a WhatsApp message.
 
@@ -492,6 +578,8 @@ def delete_message(chat_jid: str, message_id: str, sender_jid: str | None = None
     Returns:
         A dictionary containing success status, chat_jid, and message_id
     """
+    if error := _invalid_jids(chat_jid=chat_jid, sender_jid=sender_jid):
+        return error
     return whatsapp_delete_message(chat_jid, message_id, sender_jid)
 
 
@@ -508,10 +596,45 @@ def get_group_info(group_jid: str) -> dict[str, Any]:
     return whatsapp_get_group_info(group_jid)
 
 
+# Agents scrolling through a chat call mark_read many times in quick succession with
+# overlapping IDs. Calls for the same chat/sender within _MARK_READ_WINDOW seconds are
+# merged into one receipt request with duplicate IDs removed. A steady stream of calls
+# keeps re-arming the timer, so receipts are flushed regardless once the first queued
+# ID has waited _MARK_READ_MAX_WINDOWS windows.
+_MARK_READ_WINDOW = 0.2
+_MARK_READ_MAX_WINDOWS = 5
+# (queued IDs, pending timer, time.monotonic() when the first ID was queued)
+_PENDING_READS: dict[tuple[str, str | None], tuple[dict[str, None], threading.Timer, float]] = {}
+_PENDING_READS_LOCK = threading.Lock()
+
+
+def _flush_reads(key: tuple[str, str | None]) -> None:
+    """Send the queued read receipts for one chat/sender pair."""
+    with _PENDING_READS_LOCK:
+        pending = _PENDING_READS.pop(key, None)
+    if pending is None:
+        return
+    ids, timer, _ = pending
+    timer.cancel()
+    chat_jid, sender_jid = key
+    # Runs on a timer thread after mark_read has returned, so failures can only be logged
+    try:
+        result = whatsapp_mark_messages_read(chat_jid, list(ids), sender_jid)
+    except Exception:
+        logger.exception("Failed to send %d queued read receipt(s) for %s", len(ids), chat_jid)
+        return
+    if not result.get("success"):
+        logger.warning("Bridge rejected %d queued read receipt(s) for %s: %s", len(ids), chat_jid, result.get("error"))
+
+
 @tool("message_admin", "Mark Read", read_only=False)
+@_invalidates_reads
 def mark_read(chat_jid: str, message_ids: list[str], sender_jid: str | None = None) -> dict[str, Any]:
     """Mark WhatsApp messages as read (sends blue ticks).
 
+    Receipts are queued briefly and sent together with other mark_read calls for
+    the same chat, so the result confirms the IDs were queued.
+
     Args:
         chat_jid: The JID of the chat containing the messages
         message_ids: List of message IDs to mark as read
@@ -520,7 +643,22 @@ def mark_read(chat_jid: str, message_ids: list[str], sender_jid: str | None = No
     Returns:
         A dictionary containing success status, chat_jid, message_ids, and count
     """
-    return whatsapp_mark_messages_read(chat_jid, message_ids, sender_jid)
+    if error := _invalid_jids(chat_jid=chat_jid, sender_jid=sender_jid):
+        return error
+    ids = list(dict.fromkeys(message_ids))
+    key = (chat_jid, sender_jid or None)
+    now = time.monotonic()
+    with _PENDING_READS_LOCK:
+        queued, timer, first_queued = _PENDING_READS.get(key, ({}, None, now))
+        if timer is not None:
+            timer.cancel()
+        queued.update(dict.fromkeys(ids))
+        deadline = first_queued + _MARK_READ_MAX_WINDOWS * _MARK_READ_WINDOW
+        delay = max(0.0, min(_MARK_READ_WINDOW, deadline - now))
+        timer = threading.Timer(delay, _flush_reads, args=(key,))
+        _PENDING_READS[key] = (queued, timer, first_queued)
+        timer.start()
+    return {"success": True, "message": "queued", "chat_jid": chat_jid, "message_ids": ids, "count": len(ids)}
 
 
 # Phase 2: Group Management
@@ -537,6 +675,7 @@ def mark_read(chat_jid: str, message_ids: list[str], sender_jid: str | None = No
         "Requires group admin rights for most actions."
     ),
 )
+@_invalidates_reads
 def manage_group(
     action: GroupAction,
     group_jid: str | None = None,
@@ -552,46 +691,26 @@ def manage_group(
 
     if action == "create":
         if not name or not participants:
-            return {
-                "success": False,
-                "error": "name and participants are required for action='create'",
-                "use_tool": "manage_group",
-            }
+            return _tool_error("name and participants are required for action='create'", "manage_group")
         return whatsapp_create_group(name, participants)
 
     if not group_jid:
-        return {"success": False, "error": "group_jid is required for this action", "use_tool": "manage_group"}
+        return _tool_error("group_jid is required for this action", "manage_group")
     if action == "add_members":
         if not participants:
-            return {
-                "success": False,
-                "error": "participants is required for action='add_members'",
-                "use_tool": "manage_group",
-            }
+            return _tool_error("participants is required for action='add_members'", "manage_group")
         return whatsapp_add_group_members(group_jid, participants)
     if action == "remove_members":
         if not participants:
-            return {
-                "success": False,
-                "error": "participants is required for action='remove_members'",
-                "use_tool": "manage_group",
-            }
+            return _tool_error("participants is required for action='remove_members'", "manage_group")
         return whatsapp_remove_group_members(group_jid, participants)
     if action == "promote_admin":
         if not participant:
-            return {
-                "success": False,
-                "error": "participant is required for action='promote_admin'",
-                "use_tool": "manage_group",
-            }
+            return _tool_error("participant is required for action='promote_admin'", "manage_group")
         return whatsapp_promote_to_admin(group_jid, participant)
     if action == "demote_admin":
         if not participant:
-            return {
-                "success": False,
-                "error": "participant is required for action='demote_admin'",
-                "use_tool": "manage_group",
-            }
+            return _tool_error("participant is required for action='demote_admin'", "manage_group")
         return whatsapp_demote_admin(group_jid, participant)
     if action == "leave":
         return whatsapp_leave_group(group_jid)
@@ -602,6 +721,7 @@ def manage_group(
 
 
 @tool("send", "Create Poll", read_only=False)
+@_invalidates_reads
 def create_poll(chat_jid: str, question: str, options: list[str], multi_select: bool = False) -> dict[str, Any]:
     """Create and send a poll to a WhatsApp chat.
 
@@ -614,6 +734,8 @@ def create_poll(chat_jid: str, question: str, options: list[str], multi_select:
     Returns:
         A dictionary containing success, message_id, timestamp, chat_jid, question, options
     """
+    if error := _invalid_jids(chat_jid=chat_jid):
+        return error
     return whatsapp_create_poll(chat_jid, question, options, multi_select)
 
 
@@ -717,7 +839,7 @@ def manage_blocklist(action: BlocklistAction, jid: str) -> dict[str, Any]:
     if action not in allowed:
         return _invalid_action(action, allowed, "manage_blocklist")
     if not jid:
-        return {"success": False, "error": "jid is required for block/unblock", "use_tool": "manage_blocklist"}
+        return _tool_error("jid is required for block/unblock", "manage_blocklist")
     return whatsapp_update_blocklist(jid, action)
 
 
@@ -740,20 +862,21 @@ def manage_newsletter(
         return _invalid_action(action, allowed, "manage_newsletter")
     if action == "create":
         if not name:
-            return {"success": False, "error": "name is required for action='create'", "use_tool": "manage_newsletter"}
+            return _tool_error("name is required for action='create'", "manage_newsletter")
         return whatsapp_create_newsletter(name, description)
     if not jid:
-        return {"success": False, "error": "jid is required for follow/unfollow", "use_tool": "manage_newsletter"}
+        return _tool_error("jid is required for follow/unfollow", "manage_newsletter")
     if action == "follow":
         return whatsapp_follow_newsletter(jid)
     return whatsapp_unfollow_newsletter(jid)
 
 
 def _bridge_get(path: str) -> dict[str, Any]:
-    api_key = os.getenv("API_KEY") or os.getenv("WHATSAPP_API_KEY")
-    headers = {"X-API-Key": api_key} if api_key else {}
+    from lib.bridge import _SESSION
+    from lib.utils import WHATSAPP_API_BASE_URL
+
     try:
-        r = _requests.get(f"{_BRIDGE_URL}{path}", headers=headers, timeout=5)
+        r = _SESSION.get(f"{WHATSAPP_API_BASE_URL}{path}", timeout=5)
         r.raise_for_status()
         return r.json()
     except Exception as exc:
@@ -0,0 +1,10 @@
+-- Timestamp Index Migration
+-- Target: ../whatsapp-bridge/store/messages.db (shared SQLite database)
+-- This is the same migration as whatsapp-bridge/migrations/002_add_timestamp_index.sql
+-- It's mirrored here for Python layer reference
+
+CREATE INDEX IF NOT EXISTS idx_messages_timestamp
+  ON messages(timestamp DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_messages_chat_timestamp
+  ON messages(chat_jid, timestamp DESC);
@@ -13,14 +13,27 @@ from datetime import datetime
 
 import pytest
 
+import whatsapp
+from lib.database import _reset_conns
 
-@pytest.fixture
-def temp_messages_db():
-    """Create a temporary messages database with test data."""
+
+@pytest.fixture(autouse=True)
+def _close_cached_connections():
+    """Drop the cached connections and results of lib.database and whatsapp so each test sees its own temp DBs."""
+    yield
+    _reset_conns()
+    whatsapp._reset_conns()
+
+
+def _create_messages_db() -> str:
+    """Create a temporary messages database with test data and return its path."""
     with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
         db_path = f.name
 
     conn = sqlite3.connect(db_path)
+    # Throwaway file: skip fsyncs and the on-disk rollback journal
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA journal_mode=MEMORY")
     cursor = conn.cursor()
 
     # Create tables
@@ -55,6 +68,8 @@ def temp_messages_db():
             FOREIGN KEY (chat_jid) REFERENCES chats(jid)
         )
     """)
+    cursor.execute("CREATE INDEX idx_messages_chat_timestamp ON messages(chat_jid, timestamp DESC)")
+    cursor.execute("CREATE INDEX idx_messages_timestamp ON messages(timestamp DESC, id DESC)")
 
     cursor.execute("""
         CREATE TABLE contact_nicknames (
@@ -65,36 +80,43 @@ def temp_messages_db():
         )
     """)
 
-    # Insert test data
-    cursor.execute("INSERT INTO chats (jid, name) VALUES (?, ?)", ("123456789@s.whatsapp.net", "Test User"))
-    cursor.execute("INSERT INTO chats (jid, name) VALUES (?, ?)", ("987654321@g.us", "Test Group"))
+    # Insert test data (one transaction, committed below)
+    cursor.executemany(
+        "INSERT INTO chats (jid, name) VALUES (?, ?)",
+        [("123456789@s.whatsapp.net", "Test User"), ("987654321@g.us", "Test Group")],
+    )
 
     # Insert test messages
     now = datetime.now().isoformat()
-    cursor.execute(
-        """INSERT INTO messages (id, chat_jid, sender, content, timestamp, is_from_me, media_type, filename, file_length, sender_name)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-        (
-            "msg1",
-            "123456789@s.whatsapp.net",
-            "123456789@s.whatsapp.net",
-            "Hello world",
-            now,
-            0,
-            None,
-            None,
-            None,
-            "Test User",
-        ),
-    )
-    cursor.execute(
+    cursor.executemany(
         """INSERT INTO messages (id, chat_jid, sender, content, timestamp, is_from_me, media_type, filename, file_length, sender_name)
            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-        ("msg2", "123456789@s.whatsapp.net", "me", "Hi there", now, 1, None, None, None, "Me"),
+        [
+            (
+                "msg1",
+                "123456789@s.whatsapp.net",
+                "123456789@s.whatsapp.net",
+                "Hello world",
+                now,
+                0,
+                None,
+                None,
+                None,
+                "Test User",
+            ),
+            ("msg2", "123456789@s.whatsapp.net", "me", "Hi there", now, 1, None, None, None, "Me"),
+        ],
     )
 
     conn.commit()
     conn.close()
+    return db_path
+
+
+@pytest.fixture
+def temp_messages_db():
+    """Create a temporary messages database with test data."""
+    db_path = _create_messages_db()
 
     yield db_path
 
@@ -102,6 +124,22 @@ def temp_messages_db():
     os.unlink(db_path)
 
 
+@pytest.fixture(scope="session")
+def ro_conn():
+    """Read-only connection to one messages database shared by the whole session.
+
+    For tests that only query the fixture data; anything that writes should use
+    temp_messages_db instead.
+    """
+    db_path = _create_messages_db()
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+
+    yield conn
+
+    conn.close()
+    os.unlink(db_path)
+
+
 @pytest.fixture
 def temp_whatsapp_db():
     """Create a temporary WhatsApp database with test contacts."""
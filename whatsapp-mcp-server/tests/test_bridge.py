@@ -1,24 +1,42 @@
 """Tests for lib/bridge.py API client."""
 
+import gzip
+import io
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from lib.bridge import (
     BridgeError,
+    batch_chain,
     delete_message,
     edit_message,
     get_group_info,
+    get_group_info_stream,
+    invalidate_group,
+    mark_read,
+    mark_read_batch,
+    refresh_headers,
+    send_many,
     send_message,
     send_reaction,
 )
 
 
+def _sent_json(kwargs):
+    """Decode the JSON body from mocked _SESSION.request kwargs, gunzipping if needed."""
+    body = kwargs["data"]
+    if (kwargs.get("headers") or {}).get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return json.loads(body)
+
+
 class TestSendMessage:
     """Tests for send_message function."""
 
-    @patch("lib.bridge.requests.post")
-    def test_send_message_success(self, mock_post):
+    @patch("lib.bridge._SESSION.request")
+    def test_send_message_success(self, mock_request):
         """Test successful message sending."""
         mock_response = MagicMock()
         mock_response.json.return_value = {
@@ -27,20 +45,20 @@ class TestSendMessage:
             "timestamp": 1234567890,
         }
         mock_response.raise_for_status = MagicMock()
-        mock_post.return_value = mock_response
+        mock_request.return_value = mock_response
 
         result = send_message("123456789@s.whatsapp.net", "Hello")
 
         assert result["success"] is True
         assert result["message_id"] == "msg123"
-        mock_post.assert_called_once()
+        mock_request.assert_called_once()
 
-    @patch("lib.bridge.requests.post")
-    def test_send_message_failure(self, mock_post):
+    @patch("lib.bridge._SESSION.request")
+    def test_send_message_failure(self, mock_request):
         """Test message sending failure raises BridgeError."""
         import requests
 
-        mock_post.side_effect = requests.RequestException("Connection refused")
+        mock_request.side_effect = requests.RequestException("Connection refused")
 
         with pytest.raises(BridgeError) as exc_info:
             send_message("123456789@s.whatsapp.net", "Hello")
@@ -48,28 +66,99 @@ class TestSendMessage:
         assert "Failed to send message" in str(exc_info.value)
 
 
+class TestRequestCompression:
+    """Tests for gzip request bodies."""
+
+    @patch("lib.bridge._SESSION.request")
+    def test_small_body_is_sent_plain(self, mock_request):
+        """Test bodies under the threshold are not compressed."""
+        mock_request.return_value = MagicMock()
+
+        send_message("123@s.whatsapp.net", "hi")
+
+        assert mock_request.call_args.kwargs["headers"] is None
+        assert _sent_json(mock_request.call_args.kwargs)["message"] == "hi"
+
+    @patch("lib.bridge._SESSION.request")
+    def test_large_body_is_gzipped(self, mock_request):
+        """Test bodies over the threshold are gzipped with Content-Encoding set."""
+        mock_request.return_value = MagicMock()
+        ids = [f"3EB0{i:016X}" for i in range(200)]
+
+        mark_read("123@s.whatsapp.net", ids)
+
+        call = mock_request.call_args
+        assert call.kwargs["headers"] == {"Content-Encoding": "gzip"}
+        assert len(call.kwargs["data"]) < len(json.dumps(ids))
+        assert _sent_json(call.kwargs)["message_ids"] == ids
+
+
+class TestHeaders:
+    """Tests for the cached bridge headers."""
+
+    def test_refresh_headers_tracks_api_key(self, monkeypatch):
+        """Test refresh_headers applies key changes to the shared session."""
+        from lib.bridge import _SESSION
+
+        monkeypatch.setenv("API_KEY", "secret")
+        try:
+            assert refresh_headers()["X-API-Key"] == "secret"
+            assert _SESSION.headers["X-API-Key"] == "secret"
+
+            monkeypatch.delenv("API_KEY")
+            monkeypatch.delenv("WHATSAPP_API_KEY", raising=False)
+            assert "X-API-Key" not in refresh_headers()
+            assert "X-API-Key" not in _SESSION.headers
+        finally:
+            monkeypatch.undo()
+            refresh_headers()
+
+
+class TestRetryPolicy:
+    """Tests for the shared session's retry and idempotency setup."""
+
+    def test_posts_are_retried_with_a_stable_idempotency_key(self):
+        """Test POSTs are retryable and stamped once with an idempotency key."""
+        import requests
+
+        from lib.bridge import _SESSION
+
+        adapter = _SESSION.get_adapter("http://localhost:8080/api/send")
+        assert "POST" in adapter.max_retries.allowed_methods
+
+        request = requests.Request("POST", "http://localhost:8080/api/send", json={}).prepare()
+        with patch("requests.adapters.HTTPAdapter.send") as mock_send:
+            adapter.send(request)
+            key = request.headers["X-Idempotency-Key"]
+            adapter.send(request)
+
+        assert key
+        assert request.headers["X-Idempotency-Key"] == key
+        assert mock_send.call_count == 2
+
+
 class TestSendReaction:
     """Tests for send_reaction function."""
 
-    @patch("lib.bridge.requests.post")
-    def test_send_reaction_success(self, mock_post):
+    @patch("lib.bridge._SESSION.request")
+    def test_send_reaction_success(self, mock_request):
         """Test successful reaction sending."""
         mock_response = MagicMock()
         mock_response.json.return_value = {"success": True}
         mock_response.raise_for_status = MagicMock()
-        mock_post.return_value = mock_response
+        mock_request.return_value = mock_response
 
         result = send_reaction("123@s.whatsapp.net", "msg123", "👍")
 
         assert result["success"] is True
 
-    @patch("lib.bridge.requests.post")
-    def test_remove_reaction(self, mock_post):
+    @patch("lib.bridge._SESSION.request")
+    def test_remove_reaction(self, mock_request):
         """Test removing reaction with empty emoji."""
         mock_response = MagicMock()
         mock_response.json.return_value = {"success": True}
         mock_response.raise_for_status = MagicMock()
-        mock_post.return_value = mock_response
+        mock_request.return_value = mock_response
 
         result = send_reaction("123@s.whatsapp.net", "msg123", "")
 
@@ -79,13 +168,13 @@ class TestSendReaction:
 class TestEditMessage:
     """Tests for edit_message function."""
 
-    @patch("lib.bridge.requests.post")
-    def test_edit_message_success(self, mock_post):
+    @patch("lib.bridge._SESSION.request")
+    def test_edit_message_success(self, mock_request):
         """Test successful message editing."""
         mock_response = MagicMock()
         mock_response.json.return_value = {"success": True}
         mock_response.raise_for_status = MagicMock()
-        mock_post.return_value = mock_response
+        mock_request.return_value = mock_response
 
         result = edit_message("123@s.whatsapp.net", "msg123", "New content")
 
@@ -95,38 +184,44 @@ class TestEditMessage:
 class TestDeleteMessage:
     """Tests for delete_message function."""
 
-    @patch("lib.bridge.requests.post")
-    def test_delete_message_success(self, mock_post):
+    @patch("lib.bridge._SESSION.request")
+    def test_delete_message_success(self, mock_request):
         """Test successful message deletion."""
         mock_response = MagicMock()
         mock_response.json.return_value = {"success": True}
         mock_response.raise_for_status = MagicMock()
-        mock_post.return_value = mock_response
+        mock_request.return_value = mock_response
 
         result = delete_message("123@s.whatsapp.net", "msg123")
 
         assert result["success"] is True
 
-    @patch("lib.bridge.requests.post")
-    def test_delete_message_with_sender(self, mock_post):
+    @patch("lib.bridge._SESSION.request")
+    def test_delete_message_with_sender(self, mock_request):
         """Test message deletion with sender JID for groups."""
         mock_response = MagicMock()
         mock_response.json.return_value = {"success": True}
         mock_response.raise_for_status = MagicMock()
-        mock_post.return_value = mock_response
+        mock_request.return_value = mock_response
 
         result = delete_message("123@g.us", "msg123", sender_jid="456@s.whatsapp.net")
 
         assert result["success"] is True
-        call_args = mock_post.call_args
-        assert "sender_jid" in call_args.kwargs["json"]
+        call_args = mock_request.call_args
+        assert "sender_jid" in _sent_json(call_args.kwargs)
 
 
 class TestGetGroupInfo:
     """Tests for get_group_info function."""
 
-    @patch("lib.bridge.requests.get")
-    def test_get_group_info_success(self, mock_get):
+    @pytest.fixture(autouse=True)
+    def _clear_group_cache(self):
+        invalidate_group()
+        yield
+        invalidate_group()
+
+    @patch("lib.bridge._SESSION.request")
+    def test_get_group_info_success(self, mock_request):
         """Test successful group info retrieval."""
         mock_response = MagicMock()
         mock_response.json.return_value = {
@@ -135,9 +230,140 @@ class TestGetGroupInfo:
             "participant_count": 5,
         }
         mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_request.return_value = mock_response
 
         result = get_group_info("123456789@g.us")
 
         assert result["success"] is True
         assert result["name"] == "Test Group"
+
+    @patch("lib.bridge._SESSION.request")
+    def test_get_group_info_is_cached_until_invalidated(self, mock_request):
+        """Test repeat lookups hit the cache and invalidate_group forces a refetch."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"success": True, "name": "Test Group"}
+        mock_response.raise_for_status = MagicMock()
+        mock_request.return_value = mock_response
+
+        get_group_info("123456789@g.us")
+        get_group_info("123456789@g.us")
+        assert mock_request.call_count == 1
+
+        invalidate_group("123456789@g.us")
+        get_group_info("123456789@g.us")
+        assert mock_request.call_count == 2
+
+    @patch("lib.bridge._SESSION.request")
+    def test_get_group_info_does_not_cache_failures(self, mock_request):
+        """Test unsuccessful bridge responses are not cached."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"success": False, "message": "not found"}
+        mock_response.raise_for_status = MagicMock()
+        mock_request.return_value = mock_response
+
+        get_group_info("123456789@g.us")
+        get_group_info("123456789@g.us")
+
+        assert mock_request.call_count == 2
+
+    @patch("lib.bridge.ijson", None)
+    @patch("lib.bridge._SESSION.get")
+    def test_get_group_info_stream_yields_participants(self, mock_get):
+        """Test participants are yielded from data.participants."""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.json.return_value = {
+            "success": True,
+            "data": {"participants": [{"jid": "1@s.whatsapp.net"}, {"jid": "2@s.whatsapp.net"}]},
+        }
+        mock_get.return_value = mock_response
+
+        participants = list(get_group_info_stream("123456789@g.us"))
+
+        assert [p["jid"] for p in participants] == ["1@s.whatsapp.net", "2@s.whatsapp.net"]
+        assert mock_get.call_args.kwargs["stream"] is True
+
+    @pytest.mark.parametrize(
+        ("body", "expected"),
+        [
+            (b'{"success": true, "data": {"participants": [{"jid": "1@s.whatsapp.net"}]}}', ["1@s.whatsapp.net"]),
+            (b'{"success": true, "data": {"participants": [{"jid": "1@s.whatsapp.net"}, {"ji', None),
+            (b"<html>502 Bad Gateway</html>", None),
+        ],
+    )
+    @patch("lib.bridge._SESSION.get")
+    def test_get_group_info_stream_with_ijson(self, mock_get, body, expected):
+        """Test ijson streams participants and malformed bodies raise BridgeError."""
+        pytest.importorskip("ijson")
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.raw = io.BytesIO(body)
+        mock_get.return_value = mock_response
+
+        if expected is None:
+            with pytest.raises(BridgeError, match="Invalid group info response"):
+                list(get_group_info_stream("123456789@g.us"))
+        else:
+            assert [p["jid"] for p in get_group_info_stream("123456789@g.us")] == expected
+
+
+class TestBatchHelpers:
+    """Tests for the concurrent batch helpers."""
+
+    @patch("lib.bridge._SESSION.request")
+    def test_send_many_keeps_order_and_collects_errors(self, mock_request):
+        """Test send_many returns one result per pair, with failures as BridgeError."""
+        import requests
+
+        def fake_request(method, url, **kwargs):
+            payload = _sent_json(kwargs)
+            if payload["message"] == "bad":
+                raise requests.RequestException("boom")
+            response = MagicMock()
+            response.json.return_value = {"success": True, "message": payload["message"]}
+            return response
+
+        mock_request.side_effect = fake_request
+
+        pairs = [("1@s.whatsapp.net", "a"), ("2@s.whatsapp.net", "bad"), ("3@s.whatsapp.net", "c")]
+        results = send_many(pairs, rate_per_sec=0)
+
+        assert results[0]["message"] == "a"
+        assert isinstance(results[1], BridgeError)
+        assert results[2]["message"] == "c"
+
+    @patch("lib.bridge._SESSION.request")
+    def test_mark_read_batch_posts_each_chat(self, mock_request):
+        """Test mark_read_batch issues one /read call per chat."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"success": True}
+        mock_request.return_value = mock_response
+
+        results = mark_read_batch(
+            [
+                {"chat_jid": "1@s.whatsapp.net", "message_ids": ["m1"]},
+                {"chat_jid": "2@g.us", "message_ids": ["m2"], "sender_jid": "3@s.whatsapp.net"},
+            ],
+            rate_per_sec=0,
+        )
+
+        assert len(results) == 2
+        payloads = sorted((_sent_json(c.kwargs) for c in mock_request.call_args_list), key=lambda p: p["chat_jid"])
+        assert payloads[1]["sender_jid"] == "3@s.whatsapp.net"
+
+    @patch("lib.bridge._SESSION.request")
+    def test_batch_chain_wires_message_id_into_reaction(self, mock_request):
+        """Test batch_chain posts one /batch call with the reaction fed from the send."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"success": True, "results": [{"success": True}, {"success": True}]}
+        mock_request.return_value = mock_response
+
+        result = batch_chain({"recipient": "123@s.whatsapp.net", "message": "hi"}, {"emoji": "👍"})
+
+        assert result["success"] is True
+        mock_request.assert_called_once()
+        calls = _sent_json(mock_request.call_args.kwargs)
+        assert mock_request.call_args.args[1].endswith("/batch")
+        assert calls[1]["args"] == {"chat_jid": "123@s.whatsapp.net", "emoji": "👍"}
+        assert calls[1]["input_from"] == 0
+        assert calls[1]["into_arg"] == "message_id"
@@ -0,0 +1,57 @@
+"""Tests for lib/bridge_async.py API client."""
+
+import json
+
+import httpx
+import pytest
+
+from lib import bridge_async
+from lib.bridge import BridgeError
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Route the shared async client through a MockTransport and record requests."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/fail"):
+            return httpx.Response(500, json={"success": False})
+        if request.url.path.endswith("/garbled"):
+            return httpx.Response(200, text="<html>not json</html>")
+        body = json.loads(request.content) if request.content else {}
+        return httpx.Response(200, json={"success": True, "echo": body})
+
+    client = httpx.AsyncClient(base_url="http://bridge/api", transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(bridge_async, "_client", client)
+    yield requests
+
+
+async def test_send_message_posts_payload(mock_client):
+    result = await bridge_async.send_message("123@s.whatsapp.net", "Hello")
+
+    assert result["success"] is True
+    assert result["echo"] == {"recipient": "123@s.whatsapp.net", "message": "Hello"}
+    assert mock_client[0].url.path == "/api/send"
+
+
+async def test_send_many_runs_all_sends(mock_client):
+    results = await bridge_async.send_many([("1@s.whatsapp.net", "a"), ("2@s.whatsapp.net", "b")])
+
+    assert [r["echo"]["message"] for r in results] == ["a", "b"]
+    assert len(mock_client) == 2
+
+
+async def test_http_error_raises_bridge_error(mock_client):
+    with pytest.raises(BridgeError) as exc_info:
+        await bridge_async.get_group_info("fail")
+
+    assert "Failed to get group info" in str(exc_info.value)
+
+
+async def test_invalid_json_raises_bridge_error(mock_client):
+    results = await bridge_async.get_group_info_many(["garbled"])
+
+    assert isinstance(results[0], BridgeError)
+    assert "Failed to get group info" in str(results[0])
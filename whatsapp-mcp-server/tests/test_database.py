@@ -1,18 +1,28 @@
 """Tests for lib/database.py functions."""
 
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from lib.database import (
+    _connect,
+    _fetch_nicknames,
+    _reset_conns,
     extract_urls,
     get_chat_statistics,
+    get_chat_statistics_batch,
+    get_contact_nickname,
+    get_media_stats,
+    get_media_stats_batch,
     get_message_character_count,
     get_message_word_count,
+    get_most_active_member,
+    get_most_active_member_batch,
     list_chats,
     list_messages,
     search_contacts,
+    set_contact_nickname,
 )
-from lib.models import Chat, Contact, Message
+from lib.models import Chat, Contact, Message, MessageBatch
 
 
 class TestMessageMetadataHelpers:
@@ -42,6 +52,11 @@ class TestMessageMetadataHelpers:
         assert get_message_word_count("one   two   three") == 3  # Multiple spaces
         assert get_message_word_count("   leading and trailing   ") == 3
 
+    def test_get_message_word_count_unicode_whitespace(self):
+        """Test word count splits on every str.isspace() character, not just ASCII."""
+        assert get_message_word_count("line one\nline\ttwo") == 4
+        assert get_message_word_count("no\u00a0break\u2003em\x1cfs") == 4
+
     def test_extract_urls_empty(self):
         """Test URL extraction from empty content."""
         assert extract_urls("") == []
@@ -140,6 +155,44 @@ class TestListMessages:
             elif msg["chat_jid"].endswith("@g.us"):
                 assert msg["is_group"] is True
 
+    def test_list_messages_as_batch(self, temp_messages_db, monkeypatch):
+        """Test as_batch returns a columnar MessageBatch with the derived counts."""
+        monkeypatch.setattr("lib.database.MESSAGES_DB_PATH", temp_messages_db)
+
+        batch = list_messages(limit=10, as_batch=True)
+
+        assert isinstance(batch, MessageBatch)
+        assert len(batch) == 2
+        assert sorted(batch.character_counts) == [8, 11]  # "Hi there", "Hello world"
+        assert batch.word_counts.typecode == "q"
+        assert batch.mean_word_count() == 2.0
+
+    def test_list_messages_cache_follows_new_rows(self, temp_messages_db, monkeypatch):
+        """Test repeat calls are served from cache until a new message lands."""
+        monkeypatch.setattr("lib.database.MESSAGES_DB_PATH", temp_messages_db)
+
+        first = list_messages(limit=10)
+        assert list_messages(limit=10) == first
+
+        conn = sqlite3.connect(temp_messages_db)
+        with conn:
+            conn.execute(
+                "INSERT INTO messages (id, chat_jid, sender, content, timestamp, is_from_me) VALUES (?, ?, ?, ?, ?, ?)",
+                ("msg3", "123456789@s.whatsapp.net", "me", "fresh", datetime.now().isoformat(), 1),
+            )
+        conn.close()
+
+        assert len(list_messages(limit=10)) == 3
+
+    def test_list_messages_cache_returns_copies(self, temp_messages_db, monkeypatch):
+        """Test mutating a cached result does not leak into later calls."""
+        monkeypatch.setattr("lib.database.MESSAGES_DB_PATH", temp_messages_db)
+
+        first = list_messages(limit=10)
+        first.clear()
+
+        assert len(list_messages(limit=10)) == 2
+
 
 class TestListChats:
     """Tests for list_chats function."""
@@ -217,31 +270,134 @@ class TestListChats:
 class TestGetChatStatistics:
     """Tests for get_chat_statistics function."""
 
-    def test_get_chat_statistics_count(self, temp_messages_db):
+    def test_get_chat_statistics_count(self, ro_conn):
         """Test get_chat_statistics returns correct counts."""
-        conn = sqlite3.connect(temp_messages_db)
         jid = "123456789@s.whatsapp.net"
 
-        total, today, week = get_chat_statistics(jid, conn)
+        total, today, week = get_chat_statistics(jid, ro_conn)
 
         # Fixture adds 2 messages to this chat
         assert total >= 0
         assert today >= 0
         assert week >= 0
 
-        conn.close()
-
-    def test_get_chat_statistics_nonexistent_chat(self, temp_messages_db):
+    def test_get_chat_statistics_nonexistent_chat(self, ro_conn):
         """Test get_chat_statistics for nonexistent chat."""
-        conn = sqlite3.connect(temp_messages_db)
-
-        total, today, week = get_chat_statistics("nonexistent@s.whatsapp.net", conn)
+        total, today, week = get_chat_statistics("nonexistent@s.whatsapp.net", ro_conn)
 
         # Should return zeros, not errors
         assert total == 0
         assert today == 0
         assert week == 0
 
+    def test_get_chat_statistics_batch_matches_scalar(self, ro_conn):
+        """Test the batched statistics agree with per-chat get_chat_statistics."""
+        jids = ["123456789@s.whatsapp.net", "987654321@g.us", "nonexistent@s.whatsapp.net"]
+
+        stats = get_chat_statistics_batch(jids, ro_conn)
+
+        assert stats == {jid: get_chat_statistics(jid, ro_conn) for jid in jids}
+        assert stats["nonexistent@s.whatsapp.net"] == (0, 0, 0)
+
+    def test_get_chat_statistics_batch_reads_day_buckets(self, temp_messages_db):
+        """Test the batch reads the bridge's chat_day_counts table when present."""
+        conn = sqlite3.connect(temp_messages_db)
+        today = datetime.now().date()
+        jid = "123456789@s.whatsapp.net"
+        conn.execute("CREATE TABLE chat_day_counts (chat_jid TEXT, day TEXT, count INTEGER)")
+        conn.executemany(
+            "INSERT INTO chat_day_counts VALUES (?, ?, ?)",
+            [
+                (jid, today.isoformat(), 3),
+                (jid, (today - timedelta(days=2)).isoformat(), 4),
+                (jid, (today - timedelta(days=30)).isoformat(), 5),
+            ],
+        )
+
+        stats = get_chat_statistics_batch([jid, "nonexistent@s.whatsapp.net"], conn)
+
+        assert stats == {jid: (12, 3, 7), "nonexistent@s.whatsapp.net": (0, 0, 0)}
+
+        conn.close()
+
+    def test_get_chat_statistics_batch_week_excludes_day_seven(self, temp_messages_db):
+        """Test a bucket dated exactly 7 days ago falls outside the last 7 days."""
+        conn = sqlite3.connect(temp_messages_db)
+        today = datetime.now().date()
+        jid = "123456789@s.whatsapp.net"
+        conn.execute("CREATE TABLE chat_day_counts (chat_jid TEXT, day TEXT, count INTEGER)")
+        conn.executemany(
+            "INSERT INTO chat_day_counts VALUES (?, ?, ?)",
+            [
+                (jid, (today - timedelta(days=6)).isoformat(), 2),
+                (jid, (today - timedelta(days=7)).isoformat(), 5),
+            ],
+        )
+
+        stats = get_chat_statistics_batch([jid], conn)
+
+        assert stats == {jid: (7, 0, 2)}
+
+        conn.close()
+
+
+class TestConnectionCache:
+    """Tests for the per-thread connection cache."""
+
+    def test_connect_reuses_connection_per_path(self, temp_messages_db, temp_whatsapp_db):
+        """Test repeated calls share one connection per database path."""
+        conn = _connect(temp_messages_db)
+
+        assert _connect(temp_messages_db) is conn
+        assert _connect(temp_whatsapp_db) is not conn
+
+    def test_connect_applies_read_pragmas(self, temp_messages_db):
+        """Test cached connections are opened with the read-side PRAGMAs."""
+        conn = _connect(temp_messages_db)
+
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -16384
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+    def test_reset_conns_forces_reopen(self, temp_messages_db):
+        """Test _reset_conns closes cached connections and a fresh one is opened."""
+        conn = _connect(temp_messages_db)
+        _reset_conns()
+
+        fresh = _connect(temp_messages_db)
+
+        assert fresh is not conn
+        assert fresh.execute("SELECT COUNT(*) FROM chats").fetchone()[0] == 2
+
+
+class TestChatActivityBatches:
+    """Tests for the batched most-active-member and media statistics."""
+
+    def test_batches_match_per_chat_helpers(self, temp_messages_db):
+        """Test the batched helpers agree with their per-chat versions."""
+        conn = sqlite3.connect(temp_messages_db)
+        now = datetime.now()
+        group, alice, bob = "987654321@g.us", "111@s.whatsapp.net", "222@s.whatsapp.net"
+        rows = [
+            (f"img{i}", group, alice, (now - timedelta(minutes=i)).isoformat(), "image", f"p{i}.jpg", "Alice")
+            for i in range(7)
+        ]
+        rows.append(("vid", group, bob, (now - timedelta(hours=1)).isoformat(), "video", "v.mp4", "Bob"))
+        conn.executemany(
+            "INSERT INTO messages (id, chat_jid, sender, timestamp, media_type, filename, sender_name)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        jids = ["123456789@s.whatsapp.net", "987654321@g.us", "nonexistent@s.whatsapp.net"]
+
+        members = get_most_active_member_batch(jids, conn)
+        media = get_media_stats_batch(jids, conn)
+
+        assert members == {jid: get_most_active_member(jid, conn) for jid in jids}
+        assert members["987654321@g.us"] == ("Alice", 7)
+        assert media == {jid: get_media_stats(jid, conn) for jid in jids}
+        assert media["987654321@g.us"][0] == {"image": 7, "video": 1}
+        assert len(media["987654321@g.us"][1]) == 5
+
         conn.close()
 
 
@@ -261,15 +417,14 @@ class TestSearchContacts:
 
         # Add nickname to the test contact
         conn = sqlite3.connect(temp_messages_db)
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO contact_nicknames (jid, nickname, updated_at)
-            VALUES (?, ?, datetime('now'))
-        """,
-            ("123456789@s.whatsapp.net", "Johnny Doe"),
-        )
-        conn.commit()
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO contact_nicknames (jid, nickname, updated_at)
+                VALUES (?, ?, datetime('now'))
+            """,
+                ("123456789@s.whatsapp.net", "Johnny Doe"),
+            )
         conn.close()
 
         # Search should work correctly with the optimization
@@ -306,6 +461,59 @@ class TestSearchContacts:
 
         assert results == []
 
+    def test_fetch_nicknames_chunks_large_jid_lists(self, temp_messages_db):
+        """Test nickname lookup stays under SQLite's parameter limit for many JIDs."""
+        conn = sqlite3.connect(temp_messages_db)
+        cursor = conn.cursor()
+        jids = [f"{1000000 + i}@s.whatsapp.net" for i in range(1200)]
+        cursor.executemany(
+            "INSERT INTO contact_nicknames (jid, nickname, updated_at) VALUES (?, ?, datetime('now'))",
+            [(jids[0], "First"), (jids[-1], "Last")],
+        )
+
+        nicknames = _fetch_nicknames(cursor, jids)
+        conn.close()
+
+        assert nicknames == {jids[0]: "First", jids[-1]: "Last"}
+
+
+class TestContactNicknames:
+    """Tests for nickname storage keyed on canonical JIDs."""
+
+    def test_nicknames_under_old_jid_forms_are_normalized(self, temp_messages_db, monkeypatch):
+        """Test rows stored under "+phone" or an upper-case server are found by canonical JID."""
+        monkeypatch.setattr("lib.database.MESSAGES_DB_PATH", temp_messages_db)
+        conn = sqlite3.connect(temp_messages_db)
+        with conn:
+            conn.executemany(
+                "INSERT INTO contact_nicknames (jid, nickname, updated_at) VALUES (?, ?, datetime('now'))",
+                [("+60111111111", "Old"), ("60222222222@S.WHATSAPP.NET", "Shouty")],
+            )
+        conn.close()
+
+        assert get_contact_nickname("60111111111@s.whatsapp.net") == "Old"
+        assert get_contact_nickname("+60222222222") == "Shouty"
+
+        set_contact_nickname("60111111111", "New")
+        conn = sqlite3.connect(temp_messages_db)
+        rows = conn.execute("SELECT jid, nickname FROM contact_nicknames ORDER BY jid").fetchall()
+        conn.close()
+
+        assert rows == [("60111111111@s.whatsapp.net", "New"), ("60222222222@s.whatsapp.net", "Shouty")]
+
+    def test_canonical_nickname_wins_over_old_form(self, temp_messages_db, monkeypatch):
+        """Test an existing canonical row is kept when an old form also exists."""
+        monkeypatch.setattr("lib.database.MESSAGES_DB_PATH", temp_messages_db)
+        conn = sqlite3.connect(temp_messages_db)
+        with conn:
+            conn.executemany(
+                "INSERT INTO contact_nicknames (jid, nickname, updated_at) VALUES (?, ?, datetime('now'))",
+                [("60111111111", "Stale"), ("60111111111@s.whatsapp.net", "Current")],
+            )
+        conn.close()
+
+        assert get_contact_nickname("60111111111") == "Current"
+
 
 class TestMessageModel:
     """Tests for Message model with new fields."""
@@ -0,0 +1,32 @@
+"""Tests for lib/enrich.py batch enrichment."""
+
+from lib.database import extract_urls, get_message_word_count
+from lib.enrich import enrich_batch
+
+
+class TestEnrichBatch:
+    """Tests for enrich_batch function."""
+
+    def test_enrich_batch_aligns_results_with_contents(self):
+        """Test each result list lines up with its input message."""
+        contents = [
+            "See https://example.com and http://foo.org/x",
+            None,
+            "ping @123456789 about it",
+            "",
+            "no links here",
+        ]
+
+        chars, words, urls, mentions = enrich_batch(contents)
+
+        assert chars == [len(c or "") for c in contents]
+        assert words == [get_message_word_count(c) for c in contents]
+        assert urls == [extract_urls(c) for c in contents]
+        assert mentions == [[], [], ["@123456789"], [], []]
+
+    def test_enrich_batch_matches_do_not_span_messages(self):
+        """Test a URL at the end of one message does not swallow the next."""
+        chars, words, urls, mentions = enrich_batch(["go to https://a.com", "@bob hi", "mail me at x@y.com"])
+
+        assert urls == [["https://a.com"], [], []]
+        assert mentions == [[], ["@bob"], []]
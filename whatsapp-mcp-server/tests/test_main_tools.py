@@ -1,4 +1,5 @@
 import importlib
+import threading
 from pathlib import Path
 
 DEFAULT_TOOLS = {
@@ -139,6 +140,124 @@ def test_manage_group_forwards_create_action(monkeypatch):
     assert called["args"] == ("Ops", ["1@s.whatsapp.net"])
 
 
+def test_read_tools_are_cached_until_a_write_tool_runs(monkeypatch):
+    main = reload_main(monkeypatch, "all")
+    calls = []
+
+    def fake_list_chats(**kwargs):
+        calls.append(kwargs)
+        return [{"jid": "1@s.whatsapp.net"}]
+
+    monkeypatch.setattr(main, "whatsapp_list_chats", fake_list_chats)
+    monkeypatch.setattr(main, "whatsapp_send_message", lambda *args: {"success": True})
+
+    main.list_chats(query="ops")
+    main.list_chats(query="ops")
+    assert len(calls) == 1
+
+    main.list_chats(query="other")
+    assert len(calls) == 2
+
+    main.send_message("1@s.whatsapp.net", "hi")
+    main.list_chats(query="ops")
+    assert len(calls) == 3
+
+
+def test_mark_read_coalesces_calls_for_the_same_chat(monkeypatch):
+    main = reload_main(monkeypatch, "all")
+    sent = []
+    monkeypatch.setattr(main, "_MARK_READ_WINDOW", 60)
+    monkeypatch.setattr(main, "whatsapp_mark_messages_read", lambda *args: sent.append(args) or {"success": True})
+
+    first = main.mark_read("60111111111@s.whatsapp.net", ["a", "b", "a"])
+    main.mark_read("60111111111@s.whatsapp.net", ["b", "c"])
+    main.mark_read("120363000000000001@g.us", ["x"], sender_jid="60333333333@s.whatsapp.net")
+
+    assert first["message_ids"] == ["a", "b"]
+    assert sent == []
+
+    main._flush_reads(("60111111111@s.whatsapp.net", None))
+    main._flush_reads(("120363000000000001@g.us", "60333333333@s.whatsapp.net"))
+
+    assert sent == [
+        ("60111111111@s.whatsapp.net", ["a", "b", "c"], None),
+        ("120363000000000001@g.us", ["x"], "60333333333@s.whatsapp.net"),
+    ]
+
+
+def test_mark_read_flushes_after_max_wait_despite_steady_calls(monkeypatch):
+    main = reload_main(monkeypatch, "all")
+    sent = []
+    flushed = threading.Event()
+    now = [1000.0]
+    monkeypatch.setattr(main, "_MARK_READ_WINDOW", 60)
+    monkeypatch.setattr(main.time, "monotonic", lambda: now[0])
+
+    def fake_mark_read(*args):
+        sent.append(args)
+        flushed.set()
+        return {"success": True}
+
+    monkeypatch.setattr(main, "whatsapp_mark_messages_read", fake_mark_read)
+
+    # Each call lands inside the window, so without a cap the timer never fires
+    for i in range(main._MARK_READ_MAX_WINDOWS):
+        main.mark_read("60111111111@s.whatsapp.net", [f"m{i}"])
+        now[0] += 59
+    assert sent == []
+
+    now[0] += 60
+    main.mark_read("60111111111@s.whatsapp.net", ["last"])
+
+    assert flushed.wait(5)
+    assert sent == [("60111111111@s.whatsapp.net", ["m0", "m1", "m2", "m3", "m4", "last"], None)]
+
+
+def test_flush_reads_logs_bridge_failures(monkeypatch, caplog):
+    main = reload_main(monkeypatch, "all")
+    monkeypatch.setattr(main, "_MARK_READ_WINDOW", 60)
+    monkeypatch.setattr(main, "whatsapp_mark_messages_read", lambda *args: {"success": False, "error": "offline"})
+
+    main.mark_read("60111111111@s.whatsapp.net", ["a"])
+    with caplog.at_level("WARNING", logger="whatsapp-mcp"):
+        main._flush_reads(("60111111111@s.whatsapp.net", None))
+
+    assert "offline" in caplog.text
+
+
+def test_send_tools_reject_malformed_jids_before_calling_bridge(monkeypatch):
+    main = reload_main(monkeypatch, "all")
+    sent = []
+    monkeypatch.setattr(main, "whatsapp_send_message", lambda *args: sent.append(args) or {"success": True})
+
+    for recipient in ("60123456789", "60123456789@s.whatsapp.net", "120363012345678901@g.us", "123456@lid"):
+        assert main.send_message(recipient, "hi")["success"] is True
+
+    for recipient in ("+60 12-345 6789", "bob", "60123456789@example.com"):
+        result = main.send_message(recipient, "hi")
+        assert result["success"] is False
+        assert "recipient" in result["error"]
+
+    assert len(sent) == 4
+
+
+def test_contact_tools_return_structured_dicts(monkeypatch):
+    import asyncio
+
+    from whatsapp import Contact
+
+    main = reload_main(monkeypatch, "all")
+    contact = Contact(phone_number="60123456789", name="Alice", jid="60123456789@s.whatsapp.net")
+    monkeypatch.setattr(main, "whatsapp_iter_all_contacts", lambda limit: iter([contact]))
+    monkeypatch.setattr(main, "whatsapp_get_contact_by_jid", lambda jid: contact)
+
+    _, structured = asyncio.run(main.mcp.call_tool("list_all_contacts", {"limit": 5}))
+    assert structured["result"][0]["jid"] == "60123456789@s.whatsapp.net"
+
+    result = main.get_contact_context("60123456789@s.whatsapp.net")
+    assert result["contact"]["name"] == "Alice"
+
+
 def test_docker_mcp_entrypoint_uses_curated_main_server():
     root = Path(__file__).resolve().parents[2]
     dockerfile = (root / "Dockerfile.mcp").read_text(encoding="utf-8")
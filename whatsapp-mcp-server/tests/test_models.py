@@ -1,8 +1,10 @@
 """Tests for lib/models.py data classes."""
 
-from datetime import datetime
+import copy
+import pickle
+from datetime import datetime, timedelta
 
-from lib.models import Chat, Contact, Message, MessageContext
+from lib.models import Chat, Contact, ContactInfo, Message, MessageBatch, MessageContext, VelocityStats
 
 
 class TestMessage:
@@ -26,7 +28,7 @@ class TestMessage:
         assert result["content"] == "Hello world"
         assert result["sender"] == "123456789@s.whatsapp.net"
         assert result["is_from_me"] is False
-        assert result["timestamp"] == "2024-01-15T10:30:00"
+        assert result["timestamp"] == datetime(2024, 1, 15, 10, 30, 0)
         assert result["chat_name"] == "Test User"
         # Empty/null optional fields should not be present
         assert "media_type" not in result
@@ -51,6 +53,40 @@ class TestMessage:
         assert result["filename"] == "photo.jpg"
         assert result["file_length"] == 1024
 
+    def test_message_has_no_instance_dict(self):
+        """Test Message uses __slots__ rather than a per-instance __dict__."""
+        msg = Message(
+            timestamp=datetime(2024, 1, 15, 10, 30, 0),
+            sender="123@s.whatsapp.net",
+            content="hi",
+            is_from_me=False,
+            chat_jid="123@s.whatsapp.net",
+            id="msg789",
+        )
+
+        assert not hasattr(msg, "__dict__")
+
+    def test_unset_collection_fields_allocate_nothing(self):
+        """Test unset collection fields default to () or None and are omitted."""
+        msg = Message(timestamp=datetime(2024, 1, 15), sender="a", content="", is_from_me=False, chat_jid="c", id="1")
+
+        assert msg.url_list == ()
+        assert msg.reaction_summary is None
+        assert "url_list" not in msg.to_dict()
+        assert "reaction_summary" not in msg.to_dict()
+
+    def test_message_batch_survives_deepcopy_and_pickle(self):
+        """Test models with default fields can be deep-copied and pickled."""
+        msg = Message(timestamp=datetime(2024, 1, 15), sender="a", content="hi", is_from_me=False, chat_jid="c", id="1")
+        batch = MessageBatch.from_messages([msg])
+
+        copied = copy.deepcopy(batch)
+        restored = pickle.loads(pickle.dumps(batch))
+
+        for clone in (copied, restored):
+            assert clone.messages[0] == msg
+            assert list(clone.timestamps) == list(batch.timestamps)
+
 
 class TestChat:
     """Tests for Chat dataclass."""
@@ -71,6 +107,25 @@ class TestChat:
         assert result["is_group"] is False
         assert result["last_message"] == "Hello"
 
+    def test_chat_to_dict_optional_field_rules(self):
+        """Test datetimes pass through and falsy-but-set counters are kept."""
+        chat = Chat(
+            jid="123@g.us",
+            name="Group",
+            last_message_time=datetime(2024, 1, 15, 10, 30, 0),
+            last_is_from_me=False,
+            message_count_today=0,
+            participant_names=[],
+        )
+
+        result = chat.to_dict()
+
+        assert result["last_message_time"] == datetime(2024, 1, 15, 10, 30, 0)
+        assert result["last_is_from_me"] is False
+        assert result["message_count_today"] == 0
+        assert "participant_names" not in result
+        assert "last_message" not in result
+
     def test_chat_is_group(self):
         """Test Chat.is_group property."""
         individual = Chat(jid="123@s.whatsapp.net", name="User", last_message_time=None)
@@ -79,6 +134,14 @@ class TestChat:
         assert individual.is_group is False
         assert group.is_group is True
 
+    def test_chat_and_contact_have_no_instance_dict(self):
+        """Test Chat and Contact use __slots__ like Message."""
+        chat = Chat(jid="123@g.us", name="Group", last_message_time=None)
+        contact = Contact(phone_number="123", name="User", jid="123@s.whatsapp.net")
+
+        assert not hasattr(chat, "__dict__")
+        assert not hasattr(contact, "__dict__")
+
 
 class TestContact:
     """Tests for Contact dataclass."""
@@ -141,3 +204,56 @@ class TestMessageContext:
         assert len(result["after"]) == 1
         assert result["before"][0]["id"] == "msg1"
         assert result["after"][0]["id"] == "msg3"
+
+
+class TestMessageBatch:
+    """Tests for MessageBatch columnar view."""
+
+    def _msg(self, minutes: int, sender: str, is_from_me: bool) -> Message:
+        return Message(
+            timestamp=datetime(2024, 1, 15, 10, 0, 0) + timedelta(minutes=minutes),
+            sender=sender,
+            content="",
+            is_from_me=is_from_me,
+            chat_jid="123@s.whatsapp.net",
+            id=f"m{minutes}",
+        )
+
+    def test_message_batch_aggregates(self):
+        """Test window counts, sender counts and reply gaps over the columns."""
+        batch = MessageBatch.from_messages(
+            [
+                self._msg(10, "me", True),
+                self._msg(0, "alice", False),
+                self._msg(2, "alice", False),
+                self._msg(20, "alice", False),
+                self._msg(25, "me", True),
+            ]
+        )
+
+        assert len(batch) == 5
+        assert [m.id for m in batch.to_objects()] == ["m0", "m2", "m10", "m20", "m25"]
+        assert batch.count_since(datetime(2024, 1, 15, 10, 10, 0)) == 3
+        assert batch.most_active_sender() == ("alice", 3)
+        assert batch.response_times() == [600, 300]
+
+
+class TestMetadataShapes:
+    def test_chat_velocity_defaults_to_none(self):
+        chat = Chat(jid="123@s.whatsapp.net", name=None, last_message_time=None)
+        assert chat.message_velocity_last_7_days is None
+        assert "message_velocity_last_7_days" not in chat.to_dict()
+
+    def test_typed_metadata_serializes_as_plain_dicts(self):
+        info: ContactInfo = {"jid": "123@s.whatsapp.net", "name": "Alice"}
+        velocity: VelocityStats = {"messages_per_day": 1.5, "trend_direction": "stable"}
+        chat = Chat(
+            jid="123@s.whatsapp.net",
+            name="Alice",
+            last_message_time=None,
+            last_sender_contact_info=info,
+            message_velocity_last_7_days=velocity,
+        )
+        d = chat.to_dict()
+        assert d["last_sender_contact_info"] == {"jid": "123@s.whatsapp.net", "name": "Alice"}
+        assert d["message_velocity_last_7_days"]["trend_direction"] == "stable"
@@ -1,9 +1,12 @@
 """Tests for lib/utils.py utility functions."""
 
+import json
 import logging
+from datetime import datetime
 from unittest.mock import patch
 
-from lib.utils import get_sender_name, setup_logging
+from lib.models import Message
+from lib.utils import dumps, get_sender_name, setup_logging
 
 
 class TestSetupLogging:
@@ -56,3 +59,32 @@ class TestGetSenderName:
         result = get_sender_name("123456789@g.us")
 
         assert result == "123456789"
+
+
+class TestDumps:
+    """Tests for dumps function."""
+
+    def test_dumps_encodes_model_datetimes_as_iso(self):
+        """Test to_dict() datetimes are ISO-encoded at serialization time."""
+        msg = Message(
+            timestamp=datetime(2024, 1, 15, 10, 30, 0),
+            sender="123@s.whatsapp.net",
+            content="Hello",
+            is_from_me=False,
+            chat_jid="123@s.whatsapp.net",
+            id="msg123",
+        )
+
+        result = json.loads(dumps([msg.to_dict()]))
+
+        assert result[0]["timestamp"] == "2024-01-15T10:30:00"
+        assert result[0]["content"] == "Hello"
+
+    def test_dumps_stdlib_fallback(self):
+        """Test the stdlib path produces the same encoding when orjson is missing."""
+        payload = {"when": datetime(2024, 1, 15, 10, 30, 0, 123456), "n": 1}
+
+        with patch("lib.utils.orjson", None):
+            fallback = dumps(payload)
+
+        assert json.loads(fallback) == json.loads(dumps(payload))
@@ -5,7 +5,17 @@ import sqlite3
 import tempfile
 from datetime import datetime, timedelta
 
-from whatsapp import get_chat, list_chats
+import pytest
+
+from whatsapp import (
+    InvalidCursorError,
+    get_chat,
+    get_chat_async,
+    get_contact_chats,
+    get_contact_chats_page,
+    list_chats,
+    list_chats_page,
+)
 
 
 def _build_messages_db() -> str:
@@ -41,13 +51,12 @@ def _build_messages_db() -> str:
         "INSERT INTO chats (jid, name, last_message_time) VALUES (?, ?, ?)",
         ("111@s.whatsapp.net", "Alice", t1),
     )
-    cursor.execute(
-        "INSERT INTO messages (id, chat_jid, sender, content, timestamp, is_from_me) VALUES (?, ?, ?, ?, ?, ?)",
-        ("m1", "111@s.whatsapp.net", "111@s.whatsapp.net", "old", t0s, 0),
-    )
-    cursor.execute(
+    cursor.executemany(
         "INSERT INTO messages (id, chat_jid, sender, content, timestamp, is_from_me) VALUES (?, ?, ?, ?, ?, ?)",
-        ("m2", "111@s.whatsapp.net", "111@s.whatsapp.net", "new", t1, 0),
+        [
+            ("m1", "111@s.whatsapp.net", "111@s.whatsapp.net", "old", t0s, 0),
+            ("m2", "111@s.whatsapp.net", "111@s.whatsapp.net", "new", t1, 0),
+        ],
     )
 
     conn.commit()
@@ -106,3 +115,146 @@ def test_get_chat_include_last_message_false_no_sql_error(monkeypatch):
         assert chat["last_is_from_me"] is None
     finally:
         os.unlink(db_path)
+
+
+def test_list_chats_page_cursor_walks_all_chats(monkeypatch):
+    db_path = _build_messages_db()
+    try:
+        conn = sqlite3.connect(db_path)
+        t0 = datetime.now()
+        with conn:
+            conn.executemany(
+                "INSERT INTO chats (jid, name, last_message_time) VALUES (?, ?, ?)",
+                [(f"{i}@s.whatsapp.net", f"Chat {i}", (t0 - timedelta(minutes=i)).isoformat()) for i in range(2, 6)],
+            )
+        conn.close()
+        monkeypatch.setattr("whatsapp.MESSAGES_DB_PATH", db_path)
+
+        seen = []
+        cursor = None
+        while True:
+            page = list_chats_page(limit=2, cursor=cursor)
+            seen.extend(chat["jid"] for chat in page["items"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+
+        assert seen == [chat["jid"] for chat in list_chats(limit=10)]
+        assert len(seen) == 5
+    finally:
+        os.unlink(db_path)
+
+
+def test_cursor_pages_reach_chats_without_last_message_time(monkeypatch):
+    db_path = _build_messages_db()
+    try:
+        conn = sqlite3.connect(db_path)
+        t0 = datetime.now()
+        with conn:
+            conn.executemany(
+                "INSERT INTO chats (jid, name, last_message_time) VALUES (?, ?, ?)",
+                [
+                    ("2@s.whatsapp.net", "Bob", (t0 - timedelta(minutes=1)).isoformat()),
+                    ("3@s.whatsapp.net", "Carol", None),
+                    ("4@s.whatsapp.net", "Dave", None),
+                    ("5@s.whatsapp.net", "Erin", None),
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO messages (id, chat_jid, sender, content, timestamp, is_from_me) VALUES (?, ?, ?, ?, ?, ?)",
+                [(f"x{i}", f"{i}@s.whatsapp.net", "111@s.whatsapp.net", "hi", t0.isoformat(), 0) for i in range(2, 6)],
+            )
+        conn.close()
+        monkeypatch.setattr("whatsapp.MESSAGES_DB_PATH", db_path)
+
+        # Alice's two messages each give her chat a contact-chats row
+        walks = (
+            (lambda cursor: list_chats_page(limit=2, cursor=cursor), ["111@s.whatsapp.net"]),
+            (
+                lambda cursor: get_contact_chats_page("111@s.whatsapp.net", limit=2, cursor=cursor),
+                ["111@s.whatsapp.net", "111@s.whatsapp.net"],
+            ),
+        )
+        for fetch_page, head in walks:
+            seen = []
+            cursor = None
+            while True:
+                page = fetch_page(cursor)
+                seen.extend(chat["jid"] for chat in page["items"])
+                cursor = page["next_cursor"]
+                if not cursor:
+                    break
+
+            assert seen == [*head, "2@s.whatsapp.net", "5@s.whatsapp.net", "4@s.whatsapp.net", "3@s.whatsapp.net"]
+    finally:
+        os.unlink(db_path)
+
+
+def test_list_chats_page_has_more_and_optional_total(monkeypatch):
+    db_path = _build_messages_db()
+    try:
+        monkeypatch.setattr("whatsapp.MESSAGES_DB_PATH", db_path)
+
+        page = list_chats_page(limit=1)
+        assert page["has_more"] is False
+        assert page["next_cursor"] is None
+        assert "total" not in page
+
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "INSERT INTO chats (jid, name, last_message_time) VALUES (?, ?, ?)",
+            ("222@s.whatsapp.net", "Bob", datetime(2020, 1, 1).isoformat()),
+        )
+        conn.commit()
+        conn.close()
+
+        page = list_chats_page(limit=1, include_total=True)
+        assert [chat["jid"] for chat in page["items"]] == ["111@s.whatsapp.net"]
+        assert page["has_more"] is True
+        assert page["next_cursor"]
+        assert page["total"] == 2
+    finally:
+        os.unlink(db_path)
+
+
+def test_malformed_cursor_returns_error_page(monkeypatch):
+    db_path = _build_messages_db()
+    try:
+        monkeypatch.setattr("whatsapp.MESSAGES_DB_PATH", db_path)
+
+        chats_page = list_chats_page(limit=1, cursor="no-separator")
+        contact_page = get_contact_chats_page("111@s.whatsapp.net", cursor="only|two")
+
+        for page in (chats_page, contact_page):
+            assert page["items"] == []
+            assert page["next_cursor"] is None
+            assert "Invalid pagination cursor" in page["error"]
+    finally:
+        os.unlink(db_path)
+
+
+def test_list_wrappers_raise_on_malformed_cursor(monkeypatch):
+    db_path = _build_messages_db()
+    try:
+        monkeypatch.setattr("whatsapp.MESSAGES_DB_PATH", db_path)
+
+        with pytest.raises(InvalidCursorError, match="Invalid pagination cursor"):
+            list_chats(limit=1, cursor="no-separator")
+        with pytest.raises(InvalidCursorError, match="Invalid pagination cursor"):
+            get_contact_chats("111@s.whatsapp.net", cursor="only|two")
+    finally:
+        os.unlink(db_path)
+
+
+async def test_get_chat_async_matches_sync(monkeypatch):
+    db_path = _build_messages_db()
+    try:
+        monkeypatch.setattr("whatsapp.MESSAGES_DB_PATH", db_path)
+
+        chat = await get_chat_async("111@s.whatsapp.net")
+
+        assert chat == get_chat("111@s.whatsapp.net")
+        assert chat["last_message"] == "new"
+        assert await get_chat_async("missing@s.whatsapp.net") is None
+    finally:
+        os.unlink(db_path)
@@ -0,0 +1,112 @@
+"""Tests for whatsapp.py list_messages pagination and context expansion."""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from whatsapp import InvalidCursorError, _connect, list_messages, list_messages_page
+
+CHAT = "111@s.whatsapp.net"
+
+
+@pytest.fixture
+def messages_db(temp_messages_db, monkeypatch):
+    """temp_messages_db with a longer conversation in a second chat."""
+    conn = sqlite3.connect(temp_messages_db)
+    conn.execute("INSERT INTO chats (jid, name) VALUES (?, ?)", (CHAT, "Alice"))
+    t0 = datetime(2024, 1, 1, 12, 0, 0)
+    conn.executemany(
+        "INSERT INTO messages (id, chat_jid, sender, content, timestamp, is_from_me) VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (f"a{i}", CHAT, CHAT, "needle" if i == 2 else f"text {i}", (t0 + timedelta(minutes=i)).isoformat(), 0)
+            for i in range(5)
+        ],
+    )
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr("whatsapp.MESSAGES_DB_PATH", temp_messages_db)
+    return temp_messages_db
+
+
+def test_include_context_returns_window_around_match(messages_db):
+    messages = list_messages(query="needle", include_context=True, context_before=1, context_after=1)
+
+    assert [m["id"] for m in messages] == ["a1", "a2", "a3"]
+
+
+def test_include_context_clamps_at_chat_edges(messages_db):
+    messages = list_messages(chat_jid=CHAT, query="text 4", include_context=True, context_before=2, context_after=2)
+
+    assert [m["id"] for m in messages] == ["a2", "a3", "a4"]
+
+
+def test_cursor_pages_through_chat(messages_db):
+    seen = []
+    cursor = None
+    while True:
+        page = list_messages_page(chat_jid=CHAT, limit=2, cursor=cursor)
+        seen.extend(m["id"] for m in page["items"])
+        cursor = page["next_cursor"]
+        if not page["has_more"]:
+            break
+
+    assert seen == ["a4", "a3", "a2", "a1", "a0"]
+
+
+def test_pages_reuse_one_connection(messages_db):
+    conn = _connect(messages_db)
+
+    list_messages_page(chat_jid=CHAT, limit=2)
+    list_messages_page(chat_jid=CHAT, limit=2)
+
+    assert _connect(messages_db) is conn
+    assert conn.execute("SELECT 1").fetchone() == (1,)
+
+
+def test_pragmas_applied_once_per_connection(messages_db, monkeypatch):
+    calls = []
+    monkeypatch.setattr("whatsapp.apply_sqlite_pragmas", calls.append)
+
+    list_messages_page(chat_jid=CHAT, limit=2)
+    list_messages_page(chat_jid=CHAT, limit=2)
+
+    assert len(calls) == 1
+
+
+def test_include_context_orders_timestamp_ties_by_id(messages_db):
+    conn = sqlite3.connect(messages_db)
+    ts = datetime(2024, 1, 1, 12, 2, 0).isoformat()
+    conn.executemany(
+        "INSERT INTO messages (id, chat_jid, sender, content, timestamp, is_from_me) VALUES (?, ?, ?, ?, ?, ?)",
+        [("a2a", CHAT, CHAT, "same time", ts, 0), ("a2b", CHAT, CHAT, "same time", ts, 0)],
+    )
+    conn.commit()
+    conn.close()
+
+    messages = list_messages(chat_jid=CHAT, query="needle", include_context=True, context_before=1, context_after=2)
+
+    assert [m["id"] for m in messages] == ["a1", "a2", "a2a", "a2b"]
+
+
+def test_malformed_cursor_returns_error_page(messages_db):
+    page = list_messages_page(chat_jid=CHAT, limit=2, cursor="no-separator")
+
+    assert page["items"] == []
+    assert page["has_more"] is False
+    assert page["next_cursor"] is None
+    assert "Invalid pagination cursor" in page["error"]
+
+
+def test_list_messages_raises_on_malformed_cursor(messages_db):
+    with pytest.raises(InvalidCursorError, match="Invalid pagination cursor"):
+        list_messages(chat_jid=CHAT, limit=2, cursor="no-separator")
+
+
+def test_invalid_date_is_not_reported_as_cursor_error(messages_db):
+    with pytest.raises(ValueError, match="Invalid date format for 'after'") as excinfo:
+        list_messages_page(chat_jid=CHAT, after="not-a-date")
+    assert not isinstance(excinfo.value, InvalidCursorError)
+
+    with pytest.raises(ValueError, match="Invalid date format for 'before'"):
+        list_messages(chat_jid=CHAT, before="not-a-date")
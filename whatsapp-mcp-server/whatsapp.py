@@ -1,7 +1,10 @@
+import asyncio
 import json
 import os
 import os.path
 import sqlite3
+import threading
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -28,8 +31,9 @@ except ImportError:
     pass  # python-dotenv not available, continue without it
 
 import audio
-from lib.bridge import _get_headers
-from lib.utils import MESSAGES_DB_PATH, WHATSAPP_DB_PATH
+from lib.bridge import _SESSION, _cached_group, _store_group, invalidate_group
+from lib.database import _normalize_nickname_jids
+from lib.utils import MESSAGES_DB_PATH, WHATSAPP_DB_PATH, apply_sqlite_pragmas, normalize_jid
 
 
 # Use environment variable for bridge host, default to localhost:8080 for development
@@ -40,6 +44,88 @@ if ":" not in _bridge_host:
 BRIDGE_HOST = _bridge_host
 WHATSAPP_API_BASE_URL = f"http://{BRIDGE_HOST}/api"
 
+# One long-lived connection per thread and path, so the statement cache below
+# actually keeps hot queries compiled across calls. Callers must not close it.
+_local = threading.local()
+_open_conns: list[sqlite3.Connection] = []
+_open_conns_lock = threading.Lock()
+_conn_generation = 0
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    """Return this thread's cached connection to ``path``, opening it on first use."""
+    if getattr(_local, "generation", None) != _conn_generation:
+        _local.conns = {}
+        _local.generation = _conn_generation
+    conn = _local.conns.get(path)
+    if conn is None:
+        # check_same_thread=False only so _reset_conns can close it from another thread
+        conn = sqlite3.connect(path, check_same_thread=False, cached_statements=512)
+        apply_sqlite_pragmas(conn)
+        _local.conns[path] = conn
+        with _open_conns_lock:
+            _open_conns.append(conn)
+    return conn
+
+
+def _reset_conns() -> None:
+    """Close every cached connection; threads reopen on their next call."""
+    global _conn_generation
+    with _open_conns_lock:
+        _conn_generation += 1
+        for conn in _open_conns:
+            conn.close()
+        _open_conns.clear()
+
+
+# Hot-path SQL kept as module constants so every call passes the identical string
+# and hits the connection's statement cache. Dynamic parts use "?" placeholders.
+_LIST_MESSAGES_SELECT = """
+    SELECT messages.timestamp, messages.sender, chats.name, messages.content, messages.is_from_me, chats.jid,
+           messages.id, messages.media_type, messages.filename, messages.file_length
+    FROM messages
+    JOIN chats ON messages.chat_jid = chats.jid
+"""
+
+_LIST_CHATS_SELECT = "SELECT chats.jid, chats.name, chats.last_message_time FROM chats"
+
+_CHAT_ROW_SQL = "SELECT jid, name, last_message_time FROM chats WHERE jid = ?"
+
+_LAST_INTERACTION_SQL = """
+    SELECT
+        m.timestamp,
+        m.sender,
+        c.name,
+        m.content,
+        m.is_from_me,
+        c.jid,
+        m.id,
+        m.media_type,
+        m.filename,
+        m.file_length
+    FROM messages m
+    JOIN chats c ON m.chat_jid = c.jid
+    WHERE m.sender = ? OR c.jid = ?
+    ORDER BY m.timestamp DESC
+    LIMIT 1
+"""
+
+_CONTACT_BY_JID_SQL = """
+    SELECT their_jid, first_name, full_name, push_name, business_name
+    FROM whatsmeow_contacts
+    WHERE their_jid = ?
+    LIMIT 1
+"""
+
+_CHAT_CONTACT_BY_JID_SQL = """
+    SELECT jid, name
+    FROM chats
+    WHERE jid = ? AND jid NOT LIKE '%@g.us'
+    LIMIT 1
+"""
+
+_CONTACT_NICKNAME_SQL = "SELECT nickname FROM contact_nicknames WHERE jid = ?"
+
 
 @dataclass
 class Message:
@@ -143,7 +229,7 @@ def get_sender_name(sender_jid: str) -> str:
             return nickname
 
         # Try to get rich contact information from WhatsApp store
-        whatsapp_conn = sqlite3.connect(WHATSAPP_DB_PATH)
+        whatsapp_conn = _connect(WHATSAPP_DB_PATH)
         whatsapp_cursor = whatsapp_conn.cursor()
 
         # Look for contact in WhatsApp contacts
@@ -158,7 +244,6 @@ def get_sender_name(sender_jid: str) -> str:
         )
 
         contact_result = whatsapp_cursor.fetchone()
-        whatsapp_conn.close()
 
         if contact_result:
             first_name, full_name, push_name, business_name = contact_result
@@ -166,7 +251,7 @@ def get_sender_name(sender_jid: str) -> str:
             return full_name or push_name or first_name or business_name or sender_jid
 
         # Fall back to chat database
-        messages_conn = sqlite3.connect(MESSAGES_DB_PATH)
+        messages_conn = _connect(MESSAGES_DB_PATH)
         messages_cursor = messages_conn.cursor()
 
         # First try matching by exact JID
@@ -210,9 +295,6 @@ def get_sender_name(sender_jid: str) -> str:
     except sqlite3.Error as e:
         print(f"Database error while getting sender name: {e}")
         return sender_jid
-    finally:
-        if "messages_conn" in locals():
-            messages_conn.close()
 
 
 def format_message(message: Message, show_chat_info: bool = True) -> None:
@@ -237,17 +319,114 @@ def format_message(message: Message, show_chat_info: bool = True) -> None:
 
 
 def format_messages_list(messages: list[Message], show_chat_info: bool = True) -> None:
-    output = ""
     if not messages:
-        output += "No messages to display."
-        return output
+        return "No messages to display."
 
-    for message in messages:
-        output += format_message(message, show_chat_info)
-    return output
+    return "".join(format_message(message, show_chat_info) for message in messages)
 
 
-def list_messages(
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor was not produced by a *_page function."""
+
+
+def _split_cursor(cursor: str, parts: int) -> list[str]:
+    """Split an opaque pagination cursor into its sort-key parts.
+
+    Cursors are "|"-joined sort keys ending in the row's unique ID. Splitting
+    from the right keeps any "|" inside a leading chat name intact.
+    """
+    values = cursor.rsplit("|", parts - 1)
+    if len(values) != parts:
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor}")
+    return values
+
+
+# One window per match: the hit plus up to ?1 earlier and ?2 later messages
+# from its chat, each side read off idx_messages_chat_timestamp with ORDER BY
+# ... LIMIT so the cost is the window size, not the chat size. {jid}/{id} are
+# the numbers of the match's parameters, {ord} its position. Ties on timestamp
+# fall back to id, the same order the chat is listed in.
+_CONTEXT_HIT_TS = "(SELECT timestamp FROM messages WHERE id = ?{id} AND chat_jid = ?{jid})"
+
+_CONTEXT_WINDOW_SQL = f"""
+    SELECT * FROM (
+        SELECT messages.timestamp, messages.sender, chats.name, messages.content, messages.is_from_me, chats.jid,
+               messages.id, messages.media_type, messages.filename, messages.file_length, {{ord}} AS ord
+        FROM messages
+        JOIN chats ON messages.chat_jid = chats.jid
+        WHERE messages.chat_jid = ?{{jid}}
+          AND messages.timestamp <= {_CONTEXT_HIT_TS}
+          AND (messages.timestamp < {_CONTEXT_HIT_TS} OR messages.id < ?{{id}})
+        ORDER BY messages.timestamp DESC, messages.id DESC
+        LIMIT ?1
+    )
+    UNION ALL
+    SELECT messages.timestamp, messages.sender, chats.name, messages.content, messages.is_from_me, chats.jid,
+           messages.id, messages.media_type, messages.filename, messages.file_length, {{ord}}
+    FROM messages
+    JOIN chats ON messages.chat_jid = chats.jid
+    WHERE messages.id = ?{{id}} AND messages.chat_jid = ?{{jid}}
+    UNION ALL
+    SELECT * FROM (
+        SELECT messages.timestamp, messages.sender, chats.name, messages.content, messages.is_from_me, chats.jid,
+               messages.id, messages.media_type, messages.filename, messages.file_length, {{ord}}
+        FROM messages
+        JOIN chats ON messages.chat_jid = chats.jid
+        WHERE messages.chat_jid = ?{{jid}}
+          AND messages.timestamp >= {_CONTEXT_HIT_TS}
+          AND (messages.timestamp > {_CONTEXT_HIT_TS} OR messages.id > ?{{id}})
+        ORDER BY messages.timestamp, messages.id
+        LIMIT ?2
+    )
+"""
+
+# Three compound terms per match; stays under SQLite's default limit of 500.
+_CONTEXT_MATCHES_PER_QUERY = 100
+
+
+def _expand_context(
+    cur: sqlite3.Cursor, matches: list[Message], context_before: int, context_after: int
+) -> list[dict[str, Any]]:
+    """Surround each matched message with its neighbours.
+
+    Matches keep their original order; each one is followed by its window in
+    chronological order, and messages shared between windows appear once.
+    """
+    rows: list[tuple[Any, ...]] = []
+    for start in range(0, len(matches), _CONTEXT_MATCHES_PER_QUERY):
+        chunk = matches[start : start + _CONTEXT_MATCHES_PER_QUERY]
+        windows = []
+        params: list[Any] = [context_before, context_after]
+        for ord_, msg in enumerate(chunk):
+            windows.append(_CONTEXT_WINDOW_SQL.format(ord=ord_, jid=len(params) + 1, id=len(params) + 2))
+            params.extend([msg.chat_jid, msg.id])
+        cur.execute(" UNION ALL ".join(windows) + " ORDER BY ord, timestamp, id", tuple(params))
+        rows.extend(cur.fetchall())
+
+    messages_with_context = []
+    seen_ids = set()
+    for row in rows:
+        if row[6] in seen_ids:
+            continue
+        seen_ids.add(row[6])
+        messages_with_context.append(
+            Message(
+                timestamp=datetime.fromisoformat(row[0]),
+                sender=row[1],
+                chat_name=row[2],
+                content=row[3],
+                is_from_me=row[4],
+                chat_jid=row[5],
+                id=row[6],
+                media_type=row[7],
+                filename=row[8],
+                file_length=row[9],
+            ).to_dict()
+        )
+    return messages_with_context
+
+
+def list_messages_page(
     after: str | None = None,
     before: str | None = None,
     sender_phone_number: str | None = None,
@@ -258,22 +437,31 @@ def list_messages(
     include_context: bool = False,
     context_before: int = 1,
     context_after: int = 1,
-) -> list[dict[str, Any]]:
-    """Get messages matching the specified criteria with optional context.
+    cursor: str | None = None,
+    include_total: bool = False,
+) -> dict[str, Any]:
+    """Get one page of messages matching the specified criteria.
+
+    When ``cursor`` is given, the page starts right after the message it points
+    at (keyset pagination) and ``page`` is ignored. Offset pagination via
+    ``page`` makes SQLite read and discard every earlier row, so it gets slower
+    the deeper you page.
 
-    Returns a list of message dictionaries with structured data.
+    ``has_more`` comes from fetching one extra row rather than counting; the
+    COUNT(*) for ``total`` only runs when ``include_total`` is set.
+
+    Returns a dict with ``items`` (message dicts), ``has_more``,
+    ``next_cursor`` (None on the last page) and, if requested, ``total``. A
+    malformed ``cursor`` yields an empty page with an ``error`` message.
     """
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
-        cursor = conn.cursor()
+        conn = _connect(MESSAGES_DB_PATH)
+        cur = conn.cursor()
 
         # Build base query - include filename and file_length for media metadata
-        query_parts = [
-            "SELECT messages.timestamp, messages.sender, chats.name, messages.content, messages.is_from_me, chats.jid, messages.id, messages.media_type, messages.filename, messages.file_length FROM messages"
-        ]
-        query_parts.append("JOIN chats ON messages.chat_jid = chats.jid")
+        query_parts = [_LIST_MESSAGES_SELECT]
         where_clauses = []
-        params = []
+        params: list[Any] = []
 
         # Add filters
         if after:
@@ -304,17 +492,35 @@ def list_messages(
             where_clauses.append("LOWER(messages.content) LIKE LOWER(?)")
             params.append(f"%{query}%")
 
+        total = None
+        if include_total:
+            where_sql = ("WHERE " + " AND ".join(where_clauses)) if where_clauses else ""
+            cur.execute(
+                f"SELECT COUNT(*) FROM messages JOIN chats ON messages.chat_jid = chats.jid {where_sql}", tuple(params)
+            )
+            total = cur.fetchone()[0]
+
+        if cursor:
+            cursor_ts, cursor_id = _split_cursor(cursor, 2)
+            where_clauses.append("(messages.timestamp < ? OR (messages.timestamp = ? AND messages.id < ?))")
+            params.extend([cursor_ts, cursor_ts, cursor_id])
+
         if where_clauses:
             query_parts.append("WHERE " + " AND ".join(where_clauses))
 
-        # Add pagination
-        offset = page * limit
-        query_parts.append("ORDER BY messages.timestamp DESC")
+        # Add pagination - fetch one extra row to learn whether another page exists
+        offset = 0 if cursor else page * limit
+        query_parts.append("ORDER BY messages.timestamp DESC, messages.id DESC")
         query_parts.append("LIMIT ? OFFSET ?")
-        params.extend([limit, offset])
+        params.extend([limit + 1, offset])
 
-        cursor.execute(" ".join(query_parts), tuple(params))
-        messages = cursor.fetchall()
+        cur.execute(" ".join(query_parts), tuple(params))
+        messages = cur.fetchall()
+        has_more = len(messages) > limit
+        messages = messages[:limit]
+
+        # Raw timestamp string so the next page compares against the stored value
+        next_cursor = f"{messages[-1][0]}|{messages[-1][6]}" if has_more and messages else None
 
         result = []
         for msg in messages:
@@ -333,39 +539,63 @@ def list_messages(
             result.append(message)
 
         if include_context and result:
-            # Add context for each message
-            messages_with_context = []
-            seen_ids = set()
-            for msg in result:
-                context = get_message_context(msg.id, context_before, context_after)
-                for ctx_msg in context.before:
-                    if ctx_msg.id not in seen_ids:
-                        messages_with_context.append(ctx_msg.to_dict())
-                        seen_ids.add(ctx_msg.id)
-                if context.message.id not in seen_ids:
-                    messages_with_context.append(context.message.to_dict())
-                    seen_ids.add(context.message.id)
-                for ctx_msg in context.after:
-                    if ctx_msg.id not in seen_ids:
-                        messages_with_context.append(ctx_msg.to_dict())
-                        seen_ids.add(ctx_msg.id)
-            return messages_with_context
-
-        # Return messages as list of dicts
-        return [msg.to_dict() for msg in result]
+            items = _expand_context(cur, result, context_before, context_after)
+        else:
+            items = [msg.to_dict() for msg in result]
+
+        response: dict[str, Any] = {"items": items, "has_more": has_more, "next_cursor": next_cursor}
+        if include_total:
+            response["total"] = total
+        return response
 
+    except InvalidCursorError as e:
+        return {"items": [], "has_more": False, "next_cursor": None, "error": str(e)}
     except sqlite3.Error as e:
         print(f"Database error: {e}")
-        return []
-    finally:
-        if "conn" in locals():
-            conn.close()
+        return {"items": [], "has_more": False, "next_cursor": None}
+
+
+def list_messages(
+    after: str | None = None,
+    before: str | None = None,
+    sender_phone_number: str | None = None,
+    chat_jid: str | None = None,
+    query: str | None = None,
+    limit: int = 20,
+    page: int = 0,
+    include_context: bool = False,
+    context_before: int = 1,
+    context_after: int = 1,
+    cursor: str | None = None,
+) -> list[dict[str, Any]]:
+    """Get messages matching the specified criteria with optional context.
+
+    Returns a list of message dictionaries with structured data. See
+    list_messages_page for cursor semantics; a malformed cursor raises
+    InvalidCursorError.
+    """
+    page_result = list_messages_page(
+        after=after,
+        before=before,
+        sender_phone_number=sender_phone_number,
+        chat_jid=chat_jid,
+        query=query,
+        limit=limit,
+        page=page,
+        include_context=include_context,
+        context_before=context_before,
+        context_after=context_after,
+        cursor=cursor,
+    )
+    if "error" in page_result:
+        raise InvalidCursorError(page_result["error"])
+    return page_result["items"]
 
 
 def get_message_context(message_id: str, before: int = 5, after: int = 5) -> MessageContext:
     """Get context around a specific message."""
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
+        conn = _connect(MESSAGES_DB_PATH)
         cursor = conn.cursor()
 
         # Get the target message first
@@ -461,69 +691,73 @@ def get_message_context(message_id: str, before: int = 5, after: int = 5) -> Mes
     except sqlite3.Error as e:
         print(f"Database error: {e}")
         raise
-    finally:
-        if "conn" in locals():
-            conn.close()
 
 
-def list_chats(
+def _select_chats(
+    cur: sqlite3.Cursor, where_clauses: list[str], params: list[Any], order_by: str, limit: int, offset: int
+) -> list[tuple[Any, ...]]:
+    """Run _LIST_CHATS_SELECT with the given filters, order and window."""
+    query_parts = [_LIST_CHATS_SELECT]
+    if where_clauses:
+        query_parts.append("WHERE " + " AND ".join(where_clauses))
+    query_parts.append(f"ORDER BY {order_by} LIMIT ? OFFSET ?")
+    cur.execute(" ".join(query_parts), (*params, limit, offset))
+    return cur.fetchall()
+
+
+def _fetch_last_messages(cur: sqlite3.Cursor, jids: list[str]) -> dict[str, tuple[Any, ...]]:
+    """Load the latest message for each chat in one query.
+
+    Each chat resolves its newest row through an index seek instead of ranking
+    every message in the database.
+
+    Returns:
+        Mapping of chat JID to (content, id, sender, is_from_me)
+    """
+    if not jids:
+        return {}
+    placeholders = ", ".join("?" for _ in jids)
+    cur.execute(
+        f"""
+        SELECT c.jid, m.content, m.id, m.sender, m.is_from_me
+        FROM chats c
+        JOIN messages m ON m.rowid = (
+            SELECT rowid FROM messages
+            WHERE chat_jid = c.jid
+            ORDER BY timestamp DESC, id DESC
+            LIMIT 1
+        )
+        WHERE c.jid IN ({placeholders})
+        """,
+        tuple(jids),
+    )
+    return {row[0]: row[1:] for row in cur.fetchall()}
+
+
+def list_chats_page(
     query: str | None = None,
     limit: int = 20,
     page: int = 0,
     include_last_message: bool = True,
     sort_by: str = "last_active",
-) -> list[Chat]:
-    """Get chats matching the specified criteria."""
-    print(f"Debug: Database path: {MESSAGES_DB_PATH}")
-    print(f"Debug: Database exists: {os.path.exists(MESSAGES_DB_PATH)}")
+    cursor: str | None = None,
+    include_total: bool = False,
+) -> dict[str, Any]:
+    """Get one page of chats matching the specified criteria.
 
-    try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
-        cursor = conn.cursor()
+    When ``cursor`` is given, the page starts right after the chat it points at
+    (keyset pagination) and ``page`` is ignored. The COUNT(*) for ``total`` only
+    runs when ``include_total`` is set.
 
-        # Debug: Check if tables exist
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = cursor.fetchall()
-        print(f"Debug: Available tables: {tables}")
-
-        # Debug: Check row counts
-        try:
-            cursor.execute("SELECT COUNT(*) FROM chats")
-            chat_count = cursor.fetchone()[0]
-            print(f"Debug: Total chats in database: {chat_count}")
-        except Exception as e:
-            print(f"Debug: Error counting chats: {e}")
-
-        # Build base query.
-        # Always join the latest message per chat to avoid SELECT/JOIN drift when
-        # include_last_message=False (regression in issue #39).
-        query_parts = [
-            """
-            SELECT
-                chats.jid,
-                chats.name,
-                chats.last_message_time,
-                lm.content as last_message,
-                lm.id as last_message_id,
-                lm.sender as last_sender,
-                lm.is_from_me as last_is_from_me
-            FROM chats
-            LEFT JOIN (
-                SELECT
-                    chat_jid,
-                    content,
-                    id,
-                    sender,
-                    is_from_me,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY chat_jid
-                        ORDER BY timestamp DESC, id DESC
-                    ) as rn
-                FROM messages
-            ) lm ON chats.jid = lm.chat_jid AND lm.rn = 1
-            """
-        ]
+    Returns a dict with ``items`` (chat dicts), ``has_more``, ``next_cursor``
+    (None on the last page) and, if requested, ``total``. A malformed ``cursor``
+    yields an empty page with an ``error`` message.
+    """
+    try:
+        conn = _connect(MESSAGES_DB_PATH)
+        cur = conn.cursor()
 
+        # Page through chats first; last messages for the page are batch-loaded below
         where_clauses = []
         params = []
 
@@ -531,54 +765,119 @@ def list_chats(
             where_clauses.append("(LOWER(chats.name) LIKE LOWER(?) OR chats.jid LIKE ?)")
             params.extend([f"%{query}%", f"%{query}%"])
 
-        if where_clauses:
-            query_parts.append("WHERE " + " AND ".join(where_clauses))
-
-        # Add sorting
-        order_by = "chats.last_message_time DESC" if sort_by == "last_active" else "chats.name"
-        query_parts.append(f"ORDER BY {order_by}")
+        total = None
+        if include_total:
+            where_sql = ("WHERE " + " AND ".join(where_clauses)) if where_clauses else ""
+            cur.execute(f"SELECT COUNT(*) FROM chats {where_sql}", tuple(params))
+            total = cur.fetchone()[0]
+
+        # Sort key plus JID tiebreak so cursors are stable. last_active orders
+        # on the bare column so idx_chats_last_message_time can serve it; chats
+        # without a last_message_time sort last (SQLite puts NULLs last in
+        # DESC) and their cursors carry an empty key.
+        filter_clauses, filter_params = list(where_clauses), list(params)
+        null_tail = False
+        if sort_by == "last_active":
+            order_by = "chats.last_message_time DESC, chats.jid DESC"
+            if cursor:
+                cursor_key, cursor_jid = _split_cursor(cursor, 2)
+                if cursor_key:
+                    where_clauses.append(
+                        "chats.last_message_time <= ? AND (chats.last_message_time < ? OR chats.jid < ?)"
+                    )
+                    params.extend([cursor_key, cursor_key, cursor_jid])
+                    # A range on the column skips NULLs, so those are read separately below
+                    null_tail = True
+                else:
+                    where_clauses.append("chats.last_message_time IS NULL AND chats.jid < ?")
+                    params.append(cursor_jid)
+        else:
+            sort_key = "COALESCE(chats.name, '')"
+            order_by = f"{sort_key}, chats.jid"
+            if cursor:
+                cursor_key, cursor_jid = _split_cursor(cursor, 2)
+                where_clauses.append(f"({sort_key} > ? OR ({sort_key} = ? AND chats.jid > ?))")
+                params.extend([cursor_key, cursor_key, cursor_jid])
+
+        # Add pagination - fetch one extra row to learn whether another page exists
+        offset = 0 if cursor else page * limit
+        chats = _select_chats(cur, where_clauses, params, order_by, limit + 1, offset)
+        if null_tail and len(chats) <= limit:
+            chats += _select_chats(
+                cur,
+                [*filter_clauses, "chats.last_message_time IS NULL"],
+                filter_params,
+                "chats.jid DESC",
+                limit + 1 - len(chats),
+                0,
+            )
+        has_more = len(chats) > limit
+        chats = chats[:limit]
 
-        # Add pagination
-        offset = (page) * limit
-        query_parts.append("LIMIT ? OFFSET ?")
-        params.extend([limit, offset])
+        next_cursor = None
+        if has_more and chats:
+            last = chats[-1]
+            last_key = last[2] if sort_by == "last_active" else last[1]
+            next_cursor = f"{last_key or ''}|{last[0]}"
 
-        cursor.execute(" ".join(query_parts), tuple(params))
-        chats = cursor.fetchall()
+        last_messages = _fetch_last_messages(cur, [chat_data[0] for chat_data in chats]) if include_last_message else {}
 
         result = []
         for chat_data in chats:
-            last_message = chat_data[3] if include_last_message else None
-            last_message_id = chat_data[4] if include_last_message else None
-            last_sender = chat_data[5] if include_last_message else None
-            last_is_from_me = chat_data[6] if include_last_message else None
-
+            last = last_messages.get(chat_data[0])
             chat = Chat(
                 jid=chat_data[0],
                 name=chat_data[1],
                 last_message_time=datetime.fromisoformat(chat_data[2]) if chat_data[2] else None,
-                last_message=last_message,
-                last_message_id=last_message_id,
-                last_sender=last_sender,
-                last_is_from_me=last_is_from_me,
+                last_message=last[0] if last else None,
+                last_message_id=last[1] if last else None,
+                last_sender=last[2] if last else None,
+                last_is_from_me=last[3] if last else None,
             )
             result.append(chat.to_dict())
 
-        return result
+        response: dict[str, Any] = {"items": result, "has_more": has_more, "next_cursor": next_cursor}
+        if include_total:
+            response["total"] = total
+        return response
 
+    except InvalidCursorError as e:
+        return {"items": [], "has_more": False, "next_cursor": None, "error": str(e)}
     except sqlite3.Error as e:
         print(f"Database error: {e}")
-        return []
-    finally:
-        if "conn" in locals():
-            conn.close()
+        return {"items": [], "has_more": False, "next_cursor": None}
+
+
+def list_chats(
+    query: str | None = None,
+    limit: int = 20,
+    page: int = 0,
+    include_last_message: bool = True,
+    sort_by: str = "last_active",
+    cursor: str | None = None,
+) -> list[dict[str, Any]]:
+    """Get chats matching the specified criteria.
+
+    A malformed cursor raises InvalidCursorError.
+    """
+    page_result = list_chats_page(
+        query=query,
+        limit=limit,
+        page=page,
+        include_last_message=include_last_message,
+        sort_by=sort_by,
+        cursor=cursor,
+    )
+    if "error" in page_result:
+        raise InvalidCursorError(page_result["error"])
+    return page_result["items"]
 
 
 def search_contacts(query: str) -> list[dict[str, Any]]:
     """Search contacts by name or phone number using both WhatsApp contacts and chat data."""
     try:
         # Connect to both databases
-        whatsapp_conn = sqlite3.connect(WHATSAPP_DB_PATH)
+        whatsapp_conn = _connect(WHATSAPP_DB_PATH)
         whatsapp_cursor = whatsapp_conn.cursor()
 
         # Split query into characters to support partial matching
@@ -639,25 +938,43 @@ def search_contacts(query: str) -> list[dict[str, Any]]:
     except sqlite3.Error as e:
         print(f"Database error: {e}")
         return []
-    finally:
-        if "whatsapp_conn" in locals():
-            whatsapp_conn.close()
 
 
-def get_contact_chats(jid: str, limit: int = 20, page: int = 0) -> list[dict[str, Any]]:
-    """Get all chats involving the contact.
+def get_contact_chats_page(jid: str, limit: int = 20, page: int = 0, cursor: str | None = None) -> dict[str, Any]:
+    """Get one page of chats involving the contact.
 
     Args:
         jid: The contact's JID to search for
         limit: Maximum number of chats to return (default 20)
-        page: Page number for pagination (default 0)
+        page: Page number for offset pagination, ignored when cursor is set (default 0)
+        cursor: Opaque cursor from a previous page's next_cursor (keyset pagination)
+
+    Returns:
+        Dict with items (chat dicts), has_more and next_cursor (None on the last page),
+        plus error when the cursor is malformed
     """
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
-        cursor = conn.cursor()
+        conn = _connect(MESSAGES_DB_PATH)
+        cur = conn.cursor()
+
+        where = "(m.sender = ? OR c.jid = ?)"
+        params: list[Any] = [jid, jid]
+        if cursor:
+            # Chats without a last_message_time sort last and carry an empty key
+            cursor_time, cursor_jid, cursor_id = _split_cursor(cursor, 3)
+            if cursor_time:
+                where += (
+                    " AND (c.last_message_time < ? OR c.last_message_time IS NULL"
+                    " OR (c.last_message_time = ? AND (c.jid < ? OR (c.jid = ? AND m.id < ?))))"
+                )
+                params.extend([cursor_time, cursor_time, cursor_jid, cursor_jid, cursor_id])
+            else:
+                where += " AND c.last_message_time IS NULL AND (c.jid < ? OR (c.jid = ? AND m.id < ?))"
+                params.extend([cursor_jid, cursor_jid, cursor_id])
+        params.extend([limit + 1, 0 if cursor else page * limit])
 
-        cursor.execute(
-            """
+        cur.execute(
+            f"""
             SELECT DISTINCT
                 c.jid,
                 c.name,
@@ -668,14 +985,21 @@ def get_contact_chats(jid: str, limit: int = 20, page: int = 0) -> list[dict[str
                 m.is_from_me as last_is_from_me
             FROM chats c
             JOIN messages m ON c.jid = m.chat_jid
-            WHERE m.sender = ? OR c.jid = ?
-            ORDER BY c.last_message_time DESC
+            WHERE {where}
+            ORDER BY c.last_message_time DESC, c.jid DESC, m.id DESC
             LIMIT ? OFFSET ?
         """,
-            (jid, jid, limit, page * limit),
+            tuple(params),
         )
 
-        chats = cursor.fetchall()
+        chats = cur.fetchall()
+        has_more = len(chats) > limit
+        chats = chats[:limit]
+
+        next_cursor = None
+        if has_more and chats:
+            last = chats[-1]
+            next_cursor = f"{last[2] or ''}|{last[0]}|{last[4]}"
 
         result = []
         for chat_data in chats:
@@ -690,43 +1014,40 @@ def get_contact_chats(jid: str, limit: int = 20, page: int = 0) -> list[dict[str
             )
             result.append(chat.to_dict())
 
-        return result
+        return {"items": result, "has_more": has_more, "next_cursor": next_cursor}
 
+    except InvalidCursorError as e:
+        return {"items": [], "has_more": False, "next_cursor": None, "error": str(e)}
     except sqlite3.Error as e:
         print(f"Database error: {e}")
-        return []
-    finally:
-        if "conn" in locals():
-            conn.close()
+        return {"items": [], "has_more": False, "next_cursor": None}
+
+
+def get_contact_chats(jid: str, limit: int = 20, page: int = 0, cursor: str | None = None) -> list[dict[str, Any]]:
+    """Get all chats involving the contact.
+
+    Args:
+        jid: The contact's JID to search for
+        limit: Maximum number of chats to return (default 20)
+        page: Page number for pagination (default 0)
+        cursor: Opaque cursor from get_contact_chats_page (optional)
+
+    Raises:
+        InvalidCursorError: If ``cursor`` is malformed
+    """
+    page_result = get_contact_chats_page(jid, limit, page, cursor)
+    if "error" in page_result:
+        raise InvalidCursorError(page_result["error"])
+    return page_result["items"]
 
 
 def get_last_interaction(jid: str) -> dict[str, Any] | None:
     """Get most recent message involving the contact."""
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
+        conn = _connect(MESSAGES_DB_PATH)
         cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            SELECT
-                m.timestamp,
-                m.sender,
-                c.name,
-                m.content,
-                m.is_from_me,
-                c.jid,
-                m.id,
-                m.media_type,
-                m.filename,
-                m.file_length
-            FROM messages m
-            JOIN chats c ON m.chat_jid = c.jid
-            WHERE m.sender = ? OR c.jid = ?
-            ORDER BY m.timestamp DESC
-            LIMIT 1
-        """,
-            (jid, jid),
-        )
+        cursor.execute(_LAST_INTERACTION_SQL, (jid, jid))
 
         msg_data = cursor.fetchone()
 
@@ -751,74 +1072,68 @@ def get_last_interaction(jid: str) -> dict[str, Any] | None:
     except sqlite3.Error as e:
         print(f"Database error: {e}")
         return None
-    finally:
-        if "conn" in locals():
-            conn.close()
 
 
-def get_chat(chat_jid: str, include_last_message: bool = True) -> dict[str, Any] | None:
-    """Get chat metadata by JID."""
+def _get_chat_row(chat_jid: str) -> tuple[Any, ...] | None:
+    """Fetch (jid, name, last_message_time) for a chat."""
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
+        conn = _connect(MESSAGES_DB_PATH)
         cursor = conn.cursor()
+        cursor.execute(_CHAT_ROW_SQL, (chat_jid,))
+        return cursor.fetchone()
+    except sqlite3.Error as e:
+        print(f"Database error: {e}")
+        return None
 
-        query = """
-            SELECT
-                c.jid,
-                c.name,
-                c.last_message_time,
-                lm.content as last_message,
-                lm.sender as last_sender,
-                lm.is_from_me as last_is_from_me
-            FROM chats c
-            LEFT JOIN (
-                SELECT
-                    chat_jid,
-                    content,
-                    sender,
-                    is_from_me,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY chat_jid
-                        ORDER BY timestamp DESC, id DESC
-                    ) as rn
-                FROM messages
-            ) lm ON c.jid = lm.chat_jid AND lm.rn = 1
-        """
-
-        query += " WHERE c.jid = ?"
-
-        cursor.execute(query, (chat_jid,))
-        chat_data = cursor.fetchone()
-
-        if not chat_data:
-            return None
-
-        last_message = chat_data[3] if include_last_message else None
-        last_sender = chat_data[4] if include_last_message else None
-        last_is_from_me = chat_data[5] if include_last_message else None
-
-        chat = Chat(
-            jid=chat_data[0],
-            name=chat_data[1],
-            last_message_time=datetime.fromisoformat(chat_data[2]) if chat_data[2] else None,
-            last_message=last_message,
-            last_sender=last_sender,
-            last_is_from_me=last_is_from_me,
-        )
-        return chat.to_dict()
 
+def _get_last_message_row(chat_jid: str) -> tuple[Any, ...] | None:
+    """Fetch (content, id, sender, is_from_me) of a chat's latest message."""
+    try:
+        conn = _connect(MESSAGES_DB_PATH)
+        return _fetch_last_messages(conn.cursor(), [chat_jid]).get(chat_jid)
     except sqlite3.Error as e:
         print(f"Database error: {e}")
         return None
-    finally:
-        if "conn" in locals():
-            conn.close()
+
+
+def _build_chat(chat_data: tuple[Any, ...] | None, last: tuple[Any, ...] | None) -> dict[str, Any] | None:
+    """Combine a chat row and its last-message row into a chat dict."""
+    if not chat_data:
+        return None
+    chat = Chat(
+        jid=chat_data[0],
+        name=chat_data[1],
+        last_message_time=datetime.fromisoformat(chat_data[2]) if chat_data[2] else None,
+        last_message=last[0] if last else None,
+        last_message_id=last[1] if last else None,
+        last_sender=last[2] if last else None,
+        last_is_from_me=last[3] if last else None,
+    )
+    return chat.to_dict()
+
+
+def get_chat(chat_jid: str, include_last_message: bool = True) -> dict[str, Any] | None:
+    """Get chat metadata by JID."""
+    chat_data = _get_chat_row(chat_jid)
+    last = _get_last_message_row(chat_jid) if chat_data and include_last_message else None
+    return _build_chat(chat_data, last)
+
+
+async def get_chat_async(chat_jid: str, include_last_message: bool = True) -> dict[str, Any] | None:
+    """Get chat metadata by JID, running the metadata and last-message queries concurrently."""
+    if not include_last_message:
+        return _build_chat(await asyncio.to_thread(_get_chat_row, chat_jid), None)
+    chat_data, last = await asyncio.gather(
+        asyncio.to_thread(_get_chat_row, chat_jid),
+        asyncio.to_thread(_get_last_message_row, chat_jid),
+    )
+    return _build_chat(chat_data, last)
 
 
 def get_direct_chat_by_contact(sender_phone_number: str) -> dict[str, Any] | None:
     """Get chat metadata by sender phone number."""
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
+        conn = _connect(MESSAGES_DB_PATH)
         cursor = conn.cursor()
 
         cursor.execute(
@@ -857,9 +1172,6 @@ def get_direct_chat_by_contact(sender_phone_number: str) -> dict[str, Any] | Non
     except sqlite3.Error as e:
         print(f"Database error: {e}")
         return None
-    finally:
-        if "conn" in locals():
-            conn.close()
 
 
 def send_message(recipient: str, message: str, mentioned_jids: list[str] | None = None) -> dict[str, Any]:
@@ -883,7 +1195,7 @@ def send_message(recipient: str, message: str, mentioned_jids: list[str] | None
         if mentioned_jids:
             payload["mentioned_jids"] = mentioned_jids
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         # Check if the request was successful
         if response.status_code == 200:
@@ -922,7 +1234,7 @@ def send_file(recipient: str, media_path: str) -> dict[str, Any]:
         url = f"{WHATSAPP_API_BASE_URL}/send"
         payload = {"recipient": recipient, "media_path": media_path}
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         # Check if the request was successful
         if response.status_code == 200:
@@ -970,7 +1282,7 @@ def send_audio_message(recipient: str, media_path: str) -> dict[str, Any]:
         url = f"{WHATSAPP_API_BASE_URL}/send"
         payload = {"recipient": recipient, "media_path": media_path}
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         # Check if the request was successful
         if response.status_code == 200:
@@ -1007,7 +1319,7 @@ def download_media(message_id: str, chat_jid: str) -> str | None:
         url = f"{WHATSAPP_API_BASE_URL}/download"
         payload = {"message_id": message_id, "chat_jid": chat_jid}
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             result = response.json()
@@ -1037,21 +1349,12 @@ def get_contact_by_jid(jid: str) -> Contact | None:
     """Get detailed contact information by JID."""
     try:
         # First try WhatsApp contacts database
-        whatsapp_conn = sqlite3.connect(WHATSAPP_DB_PATH)
+        whatsapp_conn = _connect(WHATSAPP_DB_PATH)
         whatsapp_cursor = whatsapp_conn.cursor()
 
-        whatsapp_cursor.execute(
-            """
-            SELECT their_jid, first_name, full_name, push_name, business_name
-            FROM whatsmeow_contacts
-            WHERE their_jid = ?
-            LIMIT 1
-        """,
-            (jid,),
-        )
+        whatsapp_cursor.execute(_CONTACT_BY_JID_SQL, (jid,))
 
         contact_data = whatsapp_cursor.fetchone()
-        whatsapp_conn.close()
 
         # Get custom nickname
         nickname = get_contact_nickname(jid)
@@ -1074,21 +1377,12 @@ def get_contact_by_jid(jid: str) -> Contact | None:
             )
 
         # Fall back to chats database
-        messages_conn = sqlite3.connect(MESSAGES_DB_PATH)
+        messages_conn = _connect(MESSAGES_DB_PATH)
         messages_cursor = messages_conn.cursor()
 
-        messages_cursor.execute(
-            """
-            SELECT jid, name
-            FROM chats
-            WHERE jid = ? AND jid NOT LIKE '%@g.us'
-            LIMIT 1
-        """,
-            (jid,),
-        )
+        messages_cursor.execute(_CHAT_CONTACT_BY_JID_SQL, (jid,))
 
         chat_data = messages_cursor.fetchone()
-        messages_conn.close()
 
         if chat_data:
             phone_number = chat_data[0].split("@")[0] if "@" in chat_data[0] else chat_data[0]
@@ -1115,7 +1409,7 @@ def get_contact_by_phone(phone_number: str) -> Contact | None:
                 return contact
 
         # Try partial matching in chats
-        messages_conn = sqlite3.connect(MESSAGES_DB_PATH)
+        messages_conn = _connect(MESSAGES_DB_PATH)
         messages_cursor = messages_conn.cursor()
 
         messages_cursor.execute(
@@ -1129,7 +1423,6 @@ def get_contact_by_phone(phone_number: str) -> Contact | None:
         )
 
         chat_data = messages_cursor.fetchone()
-        messages_conn.close()
 
         if chat_data:
             actual_phone = chat_data[0].split("@")[0] if "@" in chat_data[0] else chat_data[0]
@@ -1142,13 +1435,14 @@ def get_contact_by_phone(phone_number: str) -> Contact | None:
         return None
 
 
-def list_all_contacts(limit: int = 100) -> list[Contact]:
-    """Get all contacts with their detailed information."""
-    try:
-        contacts = []
+def iter_all_contacts(limit: int = 100) -> Iterator[Contact]:
+    """Yield contacts one at a time straight from the SQLite cursor.
 
-        # Get contacts from WhatsApp store
-        whatsapp_conn = sqlite3.connect(WHATSAPP_DB_PATH)
+    Rows are read lazily instead of via fetchall(), so callers that encode or
+    render each contact as it arrives hold at most one row in memory.
+    """
+    try:
+        whatsapp_conn = _connect(WHATSAPP_DB_PATH)
         whatsapp_cursor = whatsapp_conn.cursor()
 
         whatsapp_cursor.execute(
@@ -1168,10 +1462,7 @@ def list_all_contacts(limit: int = 100) -> list[Contact]:
             (limit,),
         )
 
-        whatsapp_contacts = whatsapp_cursor.fetchall()
-        whatsapp_conn.close()
-
-        for contact_data in whatsapp_contacts:
+        for contact_data in whatsapp_cursor:
             jid = contact_data[0]
             phone_number = jid.split("@")[0] if "@" in jid else jid
 
@@ -1182,7 +1473,7 @@ def list_all_contacts(limit: int = 100) -> list[Contact]:
 
             display_name = full_name or push_name or first_name or business_name or phone_number
 
-            contact = Contact(
+            yield Contact(
                 phone_number=phone_number,
                 name=display_name,
                 jid=jid,
@@ -1191,36 +1482,37 @@ def list_all_contacts(limit: int = 100) -> list[Contact]:
                 push_name=push_name,
                 business_name=business_name,
             )
-            contacts.append(contact)
-
-        return contacts
 
     except sqlite3.Error as e:
         print(f"Database error: {e}")
-        return []
+
+
+def list_all_contacts(limit: int = 100) -> list[Contact]:
+    """Get all contacts with their detailed information."""
+    return list(iter_all_contacts(limit))
 
 
 def format_contact_info(contact: Contact) -> str:
     """Format contact information for display."""
-    output = f"📱 {contact.name} ({contact.phone_number})\n"
-    output += f"   JID: {contact.jid}\n"
+    lines = [f"📱 {contact.name} ({contact.phone_number})", f"   JID: {contact.jid}"]
 
     if contact.full_name and contact.full_name != contact.name:
-        output += f"   Full Name: {contact.full_name}\n"
+        lines.append(f"   Full Name: {contact.full_name}")
 
     if contact.first_name and contact.first_name != contact.name:
-        output += f"   First Name: {contact.first_name}\n"
+        lines.append(f"   First Name: {contact.first_name}")
 
     if contact.push_name and contact.push_name != contact.name:
-        output += f"   Display Name: {contact.push_name}\n"
+        lines.append(f"   Display Name: {contact.push_name}")
 
     if contact.business_name:
-        output += f"   Business: {contact.business_name}\n"
+        lines.append(f"   Business: {contact.business_name}")
 
     if contact.nickname:
-        output += f"   Nickname: {contact.nickname}\n"
+        lines.append(f"   Nickname: {contact.nickname}")
 
-    return output
+    lines.append("")
+    return "\n".join(lines)
 
 
 def set_contact_nickname(jid: str, nickname: str) -> dict[str, Any]:
@@ -1229,8 +1521,10 @@ def set_contact_nickname(jid: str, nickname: str) -> dict[str, Any]:
     Returns:
         Structured dict with success, jid, nickname, updated_at
     """
+    jid = normalize_jid(jid)
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
+        conn = _connect(MESSAGES_DB_PATH)
+        _normalize_nickname_jids(conn, MESSAGES_DB_PATH)
         cursor = conn.cursor()
 
         # Insert or update nickname
@@ -1252,26 +1546,21 @@ def set_contact_nickname(jid: str, nickname: str) -> dict[str, Any]:
         return {"success": True, "jid": jid, "nickname": nickname, "updated_at": updated_at}
 
     except sqlite3.Error as e:
-        return {"success": False, "jid": jid, "error": str(e)}
-    finally:
+        # The connection is reused, so don't leave a failed write transaction open
         if "conn" in locals():
-            conn.close()
+            conn.rollback()
+        return {"success": False, "jid": jid, "error": str(e)}
 
 
 def get_contact_nickname(jid: str) -> str | None:
     """Get a contact's custom nickname."""
+    jid = normalize_jid(jid)
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
+        conn = _connect(MESSAGES_DB_PATH)
+        _normalize_nickname_jids(conn, MESSAGES_DB_PATH)
         cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            SELECT nickname
-            FROM contact_nicknames
-            WHERE jid = ?
-        """,
-            (jid,),
-        )
+        cursor.execute(_CONTACT_NICKNAME_SQL, (jid,))
 
         result = cursor.fetchone()
         return result[0] if result else None
@@ -1279,9 +1568,6 @@ def get_contact_nickname(jid: str) -> str | None:
     except sqlite3.Error as e:
         print(f"Database error: {e}")
         return None
-    finally:
-        if "conn" in locals():
-            conn.close()
 
 
 def remove_contact_nickname(jid: str) -> dict[str, Any]:
@@ -1290,8 +1576,10 @@ def remove_contact_nickname(jid: str) -> dict[str, Any]:
     Returns:
         Structured dict with success, jid
     """
+    jid = normalize_jid(jid)
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
+        conn = _connect(MESSAGES_DB_PATH)
+        _normalize_nickname_jids(conn, MESSAGES_DB_PATH)
         cursor = conn.cursor()
 
         cursor.execute("DELETE FROM contact_nicknames WHERE jid = ?", (jid,))
@@ -1300,13 +1588,13 @@ def remove_contact_nickname(jid: str) -> dict[str, Any]:
             conn.commit()
             return {"success": True, "jid": jid}
         else:
+            conn.rollback()
             return {"success": False, "jid": jid, "error": "No nickname found"}
 
     except sqlite3.Error as e:
-        return {"success": False, "jid": jid, "error": str(e)}
-    finally:
         if "conn" in locals():
-            conn.close()
+            conn.rollback()
+        return {"success": False, "jid": jid, "error": str(e)}
 
 
 def list_contact_nicknames() -> list[dict[str, Any]]:
@@ -1316,7 +1604,8 @@ def list_contact_nicknames() -> list[dict[str, Any]]:
         List of dicts with jid, nickname, created_at, updated_at
     """
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
+        conn = _connect(MESSAGES_DB_PATH)
+        _normalize_nickname_jids(conn, MESSAGES_DB_PATH)
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -1332,9 +1621,6 @@ def list_contact_nicknames() -> list[dict[str, Any]]:
     except sqlite3.Error as e:
         print(f"Database error: {e}")
         return []
-    finally:
-        if "conn" in locals():
-            conn.close()
 
 
 # Phase 1 Features: Reactions, Edit, Delete, Group Info, Mark Read
@@ -1355,7 +1641,7 @@ def send_reaction(chat_jid: str, message_id: str, emoji: str) -> dict[str, Any]:
         url = f"{WHATSAPP_API_BASE_URL}/reaction"
         payload = {"chat_jid": chat_jid, "message_id": message_id, "emoji": emoji}
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             result = response.json()
@@ -1408,7 +1694,7 @@ def edit_message(chat_jid: str, message_id: str, new_content: str) -> dict[str,
         url = f"{WHATSAPP_API_BASE_URL}/edit"
         payload = {"chat_jid": chat_jid, "message_id": message_id, "new_content": new_content}
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             result = response.json()
@@ -1462,7 +1748,7 @@ def delete_message(chat_jid: str, message_id: str, sender_jid: str | None = None
         if sender_jid:
             payload["sender_jid"] = sender_jid
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             result = response.json()
@@ -1508,52 +1794,59 @@ def get_group_info(group_jid: str) -> dict[str, Any]:
         Structured dict with success, group_jid, name, topic, participants, error
     """
     try:
-        url = f"{WHATSAPP_API_BASE_URL}/group/{group_jid}"
+        result = _cached_group(group_jid)
+        if result is None:
+            url = f"{WHATSAPP_API_BASE_URL}/group/{group_jid}"
 
-        response = requests.get(url, headers=_get_headers(), timeout=30)
+            response = _SESSION.get(url, timeout=30)
 
-        if response.status_code == 200:
-            result = response.json()
-            if result.get("success", False):
-                data = result.get("data", {})
-                # Enrich participants with names from contacts
-                participants = data.get("participants", [])
-                enriched_participants = []
-                for p in participants:
-                    jid = p.get("jid", "")
-                    phone = jid.split("@")[0] if "@" in jid else jid
-                    # Try to get contact name
-                    contact_name = None
-                    try:
-                        contacts = search_contacts(phone)
-                        if contacts:
-                            contact_name = (
-                                contacts[0].get("name") or contacts[0].get("full_name") or contacts[0].get("push_name")
-                            )
-                    except Exception:
-                        pass
-                    enriched_participants.append(
-                        {
-                            "jid": jid,
-                            "name": contact_name,
-                            "is_admin": p.get("is_admin", False),
-                            "is_super_admin": p.get("is_super_admin", False),
-                        }
-                    )
+            if response.status_code != 200:
                 return {
-                    "success": True,
+                    "success": False,
                     "group_jid": group_jid,
-                    "name": data.get("name"),
-                    "topic": data.get("topic"),
-                    "created_at": data.get("created_at"),
-                    "created_by": data.get("created_by"),
-                    "participant_count": len(enriched_participants),
-                    "participants": enriched_participants,
+                    "error": f"HTTP {response.status_code} - {response.text}",
                 }
-            else:
-                return {"success": False, "group_jid": group_jid, "error": result.get("message", "Unknown error")}
+            result = response.json()
+            _store_group(group_jid, result)
+
+        if result.get("success", False):
+            data = result.get("data", {})
+            # Enrich participants with names from contacts
+            participants = data.get("participants", [])
+            enriched_participants = []
+            for p in participants:
+                jid = p.get("jid", "")
+                phone = jid.split("@")[0] if "@" in jid else jid
+                # Try to get contact name
+                contact_name = None
+                try:
+                    contacts = search_contacts(phone)
+                    if contacts:
+                        contact_name = (
+                            contacts[0].get("name") or contacts[0].get("full_name") or contacts[0].get("push_name")
+                        )
+                except Exception:
+                    pass
+                enriched_participants.append(
+                    {
+                        "jid": jid,
+                        "name": contact_name,
+                        "is_admin": p.get("is_admin", False),
+                        "is_super_admin": p.get("is_super_admin", False),
+                    }
+                )
+            return {
+                "success": True,
+                "group_jid": group_jid,
+                "name": data.get("name"),
+                "topic": data.get("topic"),
+                "created_at": data.get("created_at"),
+                "created_by": data.get("created_by"),
+                "participant_count": len(enriched_participants),
+                "participants": enriched_participants,
+            }
         else:
-            return {"success": False, "group_jid": group_jid, "error": f"HTTP {response.status_code} - {response.text}"}
+            return {"success": False, "group_jid": group_jid, "error": result.get("message", "Unknown error")}
 
     except requests.RequestException as e:
         return {"success": False, "group_jid": group_jid, "error": f"Request error: {str(e)}"}
@@ -1580,7 +1873,7 @@ def mark_messages_read(chat_jid: str, message_ids: list[str], sender_jid: str |
         if sender_jid:
             payload["sender_jid"] = sender_jid
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             result = response.json()
@@ -1634,7 +1927,7 @@ def create_group(name: str, participants: list[str]) -> dict[str, Any]:
         url = f"{WHATSAPP_API_BASE_URL}/group/create"
         payload = {"name": name, "participants": participants}
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             result = response.json()
@@ -1665,10 +1958,11 @@ def add_group_members(group_jid: str, participants: list[str]) -> dict[str, Any]
         url = f"{WHATSAPP_API_BASE_URL}/group/add-members"
         payload = {"group_jid": group_jid, "participants": participants}
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             result = response.json()
+            invalidate_group(group_jid)
             return {
                 "success": result.get("success", False),
                 "group_jid": group_jid,
@@ -1696,10 +1990,11 @@ def remove_group_members(group_jid: str, participants: list[str]) -> dict[str, A
         url = f"{WHATSAPP_API_BASE_URL}/group/remove-members"
         payload = {"group_jid": group_jid, "participants": participants}
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             result = response.json()
+            invalidate_group(group_jid)
             return {
                 "success": result.get("success", False),
                 "group_jid": group_jid,
@@ -1727,10 +2022,11 @@ def promote_to_admin(group_jid: str, participant: str) -> dict[str, Any]:
         url = f"{WHATSAPP_API_BASE_URL}/group/promote"
         payload = {"group_jid": group_jid, "participant": participant}
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             result = response.json()
+            invalidate_group(group_jid)
             return {
                 "success": result.get("success", False),
                 "group_jid": group_jid,
@@ -1769,10 +2065,11 @@ def demote_admin(group_jid: str, participant: str) -> dict[str, Any]:
         url = f"{WHATSAPP_API_BASE_URL}/group/demote"
         payload = {"group_jid": group_jid, "participant": participant}
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             result = response.json()
+            invalidate_group(group_jid)
             return {
                 "success": result.get("success", False),
                 "group_jid": group_jid,
@@ -1810,10 +2107,11 @@ def leave_group(group_jid: str) -> dict[str, Any]:
         url = f"{WHATSAPP_API_BASE_URL}/group/leave"
         payload = {"group_jid": group_jid}
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             result = response.json()
+            invalidate_group(group_jid)
             return {
                 "success": result.get("success", False),
                 "group_jid": group_jid,
@@ -1846,10 +2144,11 @@ def update_group(group_jid: str, name: str | None = None, topic: str | None = No
         if topic:
             payload["topic"] = topic
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             result = response.json()
+            invalidate_group(group_jid)
             return {
                 "success": result.get("success", False),
                 "group_jid": group_jid,
@@ -1891,7 +2190,7 @@ def create_poll(chat_jid: str, question: str, options: list[str], multi_select:
             "multi_select": multi_select,
         }
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             result = response.json()
@@ -1946,7 +2245,7 @@ def request_chat_history(
             "count": count,
         }
 
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             result = response.json()
@@ -1979,7 +2278,7 @@ def set_presence(presence: str) -> dict[str, Any]:
     try:
         url = f"{WHATSAPP_API_BASE_URL}/presence/set"
         payload = {"presence": presence}
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             return response.json()
@@ -2003,7 +2302,7 @@ def subscribe_presence(jid: str) -> dict[str, Any]:
     try:
         url = f"{WHATSAPP_API_BASE_URL}/presence/subscribe"
         payload = {"jid": jid}
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             return response.json()
@@ -2028,7 +2327,7 @@ def get_profile_picture(jid: str, preview: bool = False) -> dict[str, Any]:
         params = {"jid": jid}
         if preview:
             params["preview"] = "true"
-        response = requests.get(url, params=params, headers=_get_headers(), timeout=30)
+        response = _SESSION.get(url, params=params, timeout=30)
 
         if response.status_code == 200:
             return response.json()
@@ -2046,7 +2345,7 @@ def get_blocklist() -> dict[str, Any]:
     """
     try:
         url = f"{WHATSAPP_API_BASE_URL}/blocklist"
-        response = requests.get(url, headers=_get_headers(), timeout=30)
+        response = _SESSION.get(url, timeout=30)
 
         if response.status_code == 200:
             return response.json()
@@ -2069,7 +2368,7 @@ def update_blocklist(jid: str, action: str) -> dict[str, Any]:
     try:
         url = f"{WHATSAPP_API_BASE_URL}/blocklist/update"
         payload = {"jid": jid, "action": action}
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             return response.json()
@@ -2091,7 +2390,7 @@ def follow_newsletter(jid: str) -> dict[str, Any]:
     try:
         url = f"{WHATSAPP_API_BASE_URL}/newsletter/follow"
         payload = {"jid": jid}
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             return response.json()
@@ -2113,7 +2412,7 @@ def unfollow_newsletter(jid: str) -> dict[str, Any]:
     try:
         url = f"{WHATSAPP_API_BASE_URL}/newsletter/unfollow"
         payload = {"jid": jid}
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             return response.json()
@@ -2138,7 +2437,7 @@ def create_newsletter(name: str, description: str = "") -> dict[str, Any]:
         payload = {"name": name}
         if description:
             payload["description"] = description
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             return response.json()
@@ -2170,7 +2469,7 @@ def send_typing(chat_jid: str, state: str = "typing") -> dict[str, Any]:
 
         url = f"{WHATSAPP_API_BASE_URL}/typing"
         payload = {"chat_jid": chat_jid, "state": state}
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             return response.json()
@@ -2195,7 +2494,7 @@ def set_about_text(text: str) -> dict[str, Any]:
     try:
         url = f"{WHATSAPP_API_BASE_URL}/set-about"
         payload = {"text": text}
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             return response.json()
@@ -2225,7 +2524,7 @@ def set_disappearing_timer(chat_jid: str, duration: str) -> dict[str, Any]:
 
         url = f"{WHATSAPP_API_BASE_URL}/disappearing"
         payload = {"chat_jid": chat_jid, "duration": duration}
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             return response.json()
@@ -2268,7 +2567,7 @@ def get_privacy_settings() -> dict[str, Any]:
     """
     try:
         url = f"{WHATSAPP_API_BASE_URL}/privacy"
-        response = requests.get(url, headers=_get_headers(), timeout=30)
+        response = _SESSION.get(url, timeout=30)
 
         if response.status_code == 200:
             return response.json()
@@ -2293,7 +2592,7 @@ def pin_chat(chat_jid: str, pin: bool = True) -> dict[str, Any]:
     try:
         url = f"{WHATSAPP_API_BASE_URL}/pin"
         payload = {"chat_jid": chat_jid, "pin": pin}
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             return response.json()
@@ -2323,7 +2622,7 @@ def mute_chat(chat_jid: str, mute: bool = True, duration: str = "forever") -> di
 
         url = f"{WHATSAPP_API_BASE_URL}/mute"
         payload = {"chat_jid": chat_jid, "mute": mute, "duration": duration}
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             return response.json()
@@ -2349,7 +2648,7 @@ def archive_chat(chat_jid: str, archive: bool = True) -> dict[str, Any]:
     try:
         url = f"{WHATSAPP_API_BASE_URL}/archive"
         payload = {"chat_jid": chat_jid, "archive": archive}
-        response = requests.post(url, json=payload, headers=_get_headers(), timeout=30)
+        response = _SESSION.post(url, json=payload, timeout=30)
 
         if response.status_code == 200:
             return response.json()